@@ -0,0 +1,45 @@
+"""
+Application Module: Cooperative cancellation of long checks
+"""
+
+import threading
+from typing import Optional
+
+
+class CheckCancelledError(Exception):
+    """
+    Raised inside a check whose CancellationToken was cancelled.
+
+    'axioms_skipped' is how many axioms were abandoned or never
+    started, when the use case that stopped knows it.
+    """
+
+    def __init__(self, *args: object, axioms_skipped: Optional[int] = None):
+        super().__init__(*args or ("Check cancelled.",))
+        self.axioms_skipped = axioms_skipped
+
+
+class CancellationToken:
+    """
+    A flag shared between whoever may give up on a check (e.g. an HTTP
+    endpoint whose client disconnected) and the code running it.
+
+    Cancelling is thread-safe and only requests a stop: checkers poll
+    the token between sample chunks and raise CheckCancelledError, so
+    a check ends within one chunk of being cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raises CheckCancelledError if the token was cancelled."""
+        if self._event.is_set():
+            raise CheckCancelledError()
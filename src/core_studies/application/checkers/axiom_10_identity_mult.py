@@ -2,47 +2,64 @@
 Application Module: Checker for Axiom 10 (Multiplicative Identity)
 """
 
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Any, List, Optional, Sequence, Tuple
 from core_studies.domain.entities.Element import AlgebraicElement
 from core_studies.domain.entities.VectorSpace import VectorSpace
 from core_studies.domain.errors.exceptions import AxiomFailedError
-from ..ports.axiom_checker import IAxiomCheckerPort as ICheckerPort
+from core_studies.domain.ports.Operations import Scalar
+from .base import SampledAxiomChecker
 
 ET = TypeVar('ET', bound=AlgebraicElement)
-NUM_SAMPLES = 3
 
-class CheckIdentityMult(Generic[ET], ICheckerPort[ET]):
+class CheckIdentityMult(Generic[ET], SampledAxiomChecker[ET]):
     """
     Implements verification for Axiom 10:
     Multiplicative Identity (1 * u = u).
     """
 
+    depends_on = ("scalar_multiplication", "element_provider")
+
     @property
     def axiom_name(self) -> str:
         return "A10: Multiplicative Identity"
 
-    def check(self, space: VectorSpace[ET]) -> None:
+    def _evaluate(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> List[Tuple[ET, Optional[ET]]]:
         """
-        Checks that 1 * u == u for several sample elements.
+        Computes 1 * u, which must equal u.
         """
+        u, = elements
+        scalar = 1
+
         try:
-            elements = space.element_provider.get_elements(NUM_SAMPLES)
+            les = space.scalar_multiplication.execute(scalar, u)
         except Exception as e:
-            raise AxiomFailedError(f"Failed to obtain sample elements: {e}")
-
-        for u in elements:
-            scalar = 1
+            raise AxiomFailedError(
+                f"Operation failed while calculating {scalar} * {u}. Error: {e}"
+            )
 
-            try:
-                les = space.scalar_multiplication.execute(scalar, u)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"Operation failed while calculating {scalar} * {u}. Error: {e}"
-                )
+        return [(les, u)]
 
-            if les != u:
-                raise AxiomFailedError(
-                    f"Failure: {scalar} * {u} resulted in '{les}', but it should be the element itself '{u}'."
-                )
+    def _check_sample(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        """
+        Checks that 1 * u == u for one sample element.
+        """
+        u, = elements
+        scalar = 1
+        (les, _), = self._evaluate(space, context, elements, scalars)
 
-        return None
+        if les != u:
+            raise AxiomFailedError(
+                f"Failure: {scalar} * {u} resulted in '{les}', but it should be the element itself '{u}'."
+            )
@@ -1,47 +1,62 @@
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Any, List, Optional, Sequence, Tuple
 from core_studies.domain.entities.Element import AlgebraicElement
 from core_studies.domain.entities.VectorSpace import VectorSpace
 from core_studies.domain.errors.exceptions import AxiomFailedError
-from ..ports.axiom_checker import IAxiomCheckerPort
+from core_studies.domain.ports.Operations import Scalar
+from .base import SampledAxiomChecker
 
 ET = TypeVar('ET', bound=AlgebraicElement)
-NUM_SAMPLES = 3 
 
 
-class CheckClosureAddition(Generic[ET], IAxiomCheckerPort[ET]):
+class CheckClosureAddition(Generic[ET], SampledAxiomChecker[ET]):
     """
     Implements the check for Axiom 1:
     Closure under addition (u + v belongs to V).
     """
 
+    element_arity = 2
+    depends_on = ("addition", "validator", "element_provider")
+
     @property
     def axiom_name(self) -> str:
         return "A1: Closure under Addition"
 
-    def check(self, space: VectorSpace[ET]) -> None:
+    def _evaluate(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> List[Tuple[ET, Optional[ET]]]:
         """
-        Checks whether the sum of two sample elements
-        still belongs to the set, using the space's validator.
+        Computes u + v, which must belong to the set.
         """
+        u, v = elements
+
         try:
-            samples = space.element_provider.get_elements(NUM_SAMPLES * 2)
+            result = space.addition.execute(u, v)
         except Exception as e:
-            raise AxiomFailedError(f"Failed to obtain sample elements: {e}")
-
-        for i in range(NUM_SAMPLES):
-            u = samples[i]
-            v = samples[i + NUM_SAMPLES]
-
-            try:
-                result = space.addition.execute(u, v)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"Addition operation failed for {u} + {v}. Error: {e}"
-                )
-
-            if not space.validator.validate(result):
-                raise AxiomFailedError(
-                    f"Result '{result}' of '{u} + {v}' does not belong to the set."
-                )
-        
-        return None
+            raise AxiomFailedError(
+                f"Addition operation failed for {u} + {v}. Error: {e}"
+            )
+
+        return [(result, None)]
+
+    def _check_sample(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        """
+        Checks whether the sum of two sample elements
+        still belongs to the set, using the space's validator.
+        """
+        u, v = elements
+        (result, _), = self._evaluate(space, context, elements, scalars)
+
+        if not space.validator.validate(result):
+            raise AxiomFailedError(
+                f"Result '{result}' of '{u} + {v}' does not belong to the set."
+            )
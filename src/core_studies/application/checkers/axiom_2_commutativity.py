@@ -1,54 +1,69 @@
-from typing import TypeVar, Generic 
+from typing import TypeVar, Generic, Any, List, Optional, Sequence, Tuple
 from core_studies.domain.entities.Element import AlgebraicElement
 from core_studies.domain.entities.VectorSpace import VectorSpace
 from core_studies.domain.errors.exceptions import AxiomFailedError
-from ..ports.axiom_checker import IAxiomCheckerPort
+from core_studies.domain.ports.Operations import Scalar
+from .base import SampledAxiomChecker
 
 ET = TypeVar('ET', bound=AlgebraicElement)
-NUM_SAMPLES = 3
 
 
-class CheckCommutativity(Generic[ET], IAxiomCheckerPort[ET]):
+class CheckCommutativity(Generic[ET], SampledAxiomChecker[ET]):
     """
     Implements the check for Axiom 2:
     Commutativity of Addition (u + v = v + u).
     """
 
+    element_arity = 2
+    depends_on = ("addition", "element_provider")
+
     @property
     def axiom_name(self) -> str:
         return "A2: Commutativity of Addition"
 
-    def check(self, space: VectorSpace[ET]) -> None:
+    def _evaluate(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> List[Tuple[ET, Optional[ET]]]:
         """
-        Verifies that u + v == v + u for several sample pairs.
+        Computes both sides: u + v and v + u.
         """
+        u, v = elements
+
+        try:
+            les = space.addition.execute(u, v)
+        except Exception as e:
+            raise AxiomFailedError(
+                f"The addition operation failed for {u} + {v}. Error: {e}"
+            )
+
         try:
-            samples = space.element_provider.get_elements(NUM_SAMPLES * 2)
+            lde = space.addition.execute(v, u)
         except Exception as e:
-            raise AxiomFailedError(f"Failed to obtain sample elements: {e}")
-
-        for i in range(NUM_SAMPLES):
-            u = samples[i]
-            v = samples[i + NUM_SAMPLES]
-
-            try:
-                les = space.addition.execute(u, v)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"The addition operation failed for {u} + {v}. Error: {e}"
-                )
-
-            try:
-                lde = space.addition.execute(v, u)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"The addition operation failed for {v} + {u}. Error: {e}"
-                )
-
-            if les != lde:
-                raise AxiomFailedError(
-                    f"Failure: {u} + {v} resulted in '{les}', "
-                    f"but {v} + {u} resulted in '{lde}'."
-                )
-        
-        return None
\ No newline at end of file
+            raise AxiomFailedError(
+                f"The addition operation failed for {v} + {u}. Error: {e}"
+            )
+
+        return [(les, lde)]
+
+    def _check_sample(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        """
+        Verifies that u + v == v + u for one sample pair.
+        """
+        u, v = elements
+        (les, lde), = self._evaluate(space, context, elements, scalars)
+
+        if les != lde:
+            raise AxiomFailedError(
+                f"Failure: {u} + {v} resulted in '{les}', "
+                f"but {v} + {u} resulted in '{lde}'."
+            )
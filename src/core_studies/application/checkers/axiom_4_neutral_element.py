@@ -1,29 +1,30 @@
-from typing import TypeVar, Generic 
+from typing import TypeVar, Generic, Any, List, Optional, Sequence, Tuple
 from core_studies.domain.entities.Element import AlgebraicElement
 from core_studies.domain.entities.VectorSpace import VectorSpace
 from core_studies.domain.errors.exceptions import AxiomFailedError
-from ..ports.axiom_checker import IAxiomCheckerPort
+from core_studies.domain.ports.Operations import Scalar
+from .base import SampledAxiomChecker
 
 ET = TypeVar('ET', bound=AlgebraicElement)
-NUM_SAMPLES = 3 
 
 
-class CheckNeutralElement(Generic[ET], IAxiomCheckerPort[ET]):
+class CheckNeutralElement(Generic[ET], SampledAxiomChecker[ET]):
     """
     Implementa a verificação para o Axioma 4:
     Existência de um Elemento Neutro (u + 0 = u).
     """
 
+    depends_on = ("addition", "zero_element_provider", "validator", "element_provider")
+
     @property
     def axiom_name(self) -> str:
         return "A4: Existência de Elemento Neutro"
 
-    def check(self, space: VectorSpace[ET]) -> None:
+    def _prepare(self, space: VectorSpace[ET]) -> ET:
         """
-        Verifica se o elemento neutro (zero) fornecido pelo
-        provedor do espaço realmente satisfaz u + 0 = u e 0 + u = u.
+        Obtém o elemento neutro (zero) do provedor do espaço
+        e verifica se ele pertence ao conjunto.
         """
-        
         try:
             zero = space.zero_element_provider.get()
         except Exception as e:
@@ -35,36 +36,60 @@ class CheckNeutralElement(Generic[ET], IAxiomCheckerPort[ET]):
                 f"não pertence ao conjunto (validador falhou)."
             )
 
+        return zero
+
+    def _evaluate(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> List[Tuple[ET, Optional[ET]]]:
+        """
+        Calcula u + 0 e 0 + u, que devem ser iguais a u.
+        """
+        zero = context
+        u, = elements
+
+        try:
+            u_plus_zero = space.addition.execute(u, zero)
+        except Exception as e:
+            raise AxiomFailedError(
+                f"A operação falhou ao calcular {u} + {zero}. Erro: {e}"
+            )
+
         try:
-            samples = space.element_provider.get_elements(NUM_SAMPLES)
+            zero_plus_u = space.addition.execute(zero, u)
         except Exception as e:
-            raise AxiomFailedError(f"Falha ao obter elementos de amostra: {e}")
+            raise AxiomFailedError(
+                f"A operação falhou ao calcular {zero} + {u}. Erro: {e}"
+            )
 
-        for u in samples:
-            try:
-                u_plus_zero = space.addition.execute(u, zero)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"A operação falhou ao calcular {u} + {zero}. Erro: {e}"
-                )
-            
-            if u_plus_zero != u:
-                raise AxiomFailedError(
-                    f"Falha na regra u + 0 = u. "
-                    f"'{u} + {zero}' resultou em '{u_plus_zero}', mas deveria ser '{u}'."
-                )
+        return [(u_plus_zero, u), (zero_plus_u, u)]
 
-            try:
-                zero_plus_u = space.addition.execute(zero, u)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"A operação falhou ao calcular {zero} + {u}. Erro: {e}"
-                )
-            
-            if zero_plus_u != u:
-                raise AxiomFailedError(
-                    f"Falha na regra 0 + u = u. "
-                    f"'{zero} + {u}' resultou em '{zero_plus_u}', mas deveria ser '{u}'."
-                )
+    def _check_sample(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        """
+        Verifica se o elemento neutro (zero) fornecido pelo
+        provedor do espaço realmente satisfaz u + 0 = u e 0 + u = u.
+        """
+        zero = context
+        u, = elements
+        (u_plus_zero, _), (zero_plus_u, _) = self._evaluate(space, context, elements, scalars)
+        
+        if u_plus_zero != u:
+            raise AxiomFailedError(
+                f"Falha na regra u + 0 = u. "
+                f"'{u} + {zero}' resultou em '{u_plus_zero}', mas deveria ser '{u}'."
+            )
         
-        return None
\ No newline at end of file
+        if zero_plus_u != u:
+            raise AxiomFailedError(
+                f"Falha na regra 0 + u = u. "
+                f"'{zero} + {u}' resultou em '{zero_plus_u}', mas deveria ser '{u}'."
+            )
@@ -1,78 +1,109 @@
-from typing import TypeVar, Generic 
-from core_studies.application.ports.axiom_checker import IAxiomCheckerPort
+from typing import TypeVar, Generic, Any, List, Optional, Sequence, Tuple
 from core_studies.domain.entities.Element import AlgebraicElement
 from core_studies.domain.entities.VectorSpace import VectorSpace
 from core_studies.domain.errors.exceptions import AxiomFailedError
+from core_studies.domain.ports.Operations import Scalar
+from .base import SampledAxiomChecker
 
 ET = TypeVar('ET', bound=AlgebraicElement)
-NUM_SAMPLES = 3 
 
 
-class CheckAdditiveInverse(Generic[ET], IAxiomCheckerPort[ET]):
+class CheckAdditiveInverse(Generic[ET], SampledAxiomChecker[ET]):
     """
     Implements the check for Axiom 5:
     Existence of an Additive Inverse (u + (-u) = 0).
     """
 
+    depends_on = (
+        "addition",
+        "zero_element_provider",
+        "additive_inverse_provider",
+        "validator",
+        "element_provider",
+    )
+
     @property
     def axiom_name(self) -> str:
         return "A5: Existence of Additive Inverse"
 
-    def check(self, space: VectorSpace[ET]) -> None:
+    def _prepare(self, space: VectorSpace[ET]) -> ET:
         """
-        Checks that, for each sample element 'u',
-        its inverse '-u' provided by the provider
-        satisfies u + (-u) = 0.
+        Obtains the zero element the inverses are compared against.
         """
-        
         try:
-            zero = space.zero_element_provider.get()
+            return space.zero_element_provider.get()
         except Exception as e:
             raise AxiomFailedError(f"Failed to obtain zero element (dependency Axiom 4): {e}")
 
+    def _evaluate(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> List[Tuple[ET, Optional[ET]]]:
+        """
+        Computes -u (which must belong to the set), u + (-u) and
+        (-u) + u (which must both equal the zero element).
+        """
+        zero = context
+        u, = elements
+
         try:
-            samples = space.element_provider.get_elements(NUM_SAMPLES)
+            inv_u = space.additive_inverse_provider.get_inverse_of(u)
         except Exception as e:
-            raise AxiomFailedError(f"Failed to obtain sample elements: {e}")
+            raise AxiomFailedError(
+                f"Failed to obtain inverse of '{u}'. Error: {e}"
+            )
 
-        for u in samples:
-            try:
-                inv_u = space.additive_inverse_provider.get_inverse_of(u)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"Failed to obtain inverse of '{u}'. Error: {e}"
-                )
+        try:
+            u_plus_inv_u = space.addition.execute(u, inv_u)
+        except Exception as e:
+            raise AxiomFailedError(
+                f"Operation failed when computing {u} + {inv_u}. Error: {e}"
+            )
 
-            if not space.validator.validate(inv_u):
-                raise AxiomFailedError(
-                    f"The provided inverse '{inv_u}' for element '{u}' "
-                    f"does not belong to the set (validator failed)."
-                )
+        try:
+            inv_u_plus_u = space.addition.execute(inv_u, u)
+        except Exception as e:
+            raise AxiomFailedError(
+                f"Operation failed when computing {inv_u} + {u}. Error: {e}"
+            )
 
-            try:
-                u_plus_inv_u = space.addition.execute(u, inv_u)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"Operation failed when computing {u} + {inv_u}. Error: {e}"
-                )
-            
-            if u_plus_inv_u != zero:
-                raise AxiomFailedError(
-                    f"Rule u + (-u) = 0 failed. "
-                    f"'{u} + {inv_u}' resulted in '{u_plus_inv_u}', but should be the zero '{zero}'."
-                )
+        return [(inv_u, None), (u_plus_inv_u, zero), (inv_u_plus_u, zero)]
+
+    def _check_sample(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        """
+        Checks that, for the sample element 'u',
+        its inverse '-u' provided by the provider
+        satisfies u + (-u) = 0.
+        """
+        zero = context
+        u, = elements
+        (inv_u, _), (u_plus_inv_u, _), (inv_u_plus_u, _) = self._evaluate(
+            space, context, elements, scalars
+        )
 
-            try:
-                inv_u_plus_u = space.addition.execute(inv_u, u)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"Operation failed when computing {inv_u} + {u}. Error: {e}"
-                )
-            
-            if inv_u_plus_u != zero:
-                raise AxiomFailedError(
-                    f"Rule (-u) + u = 0 failed. "
-                    f"'{inv_u} + {u}' resulted in '{inv_u_plus_u}', but should be the zero '{zero}'."
-                )
+        if not space.validator.validate(inv_u):
+            raise AxiomFailedError(
+                f"The provided inverse '{inv_u}' for element '{u}' "
+                f"does not belong to the set (validator failed)."
+            )
+        
+        if u_plus_inv_u != zero:
+            raise AxiomFailedError(
+                f"Rule u + (-u) = 0 failed. "
+                f"'{u} + {inv_u}' resulted in '{u_plus_inv_u}', but should be the zero '{zero}'."
+            )
         
-        return None
\ No newline at end of file
+        if inv_u_plus_u != zero:
+            raise AxiomFailedError(
+                f"Rule (-u) + u = 0 failed. "
+                f"'{inv_u} + {u}' resulted in '{inv_u_plus_u}', but should be the zero '{zero}'."
+            )
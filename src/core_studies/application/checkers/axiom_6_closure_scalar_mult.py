@@ -1,48 +1,64 @@
-from typing import TypeVar, Generic 
+from typing import TypeVar, Generic, Any, List, Optional, Sequence, Tuple
 from core_studies.domain.entities.Element import AlgebraicElement
 from core_studies.domain.entities.VectorSpace import VectorSpace
 from core_studies.domain.errors.exceptions import AxiomFailedError
-from ..ports.axiom_checker import IAxiomCheckerPort
+from core_studies.domain.ports.Operations import Scalar
+from .base import SampledAxiomChecker
 
 ET = TypeVar('ET', bound=AlgebraicElement)
-NUM_SAMPLES = 3 
 
 
-class CheckClosureScalarMult(Generic[ET], IAxiomCheckerPort[ET]):
+class CheckClosureScalarMult(Generic[ET], SampledAxiomChecker[ET]):
     """
     Implements the check for Axiom 6:
     Closure under scalar multiplication (k * u belongs to V).
     """
 
+    scalar_arity = 1
+    depends_on = ("scalar_multiplication", "validator", "element_provider")
+
     @property
     def axiom_name(self) -> str:
         return "A6: Closure under scalar multiplication"
 
-    def check(self, space: VectorSpace[ET]) -> None:
+    def _evaluate(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> List[Tuple[ET, Optional[ET]]]:
         """
-        Checks whether scalar multiplication of a sample element
-        still belongs to the set, using the validator.
+        Computes k * u, which must belong to the set.
         """
+        u, = elements
+        k, = scalars
+
         try:
-            elements = space.element_provider.get_elements(NUM_SAMPLES)
-            scalars = space.element_provider.get_scalars(NUM_SAMPLES)
+            result = space.scalar_multiplication.execute(k, u)
         except Exception as e:
-            raise AxiomFailedError(f"Failed to obtain sample elements or scalars: {e}")
-
-        for i in range(NUM_SAMPLES):
-            u = elements[i]
-            k = scalars[i]
-
-            try:
-                result = space.scalar_multiplication.execute(k, u)
-            except Exception as e:
-                raise AxiomFailedError(
-                    f"Multiplication operation failed for {k} * {u}. Error: {e}"
-                )
-
-            if not space.validator.validate(result):
-                raise AxiomFailedError(
-                    f"Result '{result}' of '{k} * {u}' does not belong to the set."
-                )
-        
-        return None
+            raise AxiomFailedError(
+                f"Multiplication operation failed for {k} * {u}. Error: {e}"
+            )
+
+        return [(result, None)]
+
+    def _check_sample(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        """
+        Checks whether scalar multiplication of a sample element
+        still belongs to the set, using the validator.
+        """
+        u, = elements
+        k, = scalars
+        (result, _), = self._evaluate(space, context, elements, scalars)
+
+        if not space.validator.validate(result):
+            raise AxiomFailedError(
+                f"Result '{result}' of '{k} * {u}' does not belong to the set."
+            )
@@ -0,0 +1,327 @@
+"""
+Application Module: Shared sampling loop for axiom checkers
+"""
+
+import math
+import time
+from abc import abstractmethod
+from array import array
+from typing import TypeVar, Generic, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import AxiomFailedError
+from core_studies.domain.ports.Operations import Scalar
+from core_studies.domain.ports.Provider import DEFAULT_CHUNK_SIZE
+from ..cancellation import CancellationToken, CheckCancelledError
+from ..ports.axiom_checker import IAxiomCheckerPort
+from ..ports.sample_sink import ISampleSinkPort
+from .coordinates import element_distance
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+NUM_SAMPLES = 3
+TOLERANCE = 1e-9
+# Samples drawn and checked at a time; memory use depends on this, not
+# on the number of samples.
+CHUNK_SIZE = DEFAULT_CHUNK_SIZE
+# Samples in the first chunk of a time-budgeted check, drawn to measure
+# the cost of one sample before sizing the following chunks. Kept at
+# one so that even the probe fits a budget of a few microseconds.
+PROBE_SIZE = 1
+# Share of the remaining budget a time-budgeted chunk is sized to fill,
+# leaving headroom for jitter in the per-sample cost.
+BUDGET_HEADROOM = 0.8
+
+
+def residual_statistics(residuals: Sequence[float], tolerance: float = TOLERANCE) -> Dict[str, Any]:
+    """
+    Summarises a batch of residuals: max, mean and p99 (nearest rank)
+    over the finite ones, how many are infinite (failed operation or
+    result outside the set), and how many exceed 'tolerance'.
+    """
+    finite = sorted(r for r in residuals if math.isfinite(r))
+    count = len(finite)
+    return {
+        "samples": len(residuals),
+        "max": finite[-1] if count else None,
+        "mean": math.fsum(finite) / count if count else None,
+        "p99": finite[max(math.ceil(0.99 * count) - 1, 0)] if count else None,
+        "non_finite": len(residuals) - count,
+        "over_tolerance": sum(1 for r in residuals if r > tolerance),
+    }
+
+
+class SampledAxiomChecker(Generic[ET], IAxiomCheckerPort[ET]):
+    """
+    Base class for checkers that verify an axiom on random samples.
+
+    Subclasses declare how many elements and scalars one sample needs
+    (`element_arity`, `scalar_arity`) and implement `_evaluate` (compute
+    the results the axiom talks about) and `_check_sample` (compare
+    them). The base class draws `num_samples` samples from the space's
+    element provider, streamed in chunks of `chunk_size` samples, and
+    feeds them one at a time.
+    """
+
+    element_arity: int = 1
+    scalar_arity: int = 0
+
+    def __init__(self, num_samples: int = NUM_SAMPLES, chunk_size: int = CHUNK_SIZE):
+        """
+        Args:
+            num_samples: How many samples to check the axiom on.
+            chunk_size: How many samples to draw at a time. Tune it to
+                        the cache size; it bounds the memory of a check.
+        """
+        self.num_samples = num_samples
+        self.chunk_size = chunk_size
+
+    def check(self, space: VectorSpace[ET], cancel: Optional[CancellationToken] = None) -> None:
+        """
+        Draws the samples and checks each of them, raising
+        AxiomFailedError on the first one that violates the axiom. The
+        error carries that sample as its 'elements' and 'scalars'.
+        If 'cancel' is cancelled, CheckCancelledError is raised before
+        the next chunk.
+        """
+        context = self._prepare(space)
+
+        for count, elements, scalars in self._chunks(space, self.num_samples, cancel):
+            self._check_chunk(space, context, count, elements, scalars)
+
+        return None
+
+    def check_within(
+        self,
+        space: VectorSpace[ET],
+        deadline: float,
+        max_samples: Optional[int] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> int:
+        """
+        Checks as many samples as fit before 'deadline' (a
+        `time.perf_counter()` value), up to 'max_samples' (unbounded if
+        None), and returns how many were checked: 0 if the deadline
+        passed before the first sample, which verifies nothing.
+
+        The first chunk is a small probe; every following chunk is sized
+        from the measured cost per sample to fit the time left, so the
+        check stops between chunks without overrunning the deadline.
+        Raises AxiomFailedError like `check` on the first violation, and
+        CheckCancelledError if 'cancel' is cancelled.
+        """
+        context = self._prepare(space)
+        checked = 0
+        per_sample: Optional[float] = None
+        size = min(PROBE_SIZE, self.chunk_size)
+
+        while max_samples is None or checked < max_samples:
+            remaining = deadline - time.perf_counter()
+            if per_sample is not None:
+                size = min(self.chunk_size, int(remaining * BUDGET_HEADROOM / per_sample))
+            if max_samples is not None:
+                size = min(size, max_samples - checked)
+            if remaining <= 0 or size < 1:
+                break
+
+            chunk_started = time.perf_counter()
+            for count, elements, scalars in self._chunks(space, size, cancel):
+                self._check_chunk(space, context, count, elements, scalars)
+                checked += count
+            per_sample = max(time.perf_counter() - chunk_started, 1e-9) / size
+
+        return checked
+
+    def report(
+        self,
+        space: VectorSpace[ET],
+        tolerance: float = TOLERANCE,
+        sink: Optional[ISampleSinkPort] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """
+        Measures the axiom on the whole batch instead of stopping at the
+        first mismatch: the residual of every sample is computed and
+        summarised by `residual_statistics`, so "fails everywhere" can be
+        told apart from "fails on 0.1% of inputs".
+
+        Samples are measured one chunk at a time, and each chunk
+        (samples, residuals, pass/fail) is handed to 'sink' if one is
+        given, so only the residuals (8 bytes per sample) are kept.
+        'cancel' is polled before every chunk, like in `check`.
+        """
+        return residual_statistics(self.residuals(space, tolerance, sink, cancel), tolerance)
+
+    def residuals(
+        self,
+        space: VectorSpace[ET],
+        tolerance: float = TOLERANCE,
+        sink: Optional[ISampleSinkPort] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> array:
+        """
+        The residual of each of the `num_samples` samples, as doubles,
+        measured like `report` does ('tolerance' only decides the
+        pass/fail handed to 'sink'). Samples that could not be drawn
+        or measured count as infinite.
+        """
+        residuals = array('d')
+        try:
+            context = self._prepare(space)
+            chunks = self._chunks(space, self.num_samples, cancel)
+        except Exception:
+            chunks = iter(())
+
+        while True:
+            try:
+                count, elements, scalars = next(chunks)
+                samples = [(elements[i::count], scalars[i::count]) for i in range(count)]
+                chunk = [self._residual(space, context, e, s) for e, s in samples]
+            except StopIteration:
+                break
+            except CheckCancelledError:
+                raise
+            except Exception:
+                break
+            residuals.extend(chunk)
+            # Outside the try: a failing sink (full disk, ...) is an
+            # error of the run, not of the space.
+            if sink is not None:
+                sink.write(self.axiom_name, samples, chunk, [r <= tolerance for r in chunk])
+
+        # No (more) samples or no context: what was not measured fails.
+        residuals.extend([math.inf] * (self.num_samples - len(residuals)))
+        return residuals
+
+    def check_sample(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        """
+        Checks the axiom on one caller-supplied sample instead of drawing
+        samples from the provider (used e.g. for symbolic verification).
+        """
+        self._check_sample(space, self._prepare(space), elements, scalars)
+
+    def residual(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> float:
+        """
+        Measures how badly one sample violates the axiom: the largest
+        coordinate distance between sides that must be equal, infinity
+        if a result falls outside the set or an operation fails, and
+        0.0 when the axiom holds exactly.
+        """
+        try:
+            return self._residual(space, self._prepare(space), elements, scalars)
+        except AxiomFailedError:
+            return math.inf
+
+    def _residual(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> float:
+        try:
+            pairs = self._evaluate(space, context, elements, scalars)
+        except AxiomFailedError:
+            return math.inf
+
+        worst = 0.0
+        for left, right in pairs:
+            if right is None:
+                if not space.validator.validate(left):
+                    return math.inf
+            else:
+                worst = max(worst, element_distance(left, right))
+        return worst
+
+    def _chunks(
+        self,
+        space: VectorSpace[ET],
+        samples: Optional[int],
+        cancel: Optional[CancellationToken] = None,
+    ) -> Iterator[Tuple[int, List[ET], List[Scalar]]]:
+        """
+        Streams the draws for 'samples' samples (forever if None) as
+        (count, elements, scalars) chunks; sample i of a chunk is
+        `elements[i::count], scalars[i::count]`. 'cancel' is polled
+        before every chunk.
+        """
+        draws = space.element_provider.stream(
+            samples, self.element_arity, self.scalar_arity, self.chunk_size
+        )
+        while True:
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            try:
+                elements, scalars = next(draws)
+            except StopIteration:
+                return
+            except Exception as e:
+                raise AxiomFailedError(f"Failed to obtain sample elements or scalars: {e}")
+            yield len(elements) // self.element_arity, elements, scalars
+
+    def _check_chunk(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        count: int,
+        elements: List[ET],
+        scalars: List[Scalar],
+    ) -> None:
+        """
+        Checks the 'count' samples of a chunk in order, attaching the
+        failing sample to the AxiomFailedError.
+        """
+        for i in range(count):
+            sample_elements, sample_scalars = elements[i::count], scalars[i::count]
+            try:
+                self._check_sample(space, context, sample_elements, sample_scalars)
+            except AxiomFailedError as e:
+                if e.elements is None:
+                    e.elements, e.scalars = sample_elements, sample_scalars
+                raise
+
+    def _prepare(self, space: VectorSpace[ET]) -> Any:
+        """
+        Runs once before the samples are checked. Whatever it returns is
+        passed to every `_check_sample` call (e.g. the zero element).
+        """
+        return None
+
+    @abstractmethod
+    def _evaluate(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> List[Tuple[ET, Optional[ET]]]:
+        """
+        Computes the results the axiom constrains for one sample, as
+        (left, right) pairs that must be equal, or (result, None) for
+        results that must belong to the set. Raises AxiomFailedError
+        if an operation fails.
+        """
+        ...
+
+    @abstractmethod
+    def _check_sample(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        """
+        Checks the axiom on one sample of `element_arity` elements and
+        `scalar_arity` scalars. Raises AxiomFailedError on failure.
+        """
+        ...
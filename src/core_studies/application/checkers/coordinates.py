@@ -0,0 +1,61 @@
+"""
+Application Module: Coordinate view of dataclass elements
+"""
+
+import dataclasses
+import math
+import numbers
+from functools import lru_cache
+from typing import Any, List, Sequence, Tuple, Type, TypeVar
+from core_studies.domain.entities.Element import AlgebraicElement
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+@lru_cache(maxsize=None)
+def coordinate_names(element_type: Type[AlgebraicElement]) -> Tuple[str, ...]:
+    """
+    Returns the names of the compared fields of a dataclass element
+    type (e.g. ("x", "y", "z") for R3Vector), computed once per type.
+
+    Raises:
+        TypeError: If the element type is not a dataclass, i.e. it has
+                   no coordinate view.
+    """
+    if not dataclasses.is_dataclass(element_type):
+        raise TypeError(f"{element_type.__name__} has no coordinate view (not a dataclass).")
+    return tuple(field.name for field in dataclasses.fields(element_type) if field.compare)
+
+
+def to_coordinates(element: AlgebraicElement) -> List[Any]:
+    """Returns the coordinates of a dataclass element, in field order."""
+    return [getattr(element, name) for name in coordinate_names(type(element))]
+
+
+def from_coordinates(element_type: Type[ET], values: Sequence[Any]) -> ET:
+    """Builds a dataclass element from its coordinates, in field order."""
+    return element_type(**dict(zip(coordinate_names(element_type), values)))
+
+
+def element_distance(a: Any, b: Any) -> float:
+    """
+    Largest coordinate difference between two elements, each scaled by
+    the magnitude of the coordinates (but never by less than 1), so
+    float round-off on large values does not look like a failure.
+    Numbers (e.g. inner products) compare like one coordinate.
+
+    Elements without a coordinate view (or with non-numeric
+    coordinates) only compare as 0.0 (equal) or infinity (different).
+    """
+    if isinstance(a, numbers.Real) and isinstance(b, numbers.Real):
+        return abs(float(a) - float(b)) / max(1.0, abs(float(a)), abs(float(b)))
+    try:
+        return max(
+            (
+                abs(p - q) / max(1.0, abs(p), abs(q))
+                for p, q in zip(map(float, to_coordinates(a)), map(float, to_coordinates(b)))
+            ),
+            default=0.0,
+        )
+    except (TypeError, ValueError):
+        return 0.0 if a == b else math.inf
@@ -0,0 +1,96 @@
+"""
+Application Module: Content fingerprints of checkers, adapters and spaces
+"""
+
+import hashlib
+import inspect
+import sys
+from functools import lru_cache
+from typing import Any, Dict
+
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from ..ports.axiom_checker import IAxiomCheckerPort, SPACE_COMPONENTS, STRUCTURE_COMPONENTS
+
+
+@lru_cache(maxsize=None)
+def _module_source_hash(module_name: str) -> str:
+    try:
+        source = inspect.getsource(sys.modules[module_name])
+    except (KeyError, OSError, TypeError):
+        # Built-in or dynamically created module: only its name is known.
+        source = module_name
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def code_fingerprint(cls: type) -> str:
+    """
+    Hashes the source of every module that defines 'cls' or one of its
+    base classes, so any edit to the class, its helpers or module-level
+    constants changes the fingerprint.
+    """
+    digest = hashlib.sha256()
+    for klass in cls.__mro__:
+        if klass.__module__ != "builtins":
+            digest.update(f"{klass.__module__}.{klass.__qualname__}".encode())
+            digest.update(_module_source_hash(klass.__module__).encode())
+    return digest.hexdigest()
+
+
+def _config(value: Any) -> str:
+    """A stable description of an adapter's configuration."""
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{k!r}: {_config(v)}" for k, v in sorted(value.items())) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_config(v) for v in value) + "]"
+    if isinstance(value, type) or callable(value):
+        # Classes, functions and bound methods: their code is what matters,
+        # not their (per-process) identity.
+        name = getattr(value, "__qualname__", type(value).__qualname__)
+        return f"{getattr(value, '__module__', None)}.{name}"
+    if hasattr(value, "__dict__"):
+        return f"{code_fingerprint(type(value))}({_config(vars(value))})"
+    text = repr(value)
+    # Default reprs embed a memory address that changes between runs.
+    return type(value).__qualname__ if " at 0x" in text else text
+
+
+def adapter_fingerprint(adapter: Any) -> str:
+    """
+    Fingerprints an adapter: the hash of its code plus its configuration
+    (instance attributes, recursively for nested adapters).
+    """
+    digest = hashlib.sha256(code_fingerprint(type(adapter)).encode())
+    if hasattr(adapter, "__dict__"):
+        digest.update(_config(vars(adapter)).encode())
+    return digest.hexdigest()
+
+
+def space_fingerprints(space: VectorSpace[Any]) -> Dict[str, str]:
+    """Fingerprints the element type and every adapter of a space."""
+    fingerprints = {"element_type": code_fingerprint(space.element_type)}
+    for component in SPACE_COMPONENTS:
+        fingerprints[component] = adapter_fingerprint(getattr(space, component))
+    for component in STRUCTURE_COMPONENTS:
+        if hasattr(space, component):
+            fingerprints[component] = adapter_fingerprint(getattr(space, component))
+    return fingerprints
+
+
+def verdict_key(
+    checker: IAxiomCheckerPort[Any],
+    fingerprints: Dict[str, str],
+) -> str:
+    """
+    Identifies one checker's verdict on one space: the checker's code
+    and sample budget plus the fingerprints of the element type and of
+    the components it depends on. Editing any other adapter leaves the
+    key (and so the cached verdict) unchanged.
+    """
+    digest = hashlib.sha256()
+    digest.update(checker.axiom_name.encode())
+    digest.update(code_fingerprint(type(checker)).encode())
+    digest.update(repr(getattr(checker, "num_samples", None)).encode())
+    digest.update(fingerprints["element_type"].encode())
+    for component in sorted(checker.depends_on):
+        digest.update(f"{component}={fingerprints[component]}".encode())
+    return digest.hexdigest()
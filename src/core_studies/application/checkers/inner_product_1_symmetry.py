@@ -0,0 +1,56 @@
+import math
+from typing import TypeVar, Generic, Any, Sequence
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.ports.Operations import Scalar
+from .scalar_valued import ScalarValuedAxiomChecker, Sides
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckInnerProductSymmetry(Generic[ET], ScalarValuedAxiomChecker[ET]):
+    """
+    Implements the check for the first inner product axiom:
+    Symmetry (<u, v> = <v, u>).
+
+    Round-off in <u, v> is relative to sqrt(|<u, u>| * |<v, v>|) (the
+    Cauchy-Schwarz bound), so those are computed in the same batch.
+    """
+
+    element_arity = 2
+    depends_on = ("inner_product", "element_provider")
+
+    @property
+    def axiom_name(self) -> str:
+        return "I1: Symmetry"
+
+    def _evaluate_batch(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        columns: Sequence[Sequence[ET]],
+        scalar_columns: Sequence[Sequence[Scalar]],
+    ) -> Sides:
+        """
+        Computes both sides: <u, v> and <v, u>.
+        """
+        us, vs = columns
+        n = len(us)
+        values = space.inner_product.execute_batch([*us, *vs, *us, *vs], [*vs, *us, *us, *vs])
+        uv, vu, uu, vv = values[:n], values[n:2 * n], values[2 * n:3 * n], values[3 * n:]
+        scales = [math.sqrt(abs(a) * abs(b)) for a, b in zip(uu, vv)]
+        return uv, vu, scales
+
+    def _describe(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+        left: float,
+        right: float,
+    ) -> str:
+        u, v = elements
+        return (
+            f"Failure: <{u}, {v}> resulted in '{left}', "
+            f"but <{v}, {u}> resulted in '{right}'."
+        )
@@ -0,0 +1,60 @@
+import math
+from typing import TypeVar, Generic, Any, Sequence
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.ports.Operations import Scalar
+from .scalar_valued import ScalarValuedAxiomChecker, Sides
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckInnerProductAdditivity(Generic[ET], ScalarValuedAxiomChecker[ET]):
+    """
+    Implements the check for the second inner product axiom:
+    Additivity in the first argument (<u + v, w> = <u, w> + <v, w>).
+    """
+
+    element_arity = 3
+    depends_on = ("inner_product", "addition", "element_provider")
+
+    @property
+    def axiom_name(self) -> str:
+        return "I2: Additivity"
+
+    def _evaluate_batch(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        columns: Sequence[Sequence[ET]],
+        scalar_columns: Sequence[Sequence[Scalar]],
+    ) -> Sides:
+        """
+        Computes both sides: <u + v, w> and <u, w> + <v, w>.
+        """
+        us, vs, ws = columns
+        n = len(us)
+        sums = [space.addition.execute(u, v) for u, v in zip(us, vs)]
+        values = space.inner_product.execute_batch(
+            [*sums, *us, *vs, *sums, *us, *vs, *ws], [*ws, *ws, *ws, *sums, *us, *vs, *ws]
+        )
+        sw, uw, vw = values[:n], values[n:2 * n], values[2 * n:3 * n]
+        ss, uu, vv, ww = values[3 * n:4 * n], values[4 * n:5 * n], values[5 * n:6 * n], values[6 * n:]
+        scales = [
+            math.sqrt(max(abs(s), abs(a), abs(b)) * abs(c))
+            for s, a, b, c in zip(ss, uu, vv, ww)
+        ]
+        return sw, [a + b for a, b in zip(uw, vw)], scales
+
+    def _describe(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+        left: float,
+        right: float,
+    ) -> str:
+        u, v, w = elements
+        return (
+            f"Failure: <{u} + {v}, {w}> resulted in '{left}', "
+            f"but <{u}, {w}> + <{v}, {w}> resulted in '{right}'."
+        )
@@ -0,0 +1,57 @@
+import math
+from typing import TypeVar, Generic, Any, Sequence
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.ports.Operations import Scalar
+from .scalar_valued import ScalarValuedAxiomChecker, Sides
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckInnerProductHomogeneity(Generic[ET], ScalarValuedAxiomChecker[ET]):
+    """
+    Implements the check for the third inner product axiom:
+    Homogeneity in the first argument (<k*u, v> = k * <u, v>).
+    """
+
+    element_arity = 2
+    scalar_arity = 1
+    depends_on = ("inner_product", "scalar_multiplication", "element_provider")
+
+    @property
+    def axiom_name(self) -> str:
+        return "I3: Homogeneity"
+
+    def _evaluate_batch(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        columns: Sequence[Sequence[ET]],
+        scalar_columns: Sequence[Sequence[Scalar]],
+    ) -> Sides:
+        """
+        Computes both sides: <k*u, v> and k * <u, v>.
+        """
+        us, vs = columns
+        ks, = scalar_columns
+        n = len(us)
+        scaled = [space.scalar_multiplication.execute(k, u) for k, u in zip(ks, us)]
+        values = space.inner_product.execute_batch([*scaled, *us, *us, *vs], [*vs, *vs, *us, *vs])
+        kuv, uv, uu, vv = values[:n], values[n:2 * n], values[2 * n:3 * n], values[3 * n:]
+        scales = [abs(k) * math.sqrt(abs(a) * abs(b)) for k, a, b in zip(ks, uu, vv)]
+        return kuv, [k * value for k, value in zip(ks, uv)], scales
+
+    def _describe(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+        left: float,
+        right: float,
+    ) -> str:
+        u, v = elements
+        k, = scalars
+        return (
+            f"Failure: <{k} * {u}, {v}> resulted in '{left}', "
+            f"but {k} * <{u}, {v}> resulted in '{right}'."
+        )
@@ -0,0 +1,73 @@
+from typing import TypeVar, Generic, Any, Sequence
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import AxiomFailedError
+from core_studies.domain.ports.Operations import Scalar
+from .scalar_valued import ScalarValuedAxiomChecker, Sides
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckInnerProductPositiveDefiniteness(Generic[ET], ScalarValuedAxiomChecker[ET]):
+    """
+    Implements the check for the fourth inner product axiom:
+    Positive-definiteness (<u, u> > 0 for u != 0, and <0, 0> = 0).
+
+    The zero element is checked on every chunk besides the samples, so
+    a provider that never draws it cannot hide a failure there.
+    """
+
+    depends_on = ("inner_product", "zero_element_provider", "element_provider")
+
+    @property
+    def axiom_name(self) -> str:
+        return "I4: Positive-Definiteness"
+
+    def _prepare(self, space: VectorSpace[ET]) -> ET:
+        """
+        Obtains the zero element the samples are told apart from.
+        """
+        try:
+            return space.zero_element_provider.get()
+        except Exception as e:
+            raise AxiomFailedError(f"Failed to obtain zero element: {e}")
+
+    def _evaluate_batch(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        columns: Sequence[Sequence[ET]],
+        scalar_columns: Sequence[Sequence[Scalar]],
+    ) -> Sides:
+        """
+        Compares <0, 0> with 0, then, for each u, <u, u> with 0 if u is
+        the zero element; otherwise both sides are 0 if <u, u> > 0 and
+        differ by 1 if not.
+        """
+        zero = context
+        us, = columns
+        *squares, zero_square = space.inner_product.execute_batch([*us, zero], [*us, zero])
+        if zero_square != 0:
+            raise AxiomFailedError(
+                f"Failure: <{zero}, {zero}> resulted in '{zero_square}' instead of 0."
+            )
+
+        lefts = [
+            square if u == zero else (0.0 if square > 0 else 1.0)
+            for u, square in zip(us, squares)
+        ]
+        return lefts, [0.0] * len(us), [0.0] * len(us)
+
+    def _describe(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+        left: float,
+        right: float,
+    ) -> str:
+        u, = elements
+        square = space.inner_product.execute(u, u)
+        if u == space.zero_element_provider.get():
+            return f"Failure: <{u}, {u}> resulted in '{square}', but u is the zero element."
+        return f"Failure: <{u}, {u}> resulted in '{square}', which is not positive for u != 0."
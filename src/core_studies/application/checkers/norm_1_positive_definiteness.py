@@ -0,0 +1,68 @@
+from typing import TypeVar, Generic, Any, Sequence
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import AxiomFailedError
+from core_studies.domain.ports.Operations import Scalar
+from .scalar_valued import ScalarValuedAxiomChecker, Sides
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckNormPositiveDefiniteness(Generic[ET], ScalarValuedAxiomChecker[ET]):
+    """
+    Implements the check for the first norm axiom:
+    Positive-definiteness (||u|| > 0 for u != 0, and ||0|| = 0).
+    """
+
+    depends_on = ("norm", "zero_element_provider", "element_provider")
+
+    @property
+    def axiom_name(self) -> str:
+        return "N1: Positive-Definiteness"
+
+    def _prepare(self, space: VectorSpace[ET]) -> ET:
+        """
+        Obtains the zero element the samples are told apart from.
+        """
+        try:
+            return space.zero_element_provider.get()
+        except Exception as e:
+            raise AxiomFailedError(f"Failed to obtain zero element: {e}")
+
+    def _evaluate_batch(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        columns: Sequence[Sequence[ET]],
+        scalar_columns: Sequence[Sequence[Scalar]],
+    ) -> Sides:
+        """
+        Compares ||0|| with 0, then, for each u, ||u|| with 0 if u is the
+        zero element; otherwise both sides are 0 if ||u|| > 0 and differ
+        by 1 if not.
+        """
+        zero = context
+        us, = columns
+        *norms, zero_norm = space.norm.execute_batch([*us, zero])
+        if zero_norm != 0:
+            raise AxiomFailedError(f"Failure: ||{zero}|| resulted in '{zero_norm}' instead of 0.")
+
+        lefts = [
+            norm if u == zero else (0.0 if norm > 0 else 1.0)
+            for u, norm in zip(us, norms)
+        ]
+        return lefts, [0.0] * len(us), [0.0] * len(us)
+
+    def _describe(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+        left: float,
+        right: float,
+    ) -> str:
+        u, = elements
+        norm = space.norm.execute(u)
+        if u == space.zero_element_provider.get():
+            return f"Failure: ||{u}|| resulted in '{norm}', but u is the zero element."
+        return f"Failure: ||{u}|| resulted in '{norm}', which is not positive for u != 0."
@@ -0,0 +1,54 @@
+from typing import TypeVar, Generic, Any, Sequence
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.ports.Operations import Scalar
+from .scalar_valued import ScalarValuedAxiomChecker, Sides
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckNormHomogeneity(Generic[ET], ScalarValuedAxiomChecker[ET]):
+    """
+    Implements the check for the second norm axiom:
+    Absolute homogeneity (||k*u|| = |k| * ||u||).
+    """
+
+    scalar_arity = 1
+    depends_on = ("norm", "scalar_multiplication", "element_provider")
+
+    @property
+    def axiom_name(self) -> str:
+        return "N2: Absolute Homogeneity"
+
+    def _evaluate_batch(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        columns: Sequence[Sequence[ET]],
+        scalar_columns: Sequence[Sequence[Scalar]],
+    ) -> Sides:
+        """
+        Computes both sides: ||k*u|| and |k| * ||u||.
+        """
+        us, = columns
+        ks, = scalar_columns
+        n = len(us)
+        scaled = [space.scalar_multiplication.execute(k, u) for k, u in zip(ks, us)]
+        norms = space.norm.execute_batch([*scaled, *us])
+        rights = [abs(k) * norm for k, norm in zip(ks, norms[n:])]
+        return norms[:n], rights, [0.0] * n
+
+    def _describe(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+        left: float,
+        right: float,
+    ) -> str:
+        u, = elements
+        k, = scalars
+        return (
+            f"Failure: ||{k} * {u}|| resulted in '{left}', "
+            f"but |{k}| * ||{u}|| resulted in '{right}'."
+        )
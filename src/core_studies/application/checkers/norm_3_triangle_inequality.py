@@ -0,0 +1,55 @@
+from typing import TypeVar, Generic, Any, Sequence
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.ports.Operations import Scalar
+from .scalar_valued import ScalarValuedAxiomChecker, Sides
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckNormTriangleInequality(Generic[ET], ScalarValuedAxiomChecker[ET]):
+    """
+    Implements the check for the third norm axiom:
+    Triangle inequality (||u + v|| <= ||u|| + ||v||).
+
+    The inequality is compared as an equation: the excess
+    max(0, ||u + v|| - ||u|| - ||v||) must be 0.
+    """
+
+    element_arity = 2
+    depends_on = ("norm", "addition", "element_provider")
+
+    @property
+    def axiom_name(self) -> str:
+        return "N3: Triangle Inequality"
+
+    def _evaluate_batch(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        columns: Sequence[Sequence[ET]],
+        scalar_columns: Sequence[Sequence[Scalar]],
+    ) -> Sides:
+        """
+        Computes the excess of ||u + v|| over ||u|| + ||v||.
+        """
+        us, vs = columns
+        n = len(us)
+        sums = [space.addition.execute(u, v) for u, v in zip(us, vs)]
+        norms = space.norm.execute_batch([*sums, *us, *vs])
+        bounds = [a + b for a, b in zip(norms[n:2 * n], norms[2 * n:])]
+        excesses = [max(0, total - bound) for total, bound in zip(norms[:n], bounds)]
+        return excesses, [0.0] * n, bounds
+
+    def _describe(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+        left: float,
+        right: float,
+    ) -> str:
+        u, v = elements
+        return (
+            f"Failure: ||{u} + {v}|| exceeds ||{u}|| + ||{v}|| by '{left}'."
+        )
@@ -0,0 +1,155 @@
+"""
+Application Module: Batch sampling loop for axioms on scalar-valued maps
+"""
+
+from abc import abstractmethod
+from typing import TypeVar, Generic, Any, List, Optional, Sequence, Tuple
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import AxiomFailedError
+from core_studies.domain.ports.Operations import Scalar
+from .base import CHUNK_SIZE, TOLERANCE, SampledAxiomChecker
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+# Per sample: the two sides the axiom compares, and the magnitude of the
+# values they were computed from (round-off is relative to it).
+Sides = Tuple[List[float], List[float], List[float]]
+# Default samples per axiom of the inner product and norm checks. A
+# form or norm that breaks an axiom usually does so on a sizeable share
+# of inputs (a quarter to a half for the counter-recipes), which 100
+# samples miss with probability below 1e-9 but NUM_SAMPLES often does.
+GEOMETRY_SAMPLES = 100
+
+
+class ScalarValuedAxiomChecker(Generic[ET], SampledAxiomChecker[ET]):
+    """
+    Base class for checkers of axioms about maps from elements to
+    scalars, such as inner products and norms.
+
+    Each sample reduces to two numbers that must agree (an inequality
+    is stated as "its excess is zero"). Subclasses implement
+    `_evaluate_batch`, which computes both sides for a whole chunk of
+    samples at once: the space's operations are applied element by
+    element, but the inner product or norm is called once per role
+    with `execute_batch`, so vectorized adapters evaluate a chunk in a
+    few array operations. Single samples (`check_sample`, residuals,
+    counterexample search) go through the same code as chunks of one.
+
+    Two sides agree when they differ by at most `tolerance` times the
+    magnitude of the values involved (but never less than 1).
+    """
+
+    def __init__(
+        self,
+        num_samples: int = GEOMETRY_SAMPLES,
+        chunk_size: int = CHUNK_SIZE,
+        tolerance: float = TOLERANCE,
+    ):
+        """
+        Args:
+            num_samples: How many samples to check the axiom on.
+            chunk_size: How many samples to draw and evaluate at a time.
+            tolerance: Relative difference under which both sides agree.
+        """
+        super().__init__(num_samples=num_samples, chunk_size=chunk_size)
+        self.tolerance = tolerance
+
+    def _check_chunk(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        count: int,
+        elements: List[ET],
+        scalars: List[Scalar],
+    ) -> None:
+        """
+        Evaluates the 'count' samples of a chunk together, then raises
+        AxiomFailedError for the first one whose sides disagree.
+        """
+        lefts, rights, scales = self._sides(space, context, count, elements, scalars)
+
+        for i in range(count):
+            left, right = lefts[i], rights[i]
+            scale = max(1.0, abs(left), abs(right), scales[i])
+            if not abs(left - right) <= self.tolerance * scale:
+                sample_elements, sample_scalars = elements[i::count], scalars[i::count]
+                raise AxiomFailedError(
+                    self._describe(space, sample_elements, sample_scalars, left, right),
+                    elements=sample_elements,
+                    scalars=sample_scalars,
+                )
+
+    def _check_sample(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        self._check_chunk(space, context, 1, list(elements), list(scalars))
+
+    def _evaluate(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+    ) -> List[Tuple[Any, Optional[Any]]]:
+        """
+        Both sides of one sample, divided by the magnitude of the values
+        involved, so their distance is the relative round-off.
+        """
+        (left,), (right,), (scale,) = self._sides(space, context, 1, list(elements), list(scalars))
+        scale = max(1.0, abs(left), abs(right), scale)
+        return [(left / scale, right / scale)]
+
+    def _sides(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        count: int,
+        elements: List[ET],
+        scalars: List[Scalar],
+    ) -> Sides:
+        """
+        Splits a chunk into one column per element and scalar role
+        (column j holds the j-th element of every sample) and evaluates
+        it, turning any error into an AxiomFailedError.
+        """
+        columns = [elements[j * count:(j + 1) * count] for j in range(self.element_arity)]
+        scalar_columns = [scalars[j * count:(j + 1) * count] for j in range(self.scalar_arity)]
+        try:
+            return self._evaluate_batch(space, context, columns, scalar_columns)
+        except AxiomFailedError:
+            raise
+        except Exception as e:
+            raise AxiomFailedError(f"Failed to evaluate {self.axiom_name}: {e}")
+
+    @abstractmethod
+    def _evaluate_batch(
+        self,
+        space: VectorSpace[ET],
+        context: Any,
+        columns: Sequence[Sequence[ET]],
+        scalar_columns: Sequence[Sequence[Scalar]],
+    ) -> Sides:
+        """
+        Computes, for every sample of a chunk, the two sides the axiom
+        says are equal and the magnitude of the values they come from.
+        Sample i is (columns[0][i], columns[1][i], ...) and
+        (scalar_columns[0][i], ...).
+        """
+        ...
+
+    @abstractmethod
+    def _describe(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        scalars: Sequence[Scalar],
+        left: float,
+        right: float,
+    ) -> str:
+        """The failure message for a sample whose sides disagree."""
+        ...
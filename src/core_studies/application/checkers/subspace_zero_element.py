@@ -0,0 +1,44 @@
+from typing import TypeVar, Generic
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import AxiomFailedError
+from ..ports.axiom_checker import IAxiomCheckerPort
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckZeroInSubset(Generic[ET], IAxiomCheckerPort[ET]):
+    """
+    Implements the first subspace condition:
+    the zero element of the parent space belongs to the subset.
+    """
+
+    depends_on = ("zero_element_provider", "validator")
+
+    def __init__(self, num_samples: int = 1):
+        """
+        Args:
+            num_samples: Accepted for symmetry with the sampled checkers;
+                         the zero element is a single, fixed element.
+        """
+        self.num_samples = num_samples
+
+    @property
+    def axiom_name(self) -> str:
+        return "S1: Contains the Zero Element"
+
+    def check(self, space: VectorSpace[ET]) -> None:
+        """
+        Checks that the space's validator accepts its zero element.
+        """
+        try:
+            zero = space.zero_element_provider.get()
+        except Exception as e:
+            raise AxiomFailedError(f"Failed to obtain zero element: {e}")
+
+        if not space.validator.validate(zero):
+            raise AxiomFailedError(
+                f"The zero element '{zero}' does not belong to the subset."
+            )
+
+        return None
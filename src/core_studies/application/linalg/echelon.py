@@ -0,0 +1,134 @@
+"""
+Application Module: Incremental rank-revealing echelon basis
+"""
+
+from fractions import Fraction
+from typing import Any, List, Optional, Sequence, Tuple
+
+# Relative tolerance below which a float entry counts as zero.
+RANK_TOLERANCE = 1e-9
+
+
+def _is_exact(value: Any) -> bool:
+    return isinstance(value, (int, Fraction))
+
+
+class EchelonBasis:
+    """
+    The reduced row echelon form of the vectors added so far, kept up
+    to date one vector at a time.
+
+    Adding a vector costs O(rank * dimension): it is reduced against
+    the current rows, and if anything is left it becomes a new row.
+    The pivot is the largest remaining entry (partial pivoting), and a
+    float entry counts as zero below RANK_TOLERANCE times the largest
+    entry of the vector as added, which makes the rank numerically
+    robust whatever the vector's scale: only a vector whose entries are
+    all zero is the zero vector. Exact vectors (ints and Fractions) are
+    eliminated exactly, with no tolerance.
+    """
+
+    def __init__(self, dimension: int, tolerance: float = RANK_TOLERANCE):
+        """
+        Args:
+            dimension: Number of coordinates of every vector.
+            tolerance: Relative size under which float entries vanish.
+        """
+        self.dimension = dimension
+        self.tolerance = tolerance
+        self._rows: List[Tuple[int, List[Any]]] = []
+
+    @property
+    def rank(self) -> int:
+        return len(self._rows)
+
+    @property
+    def is_full(self) -> bool:
+        """True once the vectors span every coordinate direction."""
+        return self.rank == self.dimension
+
+    def rows(self) -> List[List[Any]]:
+        """
+        The basis in canonical reduced row echelon form (leading ones in
+        the leftmost possible columns), so the same span always yields
+        the same rows whatever order its vectors were added in.
+        """
+        rows = [list(row) for _, row in self._rows]
+        exact = all(_is_exact(v) for row in rows for v in row)
+        # Each row's entries vanish relative to the row's own size.
+        thresholds = [0.0 if exact else self._threshold(row) for row in rows]
+        result: List[List[Any]] = []
+        for column in range(self.dimension):
+            candidates = [
+                index for index, row in enumerate(rows) if abs(row[column]) > thresholds[index]
+            ]
+            if not candidates:
+                continue
+            lead_index = max(candidates, key=lambda index: abs(rows[index][column]))
+            lead_row = rows.pop(lead_index)
+            thresholds.pop(lead_index)
+            lead = lead_row[column]
+            lead_row = [value / lead for value in lead_row]
+            lead_row[column] = lead / lead
+            rows = [
+                [a - row[column] * b for a, b in zip(row, lead_row)] for row in rows
+            ]
+            result = [
+                [a - row[column] * b for a, b in zip(row, lead_row)] for row in result
+            ]
+            result.append(lead_row)
+        return [
+            [0.0 if value == 0 and isinstance(value, float) else value for value in row]
+            for row in result
+        ]
+
+    def add(self, vector: Sequence[Any]) -> bool:
+        """
+        Adds 'vector' and returns True if it was linearly independent of
+        the vectors added before (the rank grew), False otherwise.
+        """
+        residual, threshold = self._reduce(vector)
+        pivot = self._pivot(residual, threshold)
+        if pivot is None:
+            return False
+
+        lead = residual[pivot]
+        row = [value / lead for value in residual]
+        row[pivot] = lead / lead
+        # Keep the form reduced: clear the new pivot column elsewhere.
+        for index, (column, other) in enumerate(self._rows):
+            factor = other[pivot]
+            if factor != 0:
+                self._rows[index] = (column, [a - factor * b for a, b in zip(other, row)])
+        self._rows.append((pivot, row))
+        return True
+
+    def contains(self, vector: Sequence[Any]) -> bool:
+        """True if 'vector' lies in the span of the vectors added."""
+        residual, threshold = self._reduce(vector)
+        return self._pivot(residual, threshold) is None
+
+    def _reduce(self, vector: Sequence[Any]) -> Tuple[List[Any], float]:
+        if len(vector) != self.dimension:
+            raise ValueError(f"Expected {self.dimension} coordinates, got {len(vector)}")
+        exact = all(_is_exact(value) for value in vector)
+        # Fractions keep exact vectors exact through the divisions.
+        residual = [Fraction(value) for value in vector] if exact else list(vector)
+        threshold = 0.0 if exact else self._threshold(residual)
+        for column, row in self._rows:
+            factor = residual[column]
+            if factor != 0:
+                residual = [a - factor * b for a, b in zip(residual, row)]
+        return residual, threshold
+
+    def _threshold(self, vector: Sequence[Any]) -> float:
+        """The size under which entries of 'vector' count as zero."""
+        return self.tolerance * max((abs(value) for value in vector), default=0.0)
+
+    @staticmethod
+    def _pivot(residual: Sequence[Any], threshold: float) -> Optional[int]:
+        best: Optional[int] = None
+        for index, value in enumerate(residual):
+            if abs(value) > threshold and (best is None or abs(value) > abs(residual[best])):
+                best = index
+        return best
@@ -1,11 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Tuple
 from core_studies.domain.entities.Element import AlgebraicElement
 from core_studies.domain.entities.VectorSpace import VectorSpace
 
 ET = TypeVar('ET', bound=AlgebraicElement)
 
+# The VectorSpace attributes a checker can depend on (besides its element type).
+SPACE_COMPONENTS: Tuple[str, ...] = (
+    "addition",
+    "scalar_multiplication",
+    "zero_element_provider",
+    "additive_inverse_provider",
+    "element_provider",
+    "validator",
+)
+# Attributes that inner product and normed spaces add to a VectorSpace;
+# checkers of those families depend on them too.
+STRUCTURE_COMPONENTS: Tuple[str, ...] = ("inner_product", "norm")
+
 class IAxiomCheckerPort(Generic[ET], ABC):
+    # Which SPACE_COMPONENTS the check uses; a verdict stays valid while
+    # none of them change. Defaults to all of them.
+    depends_on: Tuple[str, ...] = SPACE_COMPONENTS
+
     @property
     @abstractmethod
     def axiom_name(self) -> str:
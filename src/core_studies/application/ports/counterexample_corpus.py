@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.ports.Operations import Scalar
+
+# One stored counterexample: the elements and scalars of a failing sample.
+Counterexample = Tuple[List[Any], List[Scalar]]
+
+
+class ICounterexampleCorpusPort(ABC):
+    """
+    Port (Interface) for a store of inputs that made an axiom fail, kept
+    per recipe so they can be replayed before any random sampling.
+    Implementations deduplicate samples and bound the corpus size.
+    """
+
+    @abstractmethod
+    def load(
+        self, recipe: str, element_type: Type[AlgebraicElement]
+    ) -> Dict[str, List[Counterexample]]:
+        """
+        Returns every stored counterexample of a recipe in one batch,
+        grouped by axiom name, with elements rebuilt as 'element_type'.
+        """
+        ...
+
+    @abstractmethod
+    def add(
+        self,
+        recipe: str,
+        axiom: str,
+        elements: Sequence[AlgebraicElement],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        """Stores one failing sample (a no-op if it is already stored)."""
+        ...
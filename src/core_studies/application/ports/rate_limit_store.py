@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+
+class IRateLimitStorePort(ABC):
+    """
+    Port (Interface) for the state of per-client token buckets.
+
+    A bucket holds up to 'capacity' tokens and refills continuously at
+    'rate' tokens per second; a client unknown to the store starts with
+    a full bucket. Implementations must make `take` atomic for their
+    scope (one process, or every process sharing the store).
+    """
+
+    @abstractmethod
+    def take(self, key: str, cost: float, rate: float, capacity: float, now: float) -> float:
+        """
+        Refills the bucket of 'key' up to 'now' (a `time.time()` value)
+        and takes 'cost' tokens from it if it holds that many. A
+        negative cost counts as 0: it never adds tokens.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise the seconds until the
+            bucket will hold 'cost' tokens (nothing is taken then).
+        """
+        ...
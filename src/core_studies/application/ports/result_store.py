@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# A stored run: {"recipe", "recipe_hash", "seed", "samples", "passed",
+# "seconds", "created_at", "axioms": [{"axiom", "passed", "seconds",
+# "reason"}]}, plus "id" once saved.
+RunRecord = Dict[str, Any]
+
+
+class IResultStorePort(ABC):
+    """
+    Port (Interface) for a store that keeps the history of verification
+    runs, so results can be compared across days and code changes.
+    """
+
+    @abstractmethod
+    def save_runs(self, runs: Sequence[RunRecord]) -> List[int]:
+        """
+        Persists several runs at once (one write transaction) and
+        returns their ids in the same order.
+        """
+        ...
+
+    def save_run(self, run: RunRecord) -> int:
+        """Persists one run and returns its id."""
+        return self.save_runs([run])[0]
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Groups every `save_run` made inside the block into one write.
+        Stores without transactions simply write each run immediately.
+        """
+        yield
+
+    @abstractmethod
+    def get_run(self, run_id: int) -> Optional[RunRecord]:
+        """Returns one run with its per-axiom results, or None."""
+        ...
+
+    @abstractmethod
+    def history(self, recipe: str, limit: int = 50) -> List[RunRecord]:
+        """Returns the latest 'limit' runs of a recipe, newest first."""
+        ...
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Any, Sequence, Tuple
+
+from core_studies.domain.ports.Operations import Scalar
+
+# One sample as the checkers see it: (elements, scalars).
+Sample = Tuple[Sequence[Any], Sequence[Scalar]]
+
+
+class ISampleSinkPort(ABC):
+    """
+    Port (Interface) for a destination of per-sample outcomes (e.g. a
+    file for offline analysis). Checkers hand it one chunk at a time, so
+    an implementation can stream a run of any size to disk.
+    """
+
+    @abstractmethod
+    def write(
+        self,
+        axiom: str,
+        samples: Sequence[Sample],
+        residuals: Sequence[float],
+        passed: Sequence[bool],
+    ) -> None:
+        """Appends one chunk of samples of 'axiom' with their outcomes."""
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flushes and releases the destination."""
+        ...
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+# A cached verdict: {"passed": bool, "reason": Optional[str]}.
+Verdict = Dict[str, Any]
+
+
+class IVerdictCachePort(ABC):
+    """
+    Port (Interface) for a cache of per-axiom verdicts, keyed by the
+    fingerprints of everything the verdict depends on (see
+    `checkers.fingerprint.verdict_key`). It lets a re-check skip axioms
+    whose checker and adapters did not change.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Verdict]:
+        """Returns the verdict stored under 'key', or None."""
+        ...
+
+    @abstractmethod
+    def put(self, key: str, verdict: Verdict) -> None:
+        """Stores (or replaces) the verdict under 'key'."""
+        ...
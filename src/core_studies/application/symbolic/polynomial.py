@@ -0,0 +1,184 @@
+"""
+Application Module: Exact multivariate polynomials for symbolic checks
+"""
+
+from fractions import Fraction
+from numbers import Rational
+from typing import Dict, Tuple, Union
+
+# A monomial is a sorted tuple of (symbol, power) pairs; () is the constant.
+Monomial = Tuple[Tuple[str, int], ...]
+Number = Union[int, float, Fraction]
+
+
+class SymbolicUnsupported(TypeError):
+    """
+    Raised when a symbolic value is used in a way that has no exact
+    polynomial meaning (ordering, truthiness, float conversion of a
+    non-constant, division by a symbol, ...). Code that does this is
+    "opaque" to symbolic verification.
+    """
+    pass
+
+
+class Polynomial:
+    """
+    An immutable polynomial with exact rational coefficients.
+
+    It supports +, -, *, division by a number and integer powers, so
+    it can be fed to any adapter whose arithmetic is polynomial in its
+    inputs. Two polynomials compare equal only if they are identical;
+    since a non-zero polynomial is non-zero somewhere on the reals,
+    an identity that holds symbolically holds for every input.
+    """
+
+    __slots__ = ("_terms",)
+
+    def __init__(self, terms: Dict[Monomial, Fraction] | None = None):
+        self._terms: Dict[Monomial, Fraction] = {
+            monomial: coefficient
+            for monomial, coefficient in (terms or {}).items()
+            if coefficient != 0
+        }
+
+    @classmethod
+    def symbol(cls, name: str) -> "Polynomial":
+        return cls({((name, 1),): Fraction(1)})
+
+    @classmethod
+    def constant(cls, value: Number) -> "Polynomial":
+        return cls({(): Fraction(value)})
+
+    @property
+    def is_constant(self) -> bool:
+        return all(monomial == () for monomial in self._terms)
+
+    @property
+    def constant_value(self) -> Fraction:
+        """
+        Raises:
+            SymbolicUnsupported: If the polynomial is not constant.
+        """
+        if not self.is_constant:
+            raise SymbolicUnsupported(f"'{self}' is not a constant.")
+        return self._terms.get((), Fraction(0))
+
+    def __add__(self, other: object) -> "Polynomial":
+        other_poly = _coerce(other)
+        if other_poly is None:
+            return NotImplemented
+        terms = dict(self._terms)
+        for monomial, coefficient in other_poly._terms.items():
+            terms[monomial] = terms.get(monomial, Fraction(0)) + coefficient
+        return Polynomial(terms)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "Polynomial":
+        return Polynomial({m: -c for m, c in self._terms.items()})
+
+    def __pos__(self) -> "Polynomial":
+        return self
+
+    def __sub__(self, other: object) -> "Polynomial":
+        other_poly = _coerce(other)
+        if other_poly is None:
+            return NotImplemented
+        return self + (-other_poly)
+
+    def __rsub__(self, other: object) -> "Polynomial":
+        other_poly = _coerce(other)
+        if other_poly is None:
+            return NotImplemented
+        return other_poly + (-self)
+
+    def __mul__(self, other: object) -> "Polynomial":
+        other_poly = _coerce(other)
+        if other_poly is None:
+            return NotImplemented
+        terms: Dict[Monomial, Fraction] = {}
+        for m1, c1 in self._terms.items():
+            for m2, c2 in other_poly._terms.items():
+                monomial = _multiply_monomials(m1, m2)
+                terms[monomial] = terms.get(monomial, Fraction(0)) + c1 * c2
+        return Polynomial(terms)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: object) -> "Polynomial":
+        other_poly = _coerce(other)
+        if other_poly is None:
+            return NotImplemented
+        divisor = other_poly.constant_value
+        if divisor == 0:
+            raise ZeroDivisionError("polynomial division by zero")
+        return self * Polynomial.constant(1 / divisor)
+
+    def __pow__(self, exponent: object) -> "Polynomial":
+        if not isinstance(exponent, int) or exponent < 0:
+            raise SymbolicUnsupported("Only non-negative integer powers are polynomial.")
+        result = Polynomial.constant(1)
+        for _ in range(exponent):
+            result = result * self
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Polynomial):
+            return self._terms == other._terms
+        other_poly = _coerce(other)
+        if other_poly is None:
+            return NotImplemented
+        if not self.is_constant:
+            # Comparing a symbol with a number would silently pick a branch.
+            raise SymbolicUnsupported(f"Cannot compare non-constant '{self}' with {other!r}.")
+        return self._terms == other_poly._terms
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self._terms.items()))
+
+    def __float__(self) -> float:
+        return float(self.constant_value)
+
+    def __bool__(self) -> bool:
+        return bool(self.constant_value)
+
+    def _unordered(self, other: object) -> bool:
+        raise SymbolicUnsupported("Symbolic values have no ordering.")
+
+    __lt__ = __le__ = __gt__ = __ge__ = _unordered
+
+    def __abs__(self) -> "Polynomial":
+        raise SymbolicUnsupported("abs() is not polynomial.")
+
+    def __repr__(self) -> str:
+        if not self._terms:
+            return "0"
+
+        parts = []
+        for monomial in sorted(self._terms, key=lambda m: (-sum(p for _, p in m), m)):
+            coefficient = self._terms[monomial]
+            factors = [name if power == 1 else f"{name}^{power}" for name, power in monomial]
+            if not factors:
+                parts.append(str(coefficient))
+            elif coefficient == 1:
+                parts.append("*".join(factors))
+            elif coefficient == -1:
+                parts.append("-" + "*".join(factors))
+            else:
+                parts.append(f"{coefficient}*" + "*".join(factors))
+        return " + ".join(parts).replace("+ -", "- ")
+
+
+def _coerce(value: object) -> "Polynomial | None":
+    if isinstance(value, Polynomial):
+        return value
+    if isinstance(value, (Rational, float)) and not isinstance(value, bool):
+        return Polynomial.constant(value)
+    return None
+
+
+def _multiply_monomials(m1: Monomial, m2: Monomial) -> Monomial:
+    powers: Dict[str, int] = dict(m1)
+    for name, power in m2:
+        powers[name] = powers.get(name, 0) + power
+    return tuple(sorted(powers.items()))
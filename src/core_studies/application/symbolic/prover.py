@@ -0,0 +1,99 @@
+"""
+Application Module: Symbolic (exact) verification of sampled axioms
+"""
+
+from typing import TypeVar, Any, Optional, Tuple, Type
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import AxiomFailedError
+from core_studies.domain.ports.Validator import IElementValidatorPort
+from ..checkers.base import SampledAxiomChecker
+from ..checkers.coordinates import coordinate_names, from_coordinates
+from .polynomial import Polynomial, SymbolicUnsupported
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+PROVED = "proved"
+REFUTED = "refuted"
+OPAQUE = "opaque"
+
+ELEMENT_LABELS = ("u", "v", "w")
+SCALAR_LABELS = ("k", "l", "m")
+
+
+class _SymbolicValidator(IElementValidatorPort[Any]):
+    """
+    Wraps a validator for symbolic runs. A 'True' answer is trusted;
+    anything else cannot be told apart from a validator that simply
+    does not understand symbolic values, so it makes the run opaque.
+    """
+
+    def __init__(self, inner: IElementValidatorPort[Any]):
+        self._inner = inner
+
+    def validate(self, element: AlgebraicElement) -> bool:
+        if self._inner.validate(element) is True:
+            return True
+        raise SymbolicUnsupported("Validator rejected a symbolic element.")
+
+
+class SymbolicProver:
+    """
+    Checks one sample of an axiom with *symbolic* inputs.
+
+    Each coordinate of each sample element, and each scalar, is a
+    Polynomial symbol. If the adapters only do polynomial arithmetic,
+    both sides of the axiom come out as polynomials and comparing them
+    decides the axiom for every possible input at once:
+
+    - PROVED:  the sample check passed, so the identity always holds.
+    - REFUTED: both sides were computed and differ as polynomials.
+    - OPAQUE:  some adapter, validator or element type could not work
+               symbolically; the caller should fall back to sampling.
+    """
+
+    def prove(
+        self, checker: SampledAxiomChecker[ET], space: VectorSpace[ET]
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Returns (verdict, failure reason or None).
+        """
+        try:
+            elements = [
+                self._symbolic_element(space.element_type, label)
+                for label in ELEMENT_LABELS[:checker.element_arity]
+            ]
+            scalars = [Polynomial.symbol(name) for name in SCALAR_LABELS[:checker.scalar_arity]]
+        except (TypeError, ValueError):
+            return OPAQUE, None
+
+        if len(elements) < checker.element_arity or len(scalars) < checker.scalar_arity:
+            return OPAQUE, None
+
+        symbolic_space = VectorSpace(
+            element_type=space.element_type,
+            addition_strategy=space.addition,
+            scalar_mult_strategy=space.scalar_multiplication,
+            zero_element_provider=space.zero_element_provider,
+            add_inverse_provider=space.additive_inverse_provider,
+            element_provider=space.element_provider,
+            validator=_SymbolicValidator(space.validator),
+        )
+
+        try:
+            checker.check_sample(symbolic_space, elements, scalars)
+        except AxiomFailedError as e:
+            # Checkers wrap adapter exceptions in AxiomFailedError; those
+            # carry the original exception as context and are not proofs.
+            if e.__context__ is None:
+                return REFUTED, f"Symbolic check: {e}"
+            return OPAQUE, None
+        except Exception:
+            return OPAQUE, None
+
+        return PROVED, None
+
+    def _symbolic_element(self, element_type: Type[ET], label: str) -> ET:
+        return from_coordinates(element_type, [
+            Polynomial.symbol(f"{label}.{name}") for name in coordinate_names(element_type)
+        ])
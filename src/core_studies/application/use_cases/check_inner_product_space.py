@@ -0,0 +1,55 @@
+from typing import TypeVar, Generic, List, Dict, Any, Optional
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.InnerProductSpace import InnerProductSpace
+from .check_vector_space import CheckVectorSpaceUseCase, ProgressCallback
+from ..cancellation import CancellationToken
+from ..ports.axiom_checker import IAxiomCheckerPort
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckInnerProductSpaceUseCase(Generic[ET]):
+    """
+    Orchestrates the verification of an InnerProductSpace.
+
+    The parent space is taken to be a vector space already (check it
+    with `CheckVectorSpaceUseCase`), so only the inner product axioms
+    are run: symmetry, additivity and homogeneity in the first argument,
+    and positive-definiteness. They run through the same orchestration
+    as the vector space axioms, drawing their samples from the space's
+    element provider chunk by chunk.
+    """
+
+    def __init__(self, inner_product_checkers: List[IAxiomCheckerPort[ET]]):
+        """
+        Injects the list of inner product axiom checkers.
+
+        Args:
+            inner_product_checkers: A list of objects implementing
+                                    the IAxiomCheckerPort interface.
+        """
+        self._runner = CheckVectorSpaceUseCase(axiom_checkers=inner_product_checkers)
+
+    def execute(
+        self,
+        space: InnerProductSpace[ET],
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executes the inner product axioms.
+
+        Args:
+            space: The InnerProductSpace domain instance.
+            on_progress: Optional callback notified after each axiom.
+            cancel: Polled between axioms and sample chunks; see
+                    `CheckVectorSpaceUseCase.execute`.
+
+        Returns:
+            A dictionary indicating success or listing failures.
+        """
+        result = self._runner.execute(space, on_progress=on_progress, cancel=cancel)
+        return {
+            "is_inner_product_space": result["is_vector_space"],
+            "failures": result["failures"],
+        }
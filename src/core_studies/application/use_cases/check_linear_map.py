@@ -0,0 +1,135 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.LinearMap import LinearMap
+from core_studies.domain.ports.Map import IMatrixMapPort
+from core_studies.domain.ports.Operations import Scalar
+from ..cancellation import CancellationToken, CheckCancelledError
+from ..checkers.base import CHUNK_SIZE, NUM_SAMPLES
+from .check_vector_space import ProgressCallback
+
+ADDITIVITY = "L1: Additivity"
+HOMOGENEITY = "L2: Homogeneity"
+
+
+class CheckLinearMapUseCase:
+    """
+    Verifies that a map T: V -> W is linear:
+    T(u + v) = T(u) + T(v) and T(k*u) = k*T(u), for sampled u, v in V
+    and scalars k.
+
+    Both conditions are checked on one pool of (u, v, k) samples drawn
+    from the source space, chunk by chunk. For each chunk, V's
+    operations build u + v and k*u, and T is evaluated on all of u, v,
+    u + v and k*u with a single `execute_batch` call, so a map given by
+    a matrix costs one matrix product per chunk. The images are then
+    combined with W's operations and compared.
+    """
+
+    def __init__(self, num_samples: int = NUM_SAMPLES, chunk_size: int = CHUNK_SIZE):
+        """
+        Args:
+            num_samples: How many (u, v, k) samples to check.
+            chunk_size: How many samples to draw and map at a time.
+        """
+        self.num_samples = num_samples
+        self.chunk_size = chunk_size
+
+    @property
+    def condition_names(self) -> List[str]:
+        return [ADDITIVITY, HOMOGENEITY]
+
+    def execute(
+        self,
+        linear_map: LinearMap,
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executes the linearity check.
+
+        Args:
+            linear_map: The LinearMap domain instance (V, W and T).
+            on_progress: Optional callback notified after each condition.
+            cancel: Polled before every chunk.
+
+        Returns:
+            A dictionary with "is_linear", the "failures" (one per
+            violated condition, with its first counterexample), and the
+            "method": "matrix" if T is given by a matrix (evaluated as
+            one matrix product per chunk), "sampling" otherwise.
+
+        Raises:
+            CheckCancelledError: If 'cancel' was cancelled; its
+                                 'axioms_skipped' counts the conditions
+                                 left undecided.
+        """
+        failures: Dict[str, str] = {}
+        try:
+            draws = linear_map.source.element_provider.stream(
+                self.num_samples, 2, 1, self.chunk_size
+            )
+            for elements, scalars in draws:
+                if cancel is not None:
+                    cancel.raise_if_cancelled()
+                self._check_chunk(linear_map, elements, scalars, failures)
+                if len(failures) == len(self.condition_names):
+                    break
+        except CheckCancelledError as e:
+            e.axioms_skipped = len(self.condition_names) - len(failures)
+            raise
+        except Exception as e:
+            for name in self.condition_names:
+                failures.setdefault(name, f"Unexpected error during check: {e}")
+
+        total = len(self.condition_names)
+        if on_progress is not None:
+            for done, name in enumerate(self.condition_names, start=1):
+                on_progress(name, done, total)
+
+        return {
+            "is_linear": not failures,
+            "failures": [
+                {"axiom": name, "reason": failures[name]}
+                for name in self.condition_names if name in failures
+            ],
+            "method": "matrix" if isinstance(linear_map.mapping, IMatrixMapPort) else "sampling",
+        }
+
+    def _check_chunk(
+        self,
+        linear_map: LinearMap,
+        elements: Sequence[AlgebraicElement],
+        scalars: Sequence[Scalar],
+        failures: Dict[str, str],
+    ) -> None:
+        """
+        Checks one chunk of samples (sample i is elements[i], elements[n + i]
+        and scalars[i]), recording the first violation of each condition.
+        """
+        source, target = linear_map.source, linear_map.target
+        count = len(scalars)
+        us, vs = elements[:count], elements[count:2 * count]
+
+        sums = [source.addition.execute(u, v) for u, v in zip(us, vs)]
+        scaled = [source.scalar_multiplication.execute(k, u) for k, u in zip(scalars, us)]
+        images = linear_map.mapping.execute_batch([*us, *vs, *sums, *scaled])
+        t_u, t_v = images[:count], images[count:2 * count]
+        t_sum, t_scaled = images[2 * count:3 * count], images[3 * count:]
+
+        for i in range(count):
+            u, v, k = us[i], vs[i], scalars[i]
+            if ADDITIVITY not in failures:
+                expected = target.addition.execute(t_u[i], t_v[i])
+                if t_sum[i] != expected:
+                    failures[ADDITIVITY] = (
+                        f"Failure: T({u} + {v}) resulted in '{t_sum[i]}', "
+                        f"but T({u}) + T({v}) resulted in '{expected}'."
+                    )
+            if HOMOGENEITY not in failures:
+                expected = target.scalar_multiplication.execute(k, t_u[i])
+                if t_scaled[i] != expected:
+                    failures[HOMOGENEITY] = (
+                        f"Failure: T({k} * {u}) resulted in '{t_scaled[i]}', "
+                        f"but {k} * T({u}) resulted in '{expected}'."
+                    )
@@ -0,0 +1,54 @@
+from typing import TypeVar, Generic, List, Dict, Any, Optional
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.NormedSpace import NormedSpace
+from .check_vector_space import CheckVectorSpaceUseCase, ProgressCallback
+from ..cancellation import CancellationToken
+from ..ports.axiom_checker import IAxiomCheckerPort
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckNormedSpaceUseCase(Generic[ET]):
+    """
+    Orchestrates the verification of a NormedSpace.
+
+    The parent space is taken to be a vector space already (check it
+    with `CheckVectorSpaceUseCase`), so only the norm axioms are run:
+    positive-definiteness, absolute homogeneity and the triangle
+    inequality, through the same orchestration as the vector space
+    axioms.
+    """
+
+    def __init__(self, norm_checkers: List[IAxiomCheckerPort[ET]]):
+        """
+        Injects the list of norm axiom checkers.
+
+        Args:
+            norm_checkers: A list of objects implementing
+                           the IAxiomCheckerPort interface.
+        """
+        self._runner = CheckVectorSpaceUseCase(axiom_checkers=norm_checkers)
+
+    def execute(
+        self,
+        space: NormedSpace[ET],
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executes the norm axioms.
+
+        Args:
+            space: The NormedSpace domain instance.
+            on_progress: Optional callback notified after each axiom.
+            cancel: Polled between axioms and sample chunks; see
+                    `CheckVectorSpaceUseCase.execute`.
+
+        Returns:
+            A dictionary indicating success or listing failures.
+        """
+        result = self._runner.execute(space, on_progress=on_progress, cancel=cancel)
+        return {
+            "is_normed_space": result["is_vector_space"],
+            "failures": result["failures"],
+        }
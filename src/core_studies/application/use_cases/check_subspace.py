@@ -0,0 +1,53 @@
+from typing import TypeVar, Generic, List, Dict, Any, Optional
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.Subspace import Subspace
+from .check_vector_space import CheckVectorSpaceUseCase, ProgressCallback
+from ..cancellation import CancellationToken
+from ..ports.axiom_checker import IAxiomCheckerPort
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class CheckSubspaceUseCase(Generic[ET]):
+    """
+    Orchestrates the verification of a Subspace.
+
+    A subset of a known vector space only needs the three subspace
+    conditions (zero element, closure under addition, closure under
+    scalar multiplication) instead of all ten axioms, so the injected
+    checkers are expected to be exactly those three.
+    """
+
+    def __init__(self, subspace_checkers: List[IAxiomCheckerPort[ET]]):
+        """
+        Injects the list of subspace condition checkers.
+
+        Args:
+            subspace_checkers: A list of objects implementing
+                               the IAxiomCheckerPort interface.
+        """
+        self._runner = CheckVectorSpaceUseCase(axiom_checkers=subspace_checkers)
+
+    def execute(
+        self,
+        subspace: Subspace[ET],
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executes the subspace test.
+
+        Args:
+            subspace: The Subspace domain instance (subset + parent space).
+            on_progress: Optional callback notified after each condition.
+            cancel: Polled between conditions and sample chunks; see
+                    `CheckVectorSpaceUseCase.execute`.
+
+        Returns:
+            A dictionary indicating success or listing failures.
+        """
+        result = self._runner.execute(subspace, on_progress=on_progress, cancel=cancel)
+        return {
+            "is_subspace": result["is_vector_space"],
+            "failures": result["failures"],
+        }
@@ -1,11 +1,30 @@
-from typing import TypeVar, Generic, List, Dict, Any
+import time
+from typing import TypeVar, Generic, List, Dict, Any, Callable, Optional, Sequence
 from core_studies.domain.entities.Element import AlgebraicElement
 from core_studies.domain.entities.VectorSpace import VectorSpace
 from core_studies.domain.errors.exceptions import AxiomFailedError
+from ..cancellation import CancellationToken, CheckCancelledError
+from ..checkers.base import SampledAxiomChecker
+from ..checkers.fingerprint import space_fingerprints, verdict_key
 from ..ports.axiom_checker import IAxiomCheckerPort
+from ..ports.counterexample_corpus import Counterexample, ICounterexampleCorpusPort
+from ..ports.result_store import IResultStorePort
+from ..ports.verdict_cache import IVerdictCachePort
+from .run_history import build_run_record
 
 ET = TypeVar('ET', bound=AlgebraicElement)
 
+# Called after each checker with (axiom_name, checkers_done, checkers_total).
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def failure_rate_bound(samples: Optional[int]) -> Optional[float]:
+    """
+    95% upper confidence bound on the failure rate of an axiom that
+    passed 'samples' independent samples (the "rule of three", 3 / n).
+    """
+    return min(3.0 / samples, 1.0) if samples else None
+
 
 class CheckVectorSpaceUseCase(Generic[ET]):
     """
@@ -16,44 +35,242 @@ class CheckVectorSpaceUseCase(Generic[ET]):
     to the injected checkers.
     """
 
-    def __init__(self, axiom_checkers: List[IAxiomCheckerPort[ET]]): 
+    def __init__(
+        self,
+        axiom_checkers: List[IAxiomCheckerPort[ET]],
+        result_store: Optional[IResultStorePort] = None,
+        corpus: Optional[ICounterexampleCorpusPort] = None,
+        verdict_cache: Optional[IVerdictCachePort] = None,
+    ): 
         """
         Injects the list of axiom verification strategies.
 
         Args:
             axiom_checkers: A list of objects implementing
                             the IAxiomCheckerPort interface.
+            result_store: Where runs of a named recipe are recorded.
+            corpus: Past counterexamples of named recipes, replayed
+                    before sampling and extended with new failures.
+            verdict_cache: Where per-axiom verdicts are stored, keyed by
+                           the fingerprints of what each axiom depends on.
         """
         self._checkers = axiom_checkers
+        self._result_store = result_store
+        self._corpus = corpus
+        self._verdict_cache = verdict_cache
+        # Measured seconds per sample of each axiom, used to split time
+        # budgets by cost.
+        self._sample_seconds: Dict[str, float] = {}
+
+    @property
+    def axiom_names(self) -> List[str]:
+        """Names of the axioms checked, in order."""
+        return [checker.axiom_name for checker in self._checkers]
 
-    def execute(self, space: VectorSpace[ET]) -> Dict[str, Any]: 
+    def execute(
+        self,
+        space: VectorSpace[ET],
+        on_progress: Optional[ProgressCallback] = None,
+        recipe: Optional[str] = None,
+        seed: Optional[int] = None,
+        incremental: bool = False,
+        time_budget: Optional[float] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]: 
         """
         Executes the full verification of the vector space.
 
         Args:
             space: The VectorSpace domain instance to be tested.
+            on_progress: Optional callback notified after each axiom.
+            recipe: The recipe name 'space' was built from. When given,
+                    its stored counterexamples are replayed first, and
+                    the run is recorded if a result store is configured.
+            seed: The random seed of the run, recorded alongside it.
+            incremental: Reuse the cached verdict of every axiom whose
+                         checker and adapters are unchanged, and check
+                         only the others. The result then lists the
+                         axioms it did not re-run under "reused".
+            time_budget: Seconds the check may take. Sampled axioms then
+                         draw as many samples as fit instead of their
+                         usual count, each within a share of the budget
+                         weighted by its cost per sample; the result
+                         lists under "axioms" how many samples each one
+                         checked and the failure rate that still rules
+                         out. Budgeted verdicts are not cached. An axiom
+                         that got no sample in time is not passed: it is
+                         listed under "unverified", "is_vector_space" is
+                         then None (unless another axiom failed) and the
+                         run is not recorded.
+            cancel: Polled before every axiom and by sampled checkers
+                    between chunks. Once cancelled, the run stops with
+                    CheckCancelledError and nothing is recorded.
 
         Returns:
             A dictionary (our response DTO) indicating success or listing failures.
+
+        Raises:
+            CheckCancelledError: If 'cancel' was cancelled; its
+                                 'axioms_skipped' counts the axioms
+                                 left unverified.
         """
         failed_axioms: List[Dict[str, str]] = []
+        unverified: List[str] = []
+        axiom_seconds: Dict[str, float] = {}
+        reused: List[str] = []
+        coverage: List[Dict[str, Any]] = []
+        started = time.perf_counter()
+        deadline = started + time_budget if time_budget is not None else None
+        fingerprints = (
+            space_fingerprints(space) if self._verdict_cache is not None else None
+        )
+
+        total = len(self._checkers)
+        corpus = (
+            self._corpus.load(recipe, space.element_type)
+            if self._corpus is not None and recipe is not None else {}
+        )
+
+        for done, checker in enumerate(self._checkers, start=1):
+            key = verdict_key(checker, fingerprints) if fingerprints is not None else None
+            cached = self._verdict_cache.get(key) if key is not None and incremental else None
+            if cached is not None:
+                if not cached["passed"]:
+                    failed_axioms.append({"axiom": checker.axiom_name, "reason": cached["reason"]})
+                reused.append(checker.axiom_name)
+                if on_progress is not None:
+                    on_progress(checker.axiom_name, done, total)
+                continue
 
-        for checker in self._checkers:
+            failures_before = len(failed_axioms)
+            checker_started = time.perf_counter()
+            samples: Optional[int] = None
             try:
-                checker.check(space)
+                if cancel is not None:
+                    cancel.raise_if_cancelled()
+                if deadline is not None and isinstance(checker, SampledAxiomChecker):
+                    share = self._share(deadline, self._checkers[done - 1:])
+                    if time.perf_counter() < share:
+                        self._replay(checker, space, corpus.get(checker.axiom_name, ()))
+                        samples = checker.check_within(space, share, cancel=cancel)
+                    else:
+                        samples = 0
+                    if samples == 0:
+                        unverified.append(checker.axiom_name)
+                elif isinstance(checker, SampledAxiomChecker):
+                    self._replay(checker, space, corpus.get(checker.axiom_name, ()))
+                    checker.check(space, cancel)
+                else:
+                    checker.check(space)
 
+            except CheckCancelledError as e:
+                e.axioms_skipped = total - done + 1
+                raise
             except AxiomFailedError as e:
+                if checker.axiom_name in unverified:
+                    unverified.remove(checker.axiom_name)
                 failed_axioms.append({
                     "axiom": checker.axiom_name,
                     "reason": str(e)
                 })
+                if self._corpus is not None and recipe is not None and e.elements is not None:
+                    self._corpus.add(recipe, checker.axiom_name, e.elements, e.scalars or [])
             except Exception as e:
+                if checker.axiom_name in unverified:
+                    unverified.remove(checker.axiom_name)
                 failed_axioms.append({
                     "axiom": checker.axiom_name,
                     "reason": f"Unexpected error during check: {e}"
                 })
 
+            axiom_seconds[checker.axiom_name] = time.perf_counter() - checker_started
+
+            if deadline is not None:
+                if samples:
+                    self._sample_seconds[checker.axiom_name] = (
+                        axiom_seconds[checker.axiom_name] / samples
+                    )
+                coverage.append({
+                    "axiom": checker.axiom_name,
+                    "samples": samples,
+                    "seconds": axiom_seconds[checker.axiom_name],
+                    "failure_rate_bound": (
+                        failure_rate_bound(samples)
+                        if len(failed_axioms) == failures_before else None
+                    ),
+                })
+            elif key is not None:
+                failed = len(failed_axioms) > failures_before
+                self._verdict_cache.put(key, {
+                    "passed": not failed,
+                    "reason": failed_axioms[-1]["reason"] if failed else None,
+                })
+
+            if on_progress is not None:
+                on_progress(checker.axiom_name, done, total)
+
         if failed_axioms:
-            return {"is_vector_space": False, "failures": failed_axioms}
+            result = {"is_vector_space": False, "failures": failed_axioms}
+        elif unverified:
+            result = {"is_vector_space": None, "failures": []}
+        else:
+            result = {"is_vector_space": True, "failures": []}
+        if incremental:
+            result["reused"] = reused
+        if deadline is not None:
+            result["axioms"] = coverage
+        if unverified:
+            result["unverified"] = unverified
+
+        if self._result_store is not None and recipe is not None and not unverified:
+            self._result_store.save_run(build_run_record(
+                recipe,
+                space,
+                result,
+                self.axiom_names,
+                seconds=time.perf_counter() - started,
+                seed=seed,
+                samples=(
+                    getattr(self._checkers[0], "num_samples", None)
+                    if self._checkers and deadline is None else None
+                ),
+                axiom_seconds=axiom_seconds,
+            ))
+
+        return result
+
+    def _share(self, deadline: float, pending: Sequence[IAxiomCheckerPort[ET]]) -> float:
+        """
+        The deadline of the first of the 'pending' checkers: its share
+        of the time left, weighted by cost per sample. Costs measured in
+        earlier budgeted runs are used once every pending axiom has one;
+        until then a sample's size (elements + scalars) stands in.
+        Time a checker leaves unused goes to the ones after it.
+        """
+        sampled = [c for c in pending if isinstance(c, SampledAxiomChecker)]
+        if all(c.axiom_name in self._sample_seconds for c in sampled):
+            weights = [self._sample_seconds[c.axiom_name] for c in sampled]
+        else:
+            weights = [c.element_arity + c.scalar_arity for c in sampled]
+        now = time.perf_counter()
+        return now + max(deadline - now, 0.0) * weights[0] / sum(weights)
 
-        return {"is_vector_space": True, "failures": []}
+    def _replay(
+        self,
+        checker: IAxiomCheckerPort[ET],
+        space: VectorSpace[ET],
+        counterexamples: Sequence[Counterexample],
+    ) -> None:
+        """
+        Re-checks inputs that failed before, so a known failure is found
+        again without drawing a single random sample.
+        """
+        if not isinstance(checker, SampledAxiomChecker):
+            return
+        for elements, scalars in counterexamples:
+            try:
+                checker.check_sample(space, elements, scalars)
+            except AxiomFailedError as e:
+                if e.elements is None:
+                    e.elements, e.scalars = elements, scalars
+                raise
@@ -0,0 +1,229 @@
+import threading
+import weakref
+from typing import Any, Dict, Generic, List, NamedTuple, Optional, Sequence, TypeVar
+
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.Subspace import Subspace
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import NotAVectorSpaceError
+from ..cancellation import CancellationToken
+from ..checkers.base import CHUNK_SIZE
+from ..checkers.coordinates import coordinate_names, to_coordinates
+from ..linalg.echelon import RANK_TOLERANCE, EchelonBasis
+from .check_subspace import CheckSubspaceUseCase
+from .prove_vector_space import ProveVectorSpaceUseCase
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+# Sample elements drawn to find the dimension of a space. A random
+# sample of a d-dimensional space is independent of d - 1 others with
+# probability one, so a few dozen are plenty for small spaces.
+DIMENSION_SAMPLES = 64
+# Samples per condition the injected checks should run with. A subset
+# can only be sampled, so its verdict and span are not cached, and a
+# space whose check needed sampling is not trusted on a few samples.
+VERIFY_SAMPLES = 1000
+
+
+class _Verdict(NamedTuple):
+    """
+    Why a space is not a vector space ('refusal'), or None if it passed
+    its check; and whether that is certain ('proven'): a failure is a
+    counterexample, but a pass is only proven if every axiom was.
+    """
+    refusal: Optional[str]
+    proven: bool = True
+
+
+class LinearAlgebraUseCase(Generic[ET]):
+    """
+    Answers dimension, basis and span questions about a VectorSpace
+    through the coordinate view of its elements.
+
+    The span of a space is estimated from sample elements that belong
+    to it (as decided by its validator): they are added one at a time to
+    an `EchelonBasis` until it has every coordinate direction or the
+    sample budget runs out.
+
+    Dimensions and spans only exist in a vector space, so before its
+    span is estimated a space is checked with the injected use cases:
+    a space against the axioms (symbolically where its adapters allow
+    it), a subset with the subspace test (and its parent against the
+    axioms). A structure that fails is refused with
+    NotAVectorSpaceError, and the refusal is cached. A pass is cached,
+    with the span, only if every axiom was proven symbolically, so that
+    later queries on the space only reduce the candidates they are
+    given; a structure that was only sampled is checked and spanned
+    again on every query.
+    """
+
+    def __init__(
+        self,
+        space_check: Optional[ProveVectorSpaceUseCase[ET]] = None,
+        subspace_check: Optional[CheckSubspaceUseCase[ET]] = None,
+        num_samples: int = DIMENSION_SAMPLES,
+        tolerance: float = RANK_TOLERANCE,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """
+        Args:
+            space_check: Decides whether a space is a vector space; if
+                         None, spaces are taken to be (proven) vector
+                         spaces.
+            subspace_check: Decides whether a subset is a subspace; if
+                            None, subsets are taken to be subspaces.
+            num_samples: Sample elements drawn per space for its span.
+            tolerance: Relative size under which float coordinates count
+                       as zero during elimination.
+            chunk_size: How many sample elements to draw at a time.
+        """
+        self.space_check = space_check
+        self.subspace_check = subspace_check
+        self.num_samples = num_samples
+        self.tolerance = tolerance
+        self.chunk_size = chunk_size
+        self._spans: "weakref.WeakKeyDictionary[VectorSpace[Any], EchelonBasis]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._verdicts: "weakref.WeakKeyDictionary[VectorSpace[Any], _Verdict]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def basis(
+        self, space: VectorSpace[ET], cancel: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        'cancel' is passed to the space's check and polled between
+        sample chunks.
+
+        Returns:
+            The "dimension" of the space, its "ambient_dimension" (number
+            of coordinates), and a "basis": the reduced echelon form of
+            its span, one coordinate list per basis vector.
+
+        Raises:
+            NotAVectorSpaceError: If the space fails its check.
+            CheckCancelledError: If 'cancel' was cancelled.
+        """
+        span = self._span(space, cancel)
+        return {
+            "dimension": span.rank,
+            "ambient_dimension": span.dimension,
+            "basis": span.rows(),
+        }
+
+    def analyze(
+        self,
+        space: VectorSpace[ET],
+        elements: Sequence[ET],
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """
+        Tells whether 'elements' are linearly independent and whether
+        they span 'space'. Thousands of candidates are fine: each one is
+        reduced against the independent candidates found before it.
+        'cancel' is polled like in `basis`, and every 'chunk_size'
+        candidates.
+
+        Returns:
+            "rank" of the candidates, "dimension" of the space,
+            "independent" (rank == number of candidates), "spans" (every
+            candidate is in the space and together they span it),
+            "independent_indices" (a maximal independent subset, in
+            order) and "outside" (indices of candidates the space's
+            validator rejects).
+
+        Raises:
+            NotAVectorSpaceError: If the space fails its check.
+            CheckCancelledError: If 'cancel' was cancelled.
+        """
+        span = self._span(space, cancel)
+        candidates = EchelonBasis(span.dimension, self.tolerance)
+        independent: List[int] = []
+        outside: List[int] = []
+
+        for index, element in enumerate(elements):
+            if cancel is not None and index % self.chunk_size == 0:
+                cancel.raise_if_cancelled()
+            if not space.validator.validate(element):
+                outside.append(index)
+            if candidates.add(to_coordinates(element)):
+                independent.append(index)
+
+        spans = (
+            not outside
+            and candidates.rank == span.rank
+            and all(candidates.contains(row) for row in span.rows())
+        )
+        return {
+            "rank": candidates.rank,
+            "dimension": span.rank,
+            "independent": candidates.rank == len(elements),
+            "spans": spans,
+            "independent_indices": independent,
+            "outside": outside,
+        }
+
+    def _span(
+        self, space: VectorSpace[ET], cancel: Optional[CancellationToken]
+    ) -> EchelonBasis:
+        """
+        The echelon basis of the space's sample elements, cached if the
+        space was proven to be a vector space.
+        """
+        with self._lock:
+            span = self._spans.get(space)
+            verdict = self._verdicts.get(space)
+        if span is not None:
+            return span
+        if verdict is None:
+            verdict = self._verdict(space, cancel)
+            if verdict.proven:
+                with self._lock:
+                    self._verdicts[space] = verdict
+        if verdict.refusal is not None:
+            raise NotAVectorSpaceError(verdict.refusal)
+
+        span = EchelonBasis(len(coordinate_names(space.element_type)), self.tolerance)
+        drawn = 0
+        while drawn < self.num_samples and not span.is_full:
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            count = min(self.chunk_size, self.num_samples - drawn)
+            for element in space.element_provider.get_elements(count):
+                if space.validator.validate(element):
+                    span.add(to_coordinates(element))
+                    if span.is_full:
+                        break
+            drawn += count
+
+        if verdict.proven:
+            with self._lock:
+                self._spans[space] = span
+        return span
+
+    def _verdict(
+        self, space: VectorSpace[ET], cancel: Optional[CancellationToken]
+    ) -> _Verdict:
+        """Whether 'space' is a vector space, and how surely."""
+        if isinstance(space, Subspace):
+            parent = self._verdict(space.parent, cancel)
+            if parent.refusal is not None:
+                return _Verdict(f"Its parent space is not a vector space. {parent.refusal}")
+            if self.subspace_check is None:
+                return parent
+            result = self.subspace_check.execute(space, cancel=cancel)
+            kind, passed = "a subspace", result["is_subspace"]
+        else:
+            if self.space_check is None:
+                return _Verdict(None)
+            result = self.space_check.execute(space, cancel=cancel)
+            kind, passed = "a vector space", result["is_vector_space"]
+        if passed:
+            methods = result.get("methods")
+            return _Verdict(None, proven=bool(methods) and all(
+                method["method"] == "symbolic" for method in methods
+            ))
+        failed = "; ".join(failure["axiom"] for failure in result["failures"])
+        return _Verdict(f"Not {kind}: {failed} failed.")
@@ -0,0 +1,102 @@
+from typing import TypeVar, Generic, List, Dict, Any, Optional
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import AxiomFailedError
+from ..cancellation import CancellationToken, CheckCancelledError
+from ..checkers.base import SampledAxiomChecker
+from ..ports.axiom_checker import IAxiomCheckerPort
+from ..symbolic.prover import SymbolicProver, PROVED, REFUTED
+from .check_vector_space import ProgressCallback
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class ProveVectorSpaceUseCase(Generic[ET]):
+    """
+    Verifies a VectorSpace exactly where possible.
+
+    Each axiom is first checked symbolically (see SymbolicProver),
+    which settles it for every input in a few milliseconds when the
+    adapters are polynomial. Only axioms involving opaque adapters fall
+    back to the checker's ordinary random sampling.
+    """
+
+    def __init__(
+        self,
+        axiom_checkers: List[IAxiomCheckerPort[ET]],
+        prover: Optional[SymbolicProver] = None,
+    ):
+        """
+        Args:
+            axiom_checkers: A list of objects implementing
+                            the IAxiomCheckerPort interface.
+            prover: The symbolic prover (a default one if omitted).
+        """
+        self._checkers = axiom_checkers
+        self._prover = prover if prover is not None else SymbolicProver()
+
+    def execute(
+        self,
+        space: VectorSpace[ET],
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executes the verification of the vector space. 'cancel' is
+        polled before every axiom and while sampling.
+
+        Returns:
+            The same DTO as CheckVectorSpaceUseCase, plus "methods":
+            for each axiom, whether it was settled "symbolic"-ally or
+            by "sampling".
+
+        Raises:
+            CheckCancelledError: If 'cancel' was cancelled; its
+                                 'axioms_skipped' counts the axioms
+                                 left unverified.
+        """
+        failed_axioms: List[Dict[str, str]] = []
+        methods: List[Dict[str, str]] = []
+        total = len(self._checkers)
+
+        for done, checker in enumerate(self._checkers, start=1):
+            if cancel is not None and cancel.cancelled:
+                raise CheckCancelledError(axioms_skipped=total - done + 1)
+            verdict, reason = None, None
+            if isinstance(checker, SampledAxiomChecker):
+                verdict, reason = self._prover.prove(checker, space)
+
+            if verdict == PROVED:
+                methods.append({"axiom": checker.axiom_name, "method": "symbolic"})
+            elif verdict == REFUTED:
+                methods.append({"axiom": checker.axiom_name, "method": "symbolic"})
+                failed_axioms.append({"axiom": checker.axiom_name, "reason": reason or ""})
+            else:
+                methods.append({"axiom": checker.axiom_name, "method": "sampling"})
+                try:
+                    if isinstance(checker, SampledAxiomChecker):
+                        checker.check(space, cancel)
+                    else:
+                        checker.check(space)
+                except CheckCancelledError as e:
+                    e.axioms_skipped = total - done + 1
+                    raise
+                except AxiomFailedError as e:
+                    failed_axioms.append({
+                        "axiom": checker.axiom_name,
+                        "reason": str(e)
+                    })
+                except Exception as e:
+                    failed_axioms.append({
+                        "axiom": checker.axiom_name,
+                        "reason": f"Unexpected error during check: {e}"
+                    })
+
+            if on_progress is not None:
+                on_progress(checker.axiom_name, done, total)
+
+        return {
+            "is_vector_space": not failed_axioms,
+            "failures": failed_axioms,
+            "methods": methods,
+        }
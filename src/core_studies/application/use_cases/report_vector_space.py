@@ -0,0 +1,160 @@
+import copy
+from array import array
+from typing import TypeVar, Generic, List, Dict, Any, Mapping, Optional, Sequence
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import AxiomFailedError
+from core_studies.domain.ports.Provider import IElementProviderPort
+from ..cancellation import CancellationToken, CheckCancelledError
+from ..checkers.base import SampledAxiomChecker, TOLERANCE, residual_statistics
+from ..ports.axiom_checker import IAxiomCheckerPort
+from ..ports.sample_sink import ISampleSinkPort
+from .check_vector_space import ProgressCallback
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class ReportVectorSpaceUseCase(Generic[ET]):
+    """
+    Builds a quantitative report of a VectorSpace.
+
+    Instead of stopping at the first mismatch, every sampled checker
+    measures the residual |LHS - RHS| on its whole batch and the report
+    lists, per axiom, the max, mean and p99 residual and how many samples
+    exceed the tolerance. Checkers that cannot measure residuals are run
+    as a plain pass/fail check.
+    """
+
+    def __init__(self, axiom_checkers: List[IAxiomCheckerPort[ET]]):
+        """
+        Args:
+            axiom_checkers: A list of objects implementing
+                            the IAxiomCheckerPort interface.
+        """
+        self._checkers = axiom_checkers
+
+    @property
+    def sampled_axioms(self) -> List[str]:
+        """Names of the axioms whose residuals are measured, in order."""
+        return [c.axiom_name for c in self._checkers if isinstance(c, SampledAxiomChecker)]
+
+    def residuals(self, space: VectorSpace[ET], axiom: str) -> array:
+        """
+        Measures the residuals of one of the `sampled_axioms` without
+        summarising them, e.g. for a worker process whose share of the
+        samples is summarised together with the others'.
+
+        Raises:
+            ValueError: If 'axiom' is not one of the sampled axioms.
+        """
+        for checker in self._checkers:
+            if checker.axiom_name == axiom and isinstance(checker, SampledAxiomChecker):
+                return checker.residuals(space)
+        raise ValueError(f"No sampled checker for axiom '{axiom}'")
+
+    def execute(
+        self,
+        space: VectorSpace[ET],
+        tolerance: float = TOLERANCE,
+        on_progress: Optional[ProgressCallback] = None,
+        sink: Optional[ISampleSinkPort] = None,
+        element_providers: Optional[Mapping[str, IElementProviderPort[ET]]] = None,
+        residuals: Optional[Mapping[str, Sequence[float]]] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """
+        Args:
+            space: The VectorSpace domain instance to be measured.
+            tolerance: Residual above which a sample counts as a failure.
+            on_progress: Optional callback notified after each axiom.
+            sink: Receives every sample with its residual and verdict,
+                  chunk by chunk (e.g. to export the run).
+            element_providers: Per-axiom providers that replace the
+                               space's own (e.g. to replay an export).
+            residuals: Residuals already measured elsewhere, per axiom
+                       (e.g. by worker processes); those axioms are
+                       summarised instead of sampled again.
+            cancel: Polled before every axiom and by sampled checkers
+                    between chunks.
+
+        Returns:
+            The usual "is_vector_space"/"failures" DTO plus one entry per
+            axiom under "axioms" with its residual statistics.
+
+        Raises:
+            CheckCancelledError: If 'cancel' was cancelled; its
+                                 'axioms_skipped' counts the axioms
+                                 left unmeasured.
+        """
+        failed_axioms: List[Dict[str, str]] = []
+        axioms: List[Dict[str, Any]] = []
+
+        total = len(self._checkers)
+
+        for done, checker in enumerate(self._checkers, start=1):
+            measured = space
+            if element_providers and checker.axiom_name in element_providers:
+                measured = copy.copy(space)
+                measured.element_provider = element_providers[checker.axiom_name]
+
+            try:
+                if cancel is not None:
+                    cancel.raise_if_cancelled()
+                if residuals is not None and checker.axiom_name in residuals:
+                    stats = residual_statistics(residuals[checker.axiom_name], tolerance)
+                elif isinstance(checker, SampledAxiomChecker):
+                    stats = checker.report(measured, tolerance, sink, cancel)
+                else:
+                    stats = self._plain_check(checker, measured, failed_axioms)
+            except CheckCancelledError as e:
+                e.axioms_skipped = total - done + 1
+                raise
+
+            if stats["samples"] is not None and stats["over_tolerance"]:
+                failed_axioms.append({
+                    "axiom": checker.axiom_name,
+                    "reason": (
+                        f"{stats['over_tolerance']} of {stats['samples']} samples "
+                        f"exceed tolerance {tolerance} "
+                        f"({stats['non_finite']} with an infinite residual)"
+                    ),
+                })
+
+            axioms.append({"axiom": checker.axiom_name, **stats})
+
+            if on_progress is not None:
+                on_progress(checker.axiom_name, done, total)
+
+        return {
+            "is_vector_space": not failed_axioms,
+            "failures": failed_axioms,
+            "axioms": axioms,
+        }
+
+    def _plain_check(
+        self,
+        checker: IAxiomCheckerPort[ET],
+        space: VectorSpace[ET],
+        failed_axioms: List[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        try:
+            checker.check(space)
+            failed = False
+        except AxiomFailedError as e:
+            failed_axioms.append({"axiom": checker.axiom_name, "reason": str(e)})
+            failed = True
+        except Exception as e:
+            failed_axioms.append({
+                "axiom": checker.axiom_name,
+                "reason": f"Unexpected error during check: {e}"
+            })
+            failed = True
+
+        return {
+            "samples": None,
+            "max": None,
+            "mean": None,
+            "p99": None,
+            "non_finite": None,
+            "over_tolerance": int(failed),
+        }
@@ -0,0 +1,158 @@
+import hashlib
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from ..checkers.fingerprint import space_fingerprints
+from ..ports.result_store import IResultStorePort, RunRecord
+
+
+def recipe_hash(space: VectorSpace[Any]) -> str:
+    """
+    Identifies what a space is made of: a short hash of the fingerprints
+    (code plus configuration) of its element type and adapters. Two runs
+    with the same hash tested the same code.
+    """
+    fingerprints = space_fingerprints(space)
+    parts = [f"{name}={fingerprint}" for name, fingerprint in sorted(fingerprints.items())]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def build_run_record(
+    recipe: str,
+    space: VectorSpace[Any],
+    result: Dict[str, Any],
+    axiom_names: Sequence[str],
+    seconds: float,
+    seed: Optional[int] = None,
+    samples: Optional[int] = None,
+    axiom_seconds: Optional[Dict[str, float]] = None,
+) -> RunRecord:
+    """
+    Turns a use case result ({"is_vector_space", "failures"}) into the
+    record stored by an IResultStorePort: one outcome per axiom in
+    'axiom_names', with the failure reason for those that failed.
+    """
+    reasons = {failure["axiom"]: failure["reason"] for failure in result["failures"]}
+    axiom_seconds = axiom_seconds or {}
+    return {
+        "recipe": recipe,
+        "recipe_hash": recipe_hash(space),
+        "seed": seed,
+        "samples": samples,
+        "passed": not reasons,
+        "seconds": seconds,
+        "created_at": time.time(),
+        "axioms": [
+            {
+                "axiom": name,
+                "passed": name not in reasons,
+                "seconds": axiom_seconds.get(name),
+                "reason": reasons.get(name),
+            }
+            for name in axiom_names
+        ],
+    }
+
+
+class RunHistoryUseCase:
+    """
+    Answers questions about past runs kept in an IResultStorePort: how a
+    recipe has behaved over time, and what changed between two runs.
+    """
+
+    def __init__(self, result_store: IResultStorePort):
+        self._store = result_store
+
+    def history(self, recipe: str, limit: int = 50) -> List[RunRecord]:
+        """Returns the latest runs of a recipe, newest first."""
+        return self._store.history(recipe, limit)
+
+    def get_run(self, run_id: int) -> RunRecord:
+        """
+        Raises:
+            ValueError: If no run has that id.
+        """
+        run = self._store.get_run(run_id)
+        if run is None:
+            raise ValueError(f"Unknown run: {run_id}")
+        return run
+
+    def trend(self, recipe: str, limit: int = 50) -> Dict[str, Any]:
+        """
+        Summarises the latest 'limit' runs of a recipe: the verdict and
+        duration of each run (oldest first), and per axiom how often it
+        failed and its mean duration.
+        """
+        runs = list(reversed(self._store.history(recipe, limit)))
+
+        axioms: Dict[str, Dict[str, Any]] = {}
+        for run in runs:
+            for outcome in run["axioms"]:
+                stats = axioms.setdefault(
+                    outcome["axiom"], {"axiom": outcome["axiom"], "runs": 0, "failures": 0, "_seconds": []}
+                )
+                stats["runs"] += 1
+                stats["failures"] += not outcome["passed"]
+                if outcome["seconds"] is not None:
+                    stats["_seconds"].append(outcome["seconds"])
+
+        for stats in axioms.values():
+            durations = stats.pop("_seconds")
+            stats["failure_rate"] = stats["failures"] / stats["runs"]
+            stats["mean_seconds"] = sum(durations) / len(durations) if durations else None
+
+        return {
+            "recipe": recipe,
+            "runs": [
+                {
+                    "id": run["id"],
+                    "created_at": run["created_at"],
+                    "recipe_hash": run["recipe_hash"],
+                    "passed": run["passed"],
+                    "seconds": run["seconds"],
+                }
+                for run in runs
+            ],
+            "axioms": list(axioms.values()),
+        }
+
+    def diff(self, base_id: int, head_id: int) -> Dict[str, Any]:
+        """
+        Compares two runs axiom by axiom: which axioms regressed (passed
+        in 'base', fail in 'head'), which were fixed, which still fail,
+        and how each axiom's duration changed.
+
+        Raises:
+            ValueError: If either run does not exist.
+        """
+        base, head = self.get_run(base_id), self.get_run(head_id)
+        base_axioms = {outcome["axiom"]: outcome for outcome in base["axioms"]}
+        head_axioms = {outcome["axiom"]: outcome for outcome in head["axioms"]}
+
+        regressed, fixed, still_failing = [], [], []
+        timing: Dict[str, Optional[float]] = {}
+        for name, after in head_axioms.items():
+            before = base_axioms.get(name)
+            if before is None:
+                continue
+            if before["passed"] and not after["passed"]:
+                regressed.append({"axiom": name, "reason": after["reason"]})
+            elif not before["passed"] and after["passed"]:
+                fixed.append(name)
+            elif not after["passed"]:
+                still_failing.append(name)
+            if before["seconds"] is not None and after["seconds"] is not None:
+                timing[name] = after["seconds"] - before["seconds"]
+
+        return {
+            "base": base_id,
+            "head": head_id,
+            "same_recipe": base["recipe_hash"] == head["recipe_hash"],
+            "regressed": regressed,
+            "fixed": fixed,
+            "still_failing": still_failing,
+            "added": [name for name in head_axioms if name not in base_axioms],
+            "removed": [name for name in base_axioms if name not in head_axioms],
+            "seconds_delta": timing,
+        }
@@ -0,0 +1,294 @@
+import math
+import random
+import time
+from fractions import Fraction
+from typing import TypeVar, Generic, List, Dict, Any, Optional, Sequence, Tuple
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.entities.VectorSpace import VectorSpace
+from core_studies.domain.errors.exceptions import AxiomFailedError
+from ..cancellation import CancellationToken, CheckCancelledError
+from ..checkers.base import SampledAxiomChecker
+from ..checkers.coordinates import coordinate_names, to_coordinates, from_coordinates
+from ..ports.axiom_checker import IAxiomCheckerPort
+from .check_vector_space import ProgressCallback
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+# A candidate sample: (flattened element coordinates + scalars, residual).
+Candidate = Tuple[List[float], float]
+
+
+class SearchCounterexampleUseCase(Generic[ET]):
+    """
+    Searches adaptively for counterexamples instead of sampling uniformly.
+
+    For each axiom it runs the cross-entropy method over the sample's
+    coordinates and scalars: evaluate a batch, keep the elite samples
+    with the largest residual |left - right|, refit a Gaussian to them
+    and draw the next batch from it. Samples therefore concentrate
+    where the axiom is closest to breaking, which finds subtle failures
+    far sooner than uniform sampling with the same budget.
+    """
+
+    def __init__(
+        self,
+        axiom_checkers: List[IAxiomCheckerPort[ET]],
+        batch_size: int = 64,
+        elite_fraction: float = 0.2,
+        fresh_fraction: float = 0.2,
+        smoothing: float = 0.7,
+    ):
+        """
+        Args:
+            axiom_checkers: The checkers whose axioms are searched.
+            batch_size: Samples evaluated per iteration.
+            elite_fraction: Share of each batch used to refit the Gaussian.
+            fresh_fraction: Share of each batch drawn from the space's
+                            own provider, so the search never collapses.
+            smoothing: Weight of the new fit vs. the previous one.
+        """
+        self._checkers = axiom_checkers
+        self._batch_size = batch_size
+        self._elite_count = max(2, int(batch_size * elite_fraction))
+        self._fresh_count = int(batch_size * fresh_fraction)
+        self._smoothing = smoothing
+
+    def execute(
+        self,
+        space: VectorSpace[ET],
+        time_budget: float = 1.0,
+        residual_threshold: float = 1e-9,
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """
+        Searches every axiom until its share of 'time_budget' (seconds)
+        is spent or a sample with residual above 'residual_threshold'
+        is found. 'cancel' is polled before every batch.
+
+        Returns:
+            The usual DTO ("is_vector_space", "failures") plus "axioms":
+            per-axiom search statistics.
+
+        Raises:
+            CheckCancelledError: If 'cancel' was cancelled; its
+                                 'axioms_skipped' counts the axioms
+                                 left unsearched.
+        """
+        failed_axioms: List[Dict[str, str]] = []
+        stats: List[Dict[str, Any]] = []
+        total = len(self._checkers)
+        share = time_budget / max(1, total)
+
+        for done, checker in enumerate(self._checkers, start=1):
+            try:
+                if cancel is not None:
+                    cancel.raise_if_cancelled()
+                if isinstance(checker, SampledAxiomChecker):
+                    stat, reason = self._search(checker, space, share, residual_threshold, cancel)
+                else:
+                    stat, reason = self._plain_check(checker, space)
+            except CheckCancelledError as e:
+                e.axioms_skipped = total - done + 1
+                raise
+
+            stats.append(stat)
+            if reason is not None:
+                failed_axioms.append({"axiom": checker.axiom_name, "reason": reason})
+
+            if on_progress is not None:
+                on_progress(checker.axiom_name, done, total)
+
+        return {
+            "is_vector_space": not failed_axioms,
+            "failures": failed_axioms,
+            "axioms": stats,
+        }
+
+    def _search(
+        self,
+        checker: SampledAxiomChecker[ET],
+        space: VectorSpace[ET],
+        budget: float,
+        threshold: float,
+        cancel: Optional[CancellationToken] = None,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        started = time.perf_counter()
+        deadline = started + budget
+        evaluations = 0
+        best: Optional[Candidate] = None
+        mean: Optional[List[float]] = None
+        spread: Optional[List[float]] = None
+        # Which parameters are exact rationals; perturbed values are
+        # made exact again so that rational spaces stay exact.
+        exact: List[bool] = []
+
+        try:
+            dimension = len(coordinate_names(space.element_type))
+            adaptive = True
+        except TypeError:
+            dimension, adaptive = 0, False
+
+        while True:
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            fresh = self._batch_size if mean is None or not adaptive else self._fresh_count
+            batch = self._draw(checker, space, fresh, dimension, adaptive)
+            if batch and not exact:
+                exact = [isinstance(value, Fraction) for value in batch[0]]
+            if adaptive and mean is not None and spread is not None:
+                batch += [
+                    [
+                        Fraction(random.gauss(m, s)) if rational else random.gauss(m, s)
+                        for m, s, rational in zip(mean, spread, exact)
+                    ]
+                    for _ in range(self._batch_size - fresh)
+                ]
+
+            scored: List[Candidate] = []
+            for params in batch:
+                sample = self._unflatten(checker, space, params, dimension)
+                residual = checker.residual(space, *sample)
+                if residual != residual:  # NaN
+                    residual = math.inf
+                if residual > threshold and not self._fails(checker, space, sample):
+                    residual = 0.0  # within the element's own tolerance
+                scored.append((params, residual))
+                evaluations += 1
+                if best is None or residual > best[1]:
+                    best = (params, residual)
+                if best[1] > threshold or time.perf_counter() >= deadline:
+                    break
+
+            if best is not None and best[1] > threshold:
+                break
+            if time.perf_counter() >= deadline:
+                break
+
+            if adaptive:
+                elite = sorted(scored, key=lambda c: c[1], reverse=True)[:self._elite_count]
+                mean, spread = self._refit(elite, mean, spread)
+
+        stat: Dict[str, Any] = {
+            "axiom": checker.axiom_name,
+            "counterexample_found": best is not None and best[1] > threshold,
+            # None stands for an infinite residual (failed operation or
+            # a result outside the set), which JSON cannot represent.
+            "max_residual": (best[1] if math.isfinite(best[1]) else None) if best is not None else 0.0,
+            "evaluations": evaluations,
+            "adaptive": adaptive,
+            "seconds": round(time.perf_counter() - started, 6),
+        }
+        if not stat["counterexample_found"] or best is None:
+            return stat, None
+
+        elements, scalars = self._unflatten(checker, space, best[0], dimension)
+        stat["counterexample"] = {
+            "elements": [repr(e) for e in elements],
+            "scalars": [str(k) if isinstance(k, Fraction) else k for k in scalars],
+        }
+        try:
+            checker.check_sample(space, elements, scalars)
+            reason = f"Residual {best[1]:.3g} above threshold {threshold:.3g}."
+        except AxiomFailedError as e:
+            reason = str(e)
+        except Exception as e:
+            reason = f"Unexpected error during check: {e}"
+        return stat, reason
+
+    def _fails(
+        self,
+        checker: SampledAxiomChecker[ET],
+        space: VectorSpace[ET],
+        sample: Tuple[List[ET], List[float]],
+    ) -> bool:
+        """Confirms a suspicious sample with the checker's own comparison."""
+        try:
+            checker.check_sample(space, *sample)
+        except Exception:
+            return True
+        return False
+
+    def _plain_check(
+        self, checker: IAxiomCheckerPort[ET], space: VectorSpace[ET]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Checkers without samples to search over are run as usual."""
+        reason = None
+        try:
+            checker.check(space)
+        except AxiomFailedError as e:
+            reason = str(e)
+        except Exception as e:
+            reason = f"Unexpected error during check: {e}"
+        stat = {
+            "axiom": checker.axiom_name,
+            "counterexample_found": reason is not None,
+            "adaptive": False,
+        }
+        return stat, reason
+
+    def _draw(
+        self,
+        checker: SampledAxiomChecker[ET],
+        space: VectorSpace[ET],
+        count: int,
+        dimension: int,
+        adaptive: bool,
+    ) -> List[List[Any]]:
+        """
+        Draws 'count' flattened samples from the space's own provider,
+        keeping coordinates and scalars as drawn (e.g. exact rationals).
+        """
+        elements = space.element_provider.get_elements(count * checker.element_arity)
+        scalars = (
+            space.element_provider.get_scalars(count * checker.scalar_arity)
+            if checker.scalar_arity else []
+        )
+        batch: List[List[Any]] = []
+        for i in range(count):
+            sample_elements = elements[i::count]
+            params: List[Any] = []
+            for element in sample_elements:
+                params += list(to_coordinates(element)) if adaptive else [element]
+            params += scalars[i::count]
+            batch.append(params)
+        return batch
+
+    def _unflatten(
+        self,
+        checker: SampledAxiomChecker[ET],
+        space: VectorSpace[ET],
+        params: Sequence[Any],
+        dimension: int,
+    ) -> Tuple[List[ET], List[float]]:
+        if dimension == 0:
+            elements = list(params[:checker.element_arity])
+        else:
+            elements = [
+                from_coordinates(space.element_type, params[i * dimension:(i + 1) * dimension])
+                for i in range(checker.element_arity)
+            ]
+        width = checker.element_arity * max(dimension, 1)
+        return elements, list(params[width:])
+
+    def _refit(
+        self,
+        elite: Sequence[Candidate],
+        mean: Optional[List[float]],
+        spread: Optional[List[float]],
+    ) -> Tuple[List[float], List[float]]:
+        # The statistics are floats even for exact parameters.
+        columns = [[float(v) for v in column] for column in zip(*(params for params, _ in elite))]
+        new_mean = [sum(column) / len(column) for column in columns]
+        new_spread = [
+            max(math.sqrt(sum((v - m) ** 2 for v in column) / len(column)), 1e-3 * (abs(m) + 1.0))
+            for column, m in zip(columns, new_mean)
+        ]
+        if mean is None or spread is None:
+            return new_mean, new_spread
+
+        a = self._smoothing
+        return (
+            [a * n + (1 - a) * o for n, o in zip(new_mean, mean)],
+            [a * n + (1 - a) * o for n, o in zip(new_spread, spread)],
+        )
@@ -1,94 +1,632 @@
-from typing import List, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Dict, Any, Tuple
 
 from .domain.entities.VectorSpace import VectorSpace
+from .domain.entities.Subspace import Subspace
+from .domain.entities.LinearMap import LinearMap
+from .domain.entities.InnerProductSpace import InnerProductSpace
+from .domain.entities.NormedSpace import NormedSpace
 
-from .application.use_cases.check_vector_space import CheckVectorSpaceUseCase
+from .application.ports.result_store import IResultStorePort
+from .application.ports.counterexample_corpus import ICounterexampleCorpusPort
+from .application.ports.verdict_cache import IVerdictCachePort
 from .application.ports.axiom_checker import IAxiomCheckerPort as ICheckerPort
-from .application.checkers.axiom_1_closure_addition import CheckClosureAddition
-from .application.checkers.axiom_2_commutativity import CheckCommutativity
-from .application.checkers.axiom_3_associativity import CheckAssociativity
-from .application.checkers.axiom_4_neutral_element import CheckNeutralElement
-from .application.checkers.axiom_5_additive_inverse import CheckAdditiveInverse
-from .application.checkers.axiom_6_closure_scalar_mult import CheckClosureScalarMult
-from .application.checkers.axiom_7_distributivity_vec import CheckDistributivityVec
-from .application.checkers.axiom_8_distributivy_scalar import CheckDistributivityScalar 
-from .application.checkers.axiom_9_associativity_scalar import CheckAssociativityScalar
-from .application.checkers.axiom_10_identity_mult import CheckIdentityMult
-
-from .infrastructure.elements.r3_vector import R3Vector
-from .infrastructure.adapters.addition.standard_r3_addition import StandardR3AdditionAdapter as StandardR3Addition
-from .infrastructure.adapters.multiplication.r3_standard_scalar_mult import R3StandardScalarMult as R3StandardScalarMult
-from .infrastructure.adapters.multiplication.r3_x_only_scalar_mult import R3XOnlyScalarMultAdapter
-from .infrastructure.adapters.providers.r3_standard_zero_provider import R3StandardZeroProvider
-from .infrastructure.adapters.providers.r3_standard_inverse_provider import R3StandardInverseProvider
-from .infrastructure.adapters.providers.r3_standard_element_provider import R3StandardElementProvider
-from .infrastructure.adapters.validators.r3_standard_validator import R3StandardValidator
+from .application.checkers.base import CHUNK_SIZE, NUM_SAMPLES, SampledAxiomChecker
+from .application.checkers.scalar_valued import GEOMETRY_SAMPLES
+from .registry import PluginRegistry
+
+if TYPE_CHECKING:
+    # Use cases are imported by the provide_* method that builds them, so
+    # importing the container stays cheap for workers and the CLI.
+    from .application.use_cases.check_vector_space import CheckVectorSpaceUseCase
+    from .application.use_cases.check_subspace import CheckSubspaceUseCase
+    from .application.use_cases.check_linear_map import CheckLinearMapUseCase
+    from .application.use_cases.check_inner_product_space import CheckInnerProductSpaceUseCase
+    from .application.use_cases.check_normed_space import CheckNormedSpaceUseCase
+    from .application.use_cases.linear_algebra import LinearAlgebraUseCase
+    from .application.use_cases.prove_vector_space import ProveVectorSpaceUseCase
+    from .application.use_cases.search_counterexample import SearchCounterexampleUseCase
+    from .application.use_cases.report_vector_space import ReportVectorSpaceUseCase
+    from .application.use_cases.run_history import RunHistoryUseCase
+
+_CHECKERS = "core_studies.application.checkers"
+_ADAPTERS = "core_studies.infrastructure.adapters"
+
+# Adapters and element types, imported only when a recipe needs them.
+ADAPTERS: Dict[str, str] = {
+    "R3Vector": "core_studies.infrastructure.elements.r3_vector:R3Vector",
+    "StandardR3Addition": f"{_ADAPTERS}.addition.standard_r3_addition:StandardR3AdditionAdapter",
+    "R3StandardScalarMult": f"{_ADAPTERS}.multiplication.r3_standard_scalar_mult:R3StandardScalarMult",
+    "R3XOnlyScalarMultAdapter": f"{_ADAPTERS}.multiplication.r3_x_only_scalar_mult:R3XOnlyScalarMultAdapter",
+    "R3StandardZeroProvider": f"{_ADAPTERS}.providers.r3_standard_zero_provider:R3StandardZeroProvider",
+    "R3StandardInverseProvider": f"{_ADAPTERS}.providers.r3_standard_inverse_provider:R3StandardInverseProvider",
+    "R3StandardElementProvider": f"{_ADAPTERS}.providers.r3_standard_element_provider:R3StandardElementProvider",
+    "R3StratifiedElementProvider": f"{_ADAPTERS}.providers.r3_stratified_element_provider:R3StratifiedElementProvider",
+    "R3StandardValidator": f"{_ADAPTERS}.validators.r3_standard_validator:R3StandardValidator",
+    "R3RationalZeroProvider": f"{_ADAPTERS}.providers.r3_rational_zero_provider:R3RationalZeroProvider",
+    "R3RationalElementProvider": f"{_ADAPTERS}.providers.r3_rational_element_provider:R3RationalElementProvider",
+    "R3XYPlaneValidator": f"{_ADAPTERS}.validators.r3_plane_validator:xy_plane",
+    "R3XYPlaneElementProvider": f"{_ADAPTERS}.providers.r3_plane_element_provider:xy_plane_elements",
+    "R3ZEqualsOnePlaneValidator": f"{_ADAPTERS}.validators.r3_plane_validator:z_equals_one_plane",
+    "R3ZEqualsOnePlaneElementProvider": f"{_ADAPTERS}.providers.r3_plane_element_provider:z_equals_one_plane_elements",
+    "R3XYProjectionMap": f"{_ADAPTERS}.maps.r3_maps:xy_projection",
+    "R3ZRotationMap": f"{_ADAPTERS}.maps.r3_maps:z_rotation",
+    "R3XTranslationMap": f"{_ADAPTERS}.maps.r3_maps:R3XTranslationMap",
+    "DotProduct": f"{_ADAPTERS}.geometry.inner_products:FrobeniusInnerProduct",
+    "R3WeightedInnerProduct": f"{_ADAPTERS}.geometry.r3_geometry:r3_weighted_inner_product",
+    "R3MinkowskiForm": f"{_ADAPTERS}.geometry.r3_geometry:r3_minkowski_form",
+    "R3SkewForm": f"{_ADAPTERS}.geometry.r3_geometry:r3_skew_form",
+    "R3EuclideanNorm": f"{_ADAPTERS}.geometry.r3_geometry:r3_euclidean_norm",
+    "R3TaxicabNorm": f"{_ADAPTERS}.geometry.r3_geometry:r3_taxicab_norm",
+    "R3MaxNorm": f"{_ADAPTERS}.geometry.r3_geometry:r3_max_norm",
+    "R3HalfNorm": f"{_ADAPTERS}.geometry.r3_geometry:r3_half_norm",
+}
+
+# Axiom checkers, in the order they are run.
+CHECKERS: Dict[str, str] = {
+    "CheckClosureAddition": f"{_CHECKERS}.axiom_1_closure_addition:CheckClosureAddition",
+    "CheckCommutativity": f"{_CHECKERS}.axiom_2_commutativity:CheckCommutativity",
+    "CheckAssociativity": f"{_CHECKERS}.axiom_3_associativity:CheckAssociativity",
+    "CheckNeutralElement": f"{_CHECKERS}.axiom_4_neutral_element:CheckNeutralElement",
+    "CheckAdditiveInverse": f"{_CHECKERS}.axiom_5_additive_inverse:CheckAdditiveInverse",
+    "CheckClosureScalarMult": f"{_CHECKERS}.axiom_6_closure_scalar_mult:CheckClosureScalarMult",
+    "CheckDistributivityVec": f"{_CHECKERS}.axiom_7_distributivity_vec:CheckDistributivityVec",
+    "CheckDistributivityScalar": f"{_CHECKERS}.axiom_8_distributivy_scalar:CheckDistributivityScalar",
+    "CheckAssociativityScalar": f"{_CHECKERS}.axiom_9_associativity_scalar:CheckAssociativityScalar",
+    "CheckIdentityMult": f"{_CHECKERS}.axiom_10_identity_mult:CheckIdentityMult",
+}
+
+# The three subspace conditions, in the order they are run.
+SUBSPACE_CHECKERS: Dict[str, str] = {
+    "CheckZeroInSubset": f"{_CHECKERS}.subspace_zero_element:CheckZeroInSubset",
+    "CheckSubsetClosureAddition": f"{_CHECKERS}.axiom_1_closure_addition:CheckClosureAddition",
+    "CheckSubsetClosureScalarMult": f"{_CHECKERS}.axiom_6_closure_scalar_mult:CheckClosureScalarMult",
+}
+
+# Inner product axioms, in the order they are run.
+INNER_PRODUCT_CHECKERS: Dict[str, str] = {
+    "CheckInnerProductSymmetry": f"{_CHECKERS}.inner_product_1_symmetry:CheckInnerProductSymmetry",
+    "CheckInnerProductAdditivity": f"{_CHECKERS}.inner_product_2_additivity:CheckInnerProductAdditivity",
+    "CheckInnerProductHomogeneity": f"{_CHECKERS}.inner_product_3_homogeneity:CheckInnerProductHomogeneity",
+    "CheckInnerProductPositiveDefiniteness": f"{_CHECKERS}.inner_product_4_positive_definiteness:CheckInnerProductPositiveDefiniteness",
+}
+
+# Norm axioms, in the order they are run.
+NORM_CHECKERS: Dict[str, str] = {
+    "CheckNormPositiveDefiniteness": f"{_CHECKERS}.norm_1_positive_definiteness:CheckNormPositiveDefiniteness",
+    "CheckNormHomogeneity": f"{_CHECKERS}.norm_2_homogeneity:CheckNormHomogeneity",
+    "CheckNormTriangleInequality": f"{_CHECKERS}.norm_3_triangle_inequality:CheckNormTriangleInequality",
+}
+
+# Space recipes: VectorSpace constructor argument -> adapter name.
+RECIPES: Dict[str, Dict[str, str]] = {
+    "R3_STANDARD": {
+        "element_type": "R3Vector",
+        "addition_strategy": "StandardR3Addition",
+        "scalar_mult_strategy": "R3StandardScalarMult",
+        "zero_element_provider": "R3StandardZeroProvider",
+        "add_inverse_provider": "R3StandardInverseProvider",
+        "element_provider": "R3StratifiedElementProvider",
+        "validator": "R3StandardValidator",
+    },
+    "R3_RULE_X_ONLY_MULT": {
+        "element_type": "R3Vector",
+        "addition_strategy": "StandardR3Addition",
+        "scalar_mult_strategy": "R3XOnlyScalarMultAdapter",
+        "zero_element_provider": "R3StandardZeroProvider",
+        "add_inverse_provider": "R3StandardInverseProvider",
+        "element_provider": "R3StratifiedElementProvider",
+        "validator": "R3StandardValidator",
+    },
+    # Exact-arithmetic variants: Fraction samples, compared with ==.
+    "R3_RATIONAL": {
+        "element_type": "R3Vector",
+        "addition_strategy": "StandardR3Addition",
+        "scalar_mult_strategy": "R3StandardScalarMult",
+        "zero_element_provider": "R3RationalZeroProvider",
+        "add_inverse_provider": "R3StandardInverseProvider",
+        "element_provider": "R3RationalElementProvider",
+        "validator": "R3StandardValidator",
+    },
+    "R3_RATIONAL_RULE_X_ONLY_MULT": {
+        "element_type": "R3Vector",
+        "addition_strategy": "StandardR3Addition",
+        "scalar_mult_strategy": "R3XOnlyScalarMultAdapter",
+        "zero_element_provider": "R3RationalZeroProvider",
+        "add_inverse_provider": "R3StandardInverseProvider",
+        "element_provider": "R3RationalElementProvider",
+        "validator": "R3StandardValidator",
+    },
+}
+
+# Subset recipes: parent space recipe, plus the subset's own validator
+# and element provider. Everything else is inherited from the parent.
+SUBSPACES: Dict[str, Tuple[str, Dict[str, str]]] = {
+    "R3_PLANE_XY": ("R3_STANDARD", {
+        "validator": "R3XYPlaneValidator",
+        "element_provider": "R3XYPlaneElementProvider",
+    }),
+    "R3_PLANE_Z_EQUALS_1": ("R3_STANDARD", {
+        "validator": "R3ZEqualsOnePlaneValidator",
+        "element_provider": "R3ZEqualsOnePlaneElementProvider",
+    }),
+}
+
+# Map recipes: (source space recipe, target space recipe, map adapter).
+LINEAR_MAPS: Dict[str, Tuple[str, str, str]] = {
+    "R3_PROJECT_XY": ("R3_STANDARD", "R3_STANDARD", "R3XYProjectionMap"),
+    "R3_ROTATE_Z": ("R3_STANDARD", "R3_STANDARD", "R3ZRotationMap"),
+    # Affine, not linear.
+    "R3_TRANSLATE_X": ("R3_STANDARD", "R3_STANDARD", "R3XTranslationMap"),
+    # A linear matrix, but the x-only scalar multiplication of the
+    # spaces breaks homogeneity.
+    "R3_ROTATE_Z_X_ONLY_MULT": ("R3_RULE_X_ONLY_MULT", "R3_RULE_X_ONLY_MULT", "R3ZRotationMap"),
+}
+
+# Inner product space recipes: (parent space recipe, inner product adapter).
+INNER_PRODUCT_SPACES: Dict[str, Tuple[str, str]] = {
+    "R3_EUCLIDEAN": ("R3_STANDARD", "DotProduct"),
+    "R3_WEIGHTED": ("R3_STANDARD", "R3WeightedInnerProduct"),
+    "R3_RATIONAL_EUCLIDEAN": ("R3_RATIONAL", "DotProduct"),
+    # Not inner products: indefinite, and not symmetric.
+    "R3_MINKOWSKI": ("R3_STANDARD", "R3MinkowskiForm"),
+    "R3_SKEW_FORM": ("R3_STANDARD", "R3SkewForm"),
+    # The dot product, but the x-only scalar multiplication of the space
+    # breaks homogeneity.
+    "R3_EUCLIDEAN_X_ONLY_MULT": ("R3_RULE_X_ONLY_MULT", "DotProduct"),
+}
+
+# Normed space recipes: (parent space recipe, norm adapter).
+NORMED_SPACES: Dict[str, Tuple[str, str]] = {
+    "R3_EUCLIDEAN_NORM": ("R3_STANDARD", "R3EuclideanNorm"),
+    "R3_TAXICAB": ("R3_STANDARD", "R3TaxicabNorm"),
+    "R3_MAX_NORM": ("R3_STANDARD", "R3MaxNorm"),
+    # The p = 1/2 "norm" breaks the triangle inequality.
+    "R3_HALF_NORM": ("R3_STANDARD", "R3HalfNorm"),
+}
+
+
+def build_registry(discover_plugins: bool = True) -> PluginRegistry:
+    """
+    Returns a PluginRegistry holding the built-in adapters, checkers and
+    recipes, plus whatever installed plugins register on top.
+    """
+    registry = PluginRegistry()
+    for name, target in ADAPTERS.items():
+        registry.register(name, target)
+    for order, (name, target) in enumerate(CHECKERS.items(), start=1):
+        registry.register_checker(name, target, order=order * 10)
+    for order, (name, target) in enumerate(SUBSPACE_CHECKERS.items(), start=1):
+        registry.register_checker(name, target, order=order * 10, family="subspace")
+    for order, (name, target) in enumerate(INNER_PRODUCT_CHECKERS.items(), start=1):
+        registry.register_checker(name, target, order=order * 10, family="inner_product")
+    for order, (name, target) in enumerate(NORM_CHECKERS.items(), start=1):
+        registry.register_checker(name, target, order=order * 10, family="norm")
+    for name, parts in RECIPES.items():
+        registry.register_recipe(name, parts)
+    for name, (parent, parts) in SUBSPACES.items():
+        registry.register_subspace(name, parent, parts)
+    for name, (source, target, mapping) in LINEAR_MAPS.items():
+        registry.register_linear_map(name, source, target, mapping)
+    for name, (parent, inner_product) in INNER_PRODUCT_SPACES.items():
+        registry.register_inner_product_space(name, parent, inner_product)
+    for name, (parent, norm) in NORMED_SPACES.items():
+        registry.register_normed_space(name, parent, norm)
+
+    if discover_plugins:
+        registry.discover()
+    return registry
 
 
 class DependencyContainer:
     """
     This container (factory) assembles services and dependencies.
+
+    Adapters, checkers and recipes come from a `PluginRegistry`: the
+    built-ins declared above plus any installed entry-point plugins.
+    Modules are imported lazily, so only what a recipe uses is loaded.
+    Built spaces and the use case are singletons: they are created once,
+    cached, and reused by every request. Call `warm_up()` at startup so
+    the first request does not pay for construction.
     """
-    
-    def __init__(self):
-        self._adapters: Dict[str, Any] = {
-            "R3Vector": R3Vector,
-            "StandardR3Addition": StandardR3Addition(),
-            "R3StandardScalarMult": R3StandardScalarMult(),
-            "R3XOnlyScalarMultAdapter": R3XOnlyScalarMultAdapter(),
-            "R3StandardZeroProvider": R3StandardZeroProvider(),
-            "R3StandardInverseProvider": R3StandardInverseProvider(),
-            "R3StandardElementProvider": R3StandardElementProvider(),
-            "R3StandardValidator": R3StandardValidator(),
-        }
 
-        self._checkers: List[ICheckerPort[Any]] = [
-            CheckClosureAddition(),
-            CheckCommutativity(),
-            CheckAssociativity(),
-            CheckNeutralElement(),
-            CheckAdditiveInverse(),
-            CheckClosureScalarMult(),
-            CheckDistributivityVec(),
-            CheckDistributivityScalar(),
-            CheckAssociativityScalar(),
-            CheckIdentityMult(),
-        ]
+    def __init__(
+        self,
+        registry: PluginRegistry | None = None,
+        result_store: IResultStorePort | None = None,
+        corpus: ICounterexampleCorpusPort | None = None,
+        verdict_cache: IVerdictCachePort | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self._registry = registry if registry is not None else build_registry()
+        self._result_store = result_store
+        self._corpus = corpus
+        self._verdict_cache = verdict_cache
+        self._chunk_size = chunk_size
+        self._adapters: Dict[str, Any] = {}
+        self._spaces: Dict[str, VectorSpace[Any]] = {}
+        self._subspaces: Dict[str, Subspace[Any]] = {}
+        self._linear_maps: Dict[str, LinearMap] = {}
+        self._linear_map_use_cases: Dict[int, CheckLinearMapUseCase] = {}
+        self._linear_algebra_use_case: LinearAlgebraUseCase[Any] | None = None
+        self._inner_product_spaces: Dict[str, InnerProductSpace[Any]] = {}
+        self._normed_spaces: Dict[str, NormedSpace[Any]] = {}
+        self._inner_product_use_cases: Dict[int, CheckInnerProductSpaceUseCase[Any]] = {}
+        self._normed_use_cases: Dict[int, CheckNormedSpaceUseCase[Any]] = {}
+        self._use_cases: Dict[int, CheckVectorSpaceUseCase[Any]] = {}
+        self._subspace_use_cases: Dict[int, CheckSubspaceUseCase[Any]] = {}
+        self._exact_use_cases: Dict[int, ProveVectorSpaceUseCase[Any]] = {}
+        self._search_use_case: SearchCounterexampleUseCase[Any] | None = None
+        self._report_use_cases: Dict[int, ReportVectorSpaceUseCase[Any]] = {}
+        self._ready = False
+
+    @property
+    def registry(self) -> PluginRegistry:
+        return self._registry
+
+    @property
+    def result_store(self) -> IResultStorePort | None:
+        """Where named recipe runs are recorded, if anywhere."""
+        return self._result_store
 
-    def provide_vector_space_use_case(self) -> CheckVectorSpaceUseCase[Any]:
+    @property
+    def space_names(self) -> Tuple[str, ...]:
+        """Names of every known space recipe."""
+        return tuple(self._registry.recipe_names())
+
+    @property
+    def subspace_names(self) -> Tuple[str, ...]:
+        """Names of every known subset recipe."""
+        return tuple(self._registry.subspace_names())
+
+    @property
+    def linear_map_names(self) -> Tuple[str, ...]:
+        """Names of every known map recipe."""
+        return tuple(self._registry.linear_map_names())
+
+    @property
+    def inner_product_space_names(self) -> Tuple[str, ...]:
+        """Names of every known inner product space recipe."""
+        return tuple(self._registry.inner_product_space_names())
+
+    @property
+    def normed_space_names(self) -> Tuple[str, ...]:
+        """Names of every known normed space recipe."""
+        return tuple(self._registry.normed_space_names())
+
+    @property
+    def is_ready(self) -> bool:
+        """True once `warm_up()` has built and exercised every recipe."""
+        return self._ready
+
+    def warm_up(self) -> None:
         """
-        RECIPE 1: Builds the "Engine" (the main Use Case).
+        Pre-builds the use case and every known space, then runs one
+        full check per space so that all code paths (imports, attribute
+        lookups, bytecode caches) are hot before traffic arrives.
         """
-        return CheckVectorSpaceUseCase(
-            axiom_checkers=self._checkers 
-        )
+        use_case = self.provide_vector_space_use_case()
+        for space_name in self.space_names:
+            use_case.execute(self.provide_space(space_name))
 
-    def provide_space(self, space_name: str) -> VectorSpace[Any]:
+        subspace_use_case = self.provide_subspace_use_case()
+        for subspace_name in self.subspace_names:
+            subspace_use_case.execute(self.provide_subspace(subspace_name))
+
+        linear_map_use_case = self.provide_linear_map_use_case()
+        for map_name in self.linear_map_names:
+            linear_map_use_case.execute(self.provide_linear_map(map_name))
+
+        inner_product_use_case = self.provide_inner_product_use_case()
+        for space_name in self.inner_product_space_names:
+            inner_product_use_case.execute(self.provide_inner_product_space(space_name))
+
+        normed_use_case = self.provide_normed_space_use_case()
+        for space_name in self.normed_space_names:
+            normed_use_case.execute(self.provide_normed_space(space_name))
+
+        self._ready = True
+
+    def provide_vector_space_use_case(
+        self, num_samples: int = NUM_SAMPLES
+    ) -> CheckVectorSpaceUseCase[Any]:
+        """
+        RECIPE 1: Builds the "Engine" (the main Use Case), one per
+        sample budget.
+
+        Args:
+            num_samples: How many samples each axiom is checked on.
+        """
+        from .application.use_cases.check_vector_space import CheckVectorSpaceUseCase
+
+        use_case = self._use_cases.get(num_samples)
+        if use_case is None:
+            checkers = self._build_checkers("vector_space", num_samples)
+            use_case = CheckVectorSpaceUseCase(
+                axiom_checkers=checkers,
+                result_store=self._result_store,
+                corpus=self._corpus,
+                verdict_cache=self._verdict_cache,
+            )
+            self._use_cases[num_samples] = use_case
+        return use_case
+
+    def provide_exact_use_case(
+        self, num_samples: int = NUM_SAMPLES
+    ) -> ProveVectorSpaceUseCase[Any]:
+        """
+        Builds the exact (symbolic-first) verification use case. The
+        sample budget only applies to axioms that fall back to sampling.
+        """
+        from .application.use_cases.prove_vector_space import ProveVectorSpaceUseCase
+
+        use_case = self._exact_use_cases.get(num_samples)
+        if use_case is None:
+            use_case = ProveVectorSpaceUseCase(
+                axiom_checkers=self._build_checkers("vector_space", num_samples)
+            )
+            self._exact_use_cases[num_samples] = use_case
+        return use_case
+
+    def provide_report_use_case(
+        self, num_samples: int = NUM_SAMPLES
+    ) -> ReportVectorSpaceUseCase[Any]:
         """
-        RECIPE 2: Builds a "Vector Space" (the test object)
-        based on a predefined "recipe".
-        """
-        
-        if space_name == "R3_STANDARD":
-            return VectorSpace[R3Vector](
-                element_type=self._adapters["R3Vector"],
-                addition_strategy=self._adapters["StandardR3Addition"],
-                scalar_mult_strategy=self._adapters["R3StandardScalarMult"],
-                zero_element_provider=self._adapters["R3StandardZeroProvider"],
-                add_inverse_provider=self._adapters["R3StandardInverseProvider"],
-                element_provider=self._adapters["R3StandardElementProvider"],
-                validator=self._adapters["R3StandardValidator"]
+        Builds the quantitative (residual statistics) report, one per
+        sample budget.
+        """
+        from .application.use_cases.report_vector_space import ReportVectorSpaceUseCase
+
+        use_case = self._report_use_cases.get(num_samples)
+        if use_case is None:
+            use_case = ReportVectorSpaceUseCase(
+                axiom_checkers=self._build_checkers("vector_space", num_samples)
             )
-        
-        if space_name == "R3_RULE_X_ONLY_MULT":
-            return VectorSpace[R3Vector](
-                element_type=self._adapters["R3Vector"],
-                addition_strategy=self._adapters["StandardR3Addition"],
-                scalar_mult_strategy=self._adapters["R3XOnlyScalarMultAdapter"],
-                zero_element_provider=self._adapters["R3StandardZeroProvider"],
-                add_inverse_provider=self._adapters["R3StandardInverseProvider"],
-                element_provider=self._adapters["R3StandardElementProvider"],
-                validator=self._adapters["R3StandardValidator"]
+            self._report_use_cases[num_samples] = use_case
+        return use_case
+
+    def provide_search_use_case(self) -> SearchCounterexampleUseCase[Any]:
+        """
+        Builds the adaptive counterexample search. It is bounded by time,
+        not by a sample count.
+        """
+        from .application.use_cases.search_counterexample import SearchCounterexampleUseCase
+
+        if self._search_use_case is None:
+            self._search_use_case = SearchCounterexampleUseCase(
+                axiom_checkers=self._build_checkers("vector_space", NUM_SAMPLES)
             )
-        
-        raise ValueError(f"Unknown space recipe: '{space_name}'")
+        return self._search_use_case
+
+    def provide_history_use_case(self) -> RunHistoryUseCase:
+        """
+        Builds the run history queries (trends, diffs) over the result
+        store.
+
+        Raises:
+            RuntimeError: If the container has no result store.
+        """
+        from .application.use_cases.run_history import RunHistoryUseCase
+
+        if self._result_store is None:
+            raise RuntimeError("No result store is configured")
+        return RunHistoryUseCase(self._result_store)
+
+    def provide_subspace_use_case(
+        self, num_samples: int = NUM_SAMPLES
+    ) -> CheckSubspaceUseCase[Any]:
+        """
+        Builds the subspace test (three conditions instead of ten
+        axioms), one per sample budget.
+
+        Args:
+            num_samples: How many samples each condition is checked on.
+        """
+        from .application.use_cases.check_subspace import CheckSubspaceUseCase
+
+        use_case = self._subspace_use_cases.get(num_samples)
+        if use_case is None:
+            checkers = self._build_checkers("subspace", num_samples)
+            use_case = CheckSubspaceUseCase(subspace_checkers=checkers)
+            self._subspace_use_cases[num_samples] = use_case
+        return use_case
+
+    def provide_subspace(self, subspace_name: str) -> Subspace[Any]:
+        """
+        Returns the cached Subspace for a subset recipe, building it
+        (and its parent space) on first use.
+        """
+        subspace = self._subspaces.get(subspace_name)
+        if subspace is None:
+            try:
+                parent_name, parts = self._registry.subspace(subspace_name)
+            except KeyError:
+                raise ValueError(f"Unknown subspace recipe: '{subspace_name}'")
+
+            subspace = Subspace(
+                parent=self.provide_space(parent_name),
+                validator=self._adapter(parts["validator"]),
+                element_provider=self._adapter(parts["element_provider"]),
+            )
+            self._subspaces[subspace_name] = subspace
+        return subspace
+
+    def provide_linear_map_use_case(
+        self, num_samples: int = NUM_SAMPLES
+    ) -> CheckLinearMapUseCase:
+        """
+        Builds the linearity check of maps between spaces, one per
+        sample budget.
+
+        Args:
+            num_samples: How many (u, v, k) samples the map is checked on.
+        """
+        from .application.use_cases.check_linear_map import CheckLinearMapUseCase
+
+        use_case = self._linear_map_use_cases.get(num_samples)
+        if use_case is None:
+            use_case = CheckLinearMapUseCase(num_samples=num_samples, chunk_size=self._chunk_size)
+            self._linear_map_use_cases[num_samples] = use_case
+        return use_case
+
+    def provide_inner_product_use_case(
+        self, num_samples: int = GEOMETRY_SAMPLES
+    ) -> CheckInnerProductSpaceUseCase[Any]:
+        """
+        Builds the inner product axioms check, one per sample budget.
+
+        Args:
+            num_samples: How many samples each axiom is checked on.
+        """
+        from .application.use_cases.check_inner_product_space import CheckInnerProductSpaceUseCase
+
+        use_case = self._inner_product_use_cases.get(num_samples)
+        if use_case is None:
+            checkers = self._build_checkers("inner_product", num_samples)
+            use_case = CheckInnerProductSpaceUseCase(inner_product_checkers=checkers)
+            self._inner_product_use_cases[num_samples] = use_case
+        return use_case
+
+    def provide_normed_space_use_case(
+        self, num_samples: int = GEOMETRY_SAMPLES
+    ) -> CheckNormedSpaceUseCase[Any]:
+        """
+        Builds the norm axioms check, one per sample budget.
+
+        Args:
+            num_samples: How many samples each axiom is checked on.
+        """
+        from .application.use_cases.check_normed_space import CheckNormedSpaceUseCase
+
+        use_case = self._normed_use_cases.get(num_samples)
+        if use_case is None:
+            checkers = self._build_checkers("norm", num_samples)
+            use_case = CheckNormedSpaceUseCase(norm_checkers=checkers)
+            self._normed_use_cases[num_samples] = use_case
+        return use_case
+
+    def provide_inner_product_space(self, space_name: str) -> InnerProductSpace[Any]:
+        """
+        Returns the cached InnerProductSpace for a recipe, building it
+        (and its parent space) on first use.
+        """
+        space = self._inner_product_spaces.get(space_name)
+        if space is None:
+            try:
+                parent_name, inner_product = self._registry.inner_product_space(space_name)
+            except KeyError:
+                raise ValueError(f"Unknown inner product space recipe: '{space_name}'")
+
+            space = InnerProductSpace(
+                parent=self.provide_space(parent_name),
+                inner_product=self._adapter(inner_product),
+            )
+            self._inner_product_spaces[space_name] = space
+        return space
+
+    def provide_normed_space(self, space_name: str) -> NormedSpace[Any]:
+        """
+        Returns the cached NormedSpace for a recipe, building it (and
+        its parent space) on first use.
+        """
+        space = self._normed_spaces.get(space_name)
+        if space is None:
+            try:
+                parent_name, norm = self._registry.normed_space(space_name)
+            except KeyError:
+                raise ValueError(f"Unknown normed space recipe: '{space_name}'")
+
+            space = NormedSpace(
+                parent=self.provide_space(parent_name),
+                norm=self._adapter(norm),
+            )
+            self._normed_spaces[space_name] = space
+        return space
+
+    def provide_linear_algebra_use_case(self) -> LinearAlgebraUseCase[Any]:
+        """
+        Builds the dimension, basis and span queries. Spaces are checked
+        with the exact use case and subsets with the subspace test, on
+        VERIFY_SAMPLES samples where they sample; see the use case for
+        what is cached.
+        """
+        from .application.use_cases.linear_algebra import LinearAlgebraUseCase, VERIFY_SAMPLES
+
+        if self._linear_algebra_use_case is None:
+            self._linear_algebra_use_case = LinearAlgebraUseCase(
+                space_check=self.provide_exact_use_case(VERIFY_SAMPLES),
+                subspace_check=self.provide_subspace_use_case(VERIFY_SAMPLES),
+                chunk_size=self._chunk_size,
+            )
+        return self._linear_algebra_use_case
+
+    def provide_space_or_subspace(self, name: str) -> VectorSpace[Any]:
+        """
+        Returns the space built from a space recipe or, if 'name' is a
+        subset recipe, the subspace.
+        """
+        if name in self.subspace_names:
+            return self.provide_subspace(name)
+        return self.provide_space(name)
+
+    def provide_linear_map(self, map_name: str) -> LinearMap:
+        """
+        Returns the cached LinearMap for a map recipe, building it (and
+        its source and target spaces) on first use.
+        """
+        linear_map = self._linear_maps.get(map_name)
+        if linear_map is None:
+            try:
+                source_name, target_name, mapping = self._registry.linear_map(map_name)
+            except KeyError:
+                raise ValueError(f"Unknown linear map recipe: '{map_name}'")
+
+            linear_map = LinearMap(
+                source=self.provide_space(source_name),
+                target=self.provide_space(target_name),
+                mapping=self._adapter(mapping),
+            )
+            self._linear_maps[map_name] = linear_map
+        return linear_map
+
+    def provide_space(self, space_name: str) -> VectorSpace[Any]:
+        """
+        RECIPE 2: Returns the cached "Vector Space" (the test object)
+        for a predefined "recipe", building it on first use.
+        """
+        space = self._spaces.get(space_name)
+        if space is None:
+            space = self._build_space(space_name)
+            self._spaces[space_name] = space
+        return space
+
+    def _build_space(self, space_name: str) -> VectorSpace[Any]:
+        try:
+            recipe = self._registry.recipe(space_name)
+        except KeyError:
+            raise ValueError(f"Unknown space recipe: '{space_name}'")
+
+        parts = {
+            argument: self._adapter(adapter_name)
+            for argument, adapter_name in recipe.items()
+            if argument != "element_type"
+        }
+        element_type = self._registry.resolve(recipe["element_type"])
+        return VectorSpace(element_type=element_type, **parts)
+
+    def _build_checkers(self, family: str, num_samples: int) -> List[ICheckerPort[Any]]:
+        checkers: List[ICheckerPort[Any]] = []
+        for name in self._registry.checker_names(family=family):
+            checker_type = self._registry.resolve(name)
+            if issubclass(checker_type, SampledAxiomChecker):
+                checkers.append(checker_type(num_samples=num_samples, chunk_size=self._chunk_size))
+            else:
+                checkers.append(checker_type(num_samples=num_samples))
+        return checkers
+
+    def _adapter(self, name: str) -> Any:
+        """Returns the shared adapter instance registered under 'name'."""
+        if name not in self._adapters:
+            self._adapters[name] = self._registry.resolve(name)()
+        return self._adapters[name]
@@ -0,0 +1,43 @@
+from typing import TypeVar
+
+from ..ports.Operations import IInnerProductPort
+from .Element import AlgebraicElement
+from .VectorSpace import VectorSpace
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class InnerProductSpace(VectorSpace[ET]):
+    """
+    Represents a candidate inner product space: a known (parent) Vector
+    Space together with a map <u, v> from pairs of its elements to
+    scalars.
+
+    Every operation and provider comes from the parent; only the inner
+    product is added. Whether it is one (symmetric, linear in the first
+    argument, positive-definite) is what `CheckInnerProductSpaceUseCase`
+    verifies.
+    """
+
+    def __init__(self, parent: VectorSpace[ET], inner_product: IInnerProductPort):
+        """
+        Args:
+            parent: The vector space the inner product is defined on.
+            inner_product: Evaluates <u, v> on elements of the parent.
+        """
+        super().__init__(
+            element_type=parent.element_type,
+            addition_strategy=parent.addition,
+            scalar_mult_strategy=parent.scalar_multiplication,
+            zero_element_provider=parent.zero_element_provider,
+            add_inverse_provider=parent.additive_inverse_provider,
+            element_provider=parent.element_provider,
+            validator=parent.validator,
+        )
+        self.parent = parent
+        self.inner_product = inner_product
+
+    def __repr__(self) -> str:
+        """Clear representation for debugging."""
+        return (f"<InnerProductSpace over {self.parent!r} "
+                f"with {self.inner_product.__class__.__name__}>")
@@ -0,0 +1,36 @@
+from typing import Any
+
+from ..ports.Map import IMapPort
+from .VectorSpace import VectorSpace
+
+
+class LinearMap:
+    """
+    Represents a candidate linear map (homomorphism) T: V -> W.
+
+    It groups the source and target spaces with the adapter that
+    evaluates T. Whether T really is linear, i.e. T(u + v) = T(u) + T(v)
+    and T(k*u) = k*T(u) under the operations of V and W, is what
+    `CheckLinearMapUseCase` verifies.
+    """
+
+    def __init__(
+        self,
+        source: VectorSpace[Any],
+        target: VectorSpace[Any],
+        mapping: IMapPort,
+    ):
+        """
+        Args:
+            source: The space V the map is defined on.
+            target: The space W its images belong to.
+            mapping: Evaluates T on elements of V.
+        """
+        self.source = source
+        self.target = target
+        self.mapping = mapping
+
+    def __repr__(self) -> str:
+        """Clear representation for debugging."""
+        return (f"<LinearMap {self.mapping.__class__.__name__} "
+                f"from {self.source!r} to {self.target!r}>")
@@ -0,0 +1,42 @@
+from typing import TypeVar
+
+from ..ports.Operations import INormPort
+from .Element import AlgebraicElement
+from .VectorSpace import VectorSpace
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class NormedSpace(VectorSpace[ET]):
+    """
+    Represents a candidate normed space: a known (parent) Vector Space
+    together with a map ||u|| from its elements to scalars.
+
+    Every operation and provider comes from the parent; only the norm
+    is added. Whether it is one (positive-definite, absolutely
+    homogeneous, subadditive) is what `CheckNormedSpaceUseCase`
+    verifies.
+    """
+
+    def __init__(self, parent: VectorSpace[ET], norm: INormPort):
+        """
+        Args:
+            parent: The vector space the norm is defined on.
+            norm: Evaluates ||u|| on elements of the parent.
+        """
+        super().__init__(
+            element_type=parent.element_type,
+            addition_strategy=parent.addition,
+            scalar_mult_strategy=parent.scalar_multiplication,
+            zero_element_provider=parent.zero_element_provider,
+            add_inverse_provider=parent.additive_inverse_provider,
+            element_provider=parent.element_provider,
+            validator=parent.validator,
+        )
+        self.parent = parent
+        self.norm = norm
+
+    def __repr__(self) -> str:
+        """Clear representation for debugging."""
+        return (f"<NormedSpace over {self.parent!r} "
+                f"with {self.norm.__class__.__name__}>")
@@ -0,0 +1,48 @@
+from typing import TypeVar
+
+from ..ports.Provider import IElementProviderPort
+from ..ports.Validator import IElementValidatorPort
+from .Element import AlgebraicElement
+from .VectorSpace import VectorSpace
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+
+class Subspace(VectorSpace[ET]):
+    """
+    Represents a subset of a known (parent) Vector Space.
+
+    The subset inherits every operation and provider of its parent;
+    only membership (the validator) and the sample source change.
+    Because the parent already satisfies the ten axioms, the subset is
+    a subspace if and only if it contains the zero element and is
+    closed under addition and scalar multiplication.
+    """
+
+    def __init__(
+        self,
+        parent: VectorSpace[ET],
+        validator: IElementValidatorPort[ET],
+        element_provider: IElementProviderPort[ET],
+    ):
+        """
+        Args:
+            parent: The vector space the subset lives in.
+            validator: Decides whether an element belongs to the subset.
+            element_provider: Provides sample elements *of the subset*.
+        """
+        super().__init__(
+            element_type=parent.element_type,
+            addition_strategy=parent.addition,
+            scalar_mult_strategy=parent.scalar_multiplication,
+            zero_element_provider=parent.zero_element_provider,
+            add_inverse_provider=parent.additive_inverse_provider,
+            element_provider=element_provider,
+            validator=validator,
+        )
+        self.parent = parent
+
+    def __repr__(self) -> str:
+        """Clear representation for debugging."""
+        return (f"<Subspace of {self.parent!r} "
+                f"defined by {self.validator.__class__.__name__}>")
@@ -1,7 +1,33 @@
+from typing import Any, Optional, Sequence
+
+
 class DomainError(Exception):
     """Base class for domain-related errors."""
     pass
 
 class AxiomFailedError(DomainError):
-    """Raised when a domain axiom fails."""
+    """
+    Raised when a domain axiom fails.
+
+    When the failure comes from a concrete sample, 'elements' and
+    'scalars' hold the inputs that violated the axiom (the counterexample).
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        elements: Optional[Sequence[Any]] = None,
+        scalars: Optional[Sequence[Any]] = None,
+    ):
+        super().__init__(*args)
+        self.elements = elements
+        self.scalars = scalars
+
+
+class NotAVectorSpaceError(DomainError):
+    """
+    Raised when a question that only makes sense in a vector space
+    (e.g. its dimension) is asked of a structure that fails the axioms
+    or, for a subset, the subspace test. The message says which.
+    """
     pass
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+from ..entities.Element import AlgebraicElement
+from .Operations import Scalar
+
+
+class IMapPort(ABC):
+    """
+    Port (Interface) for a map T: V -> W between the element sets of
+    two spaces.
+
+    Adapters implement `execute` for one element and may override
+    `execute_batch` to evaluate many elements at once (e.g. as a single
+    matrix product).
+    """
+
+    @abstractmethod
+    def execute(self, element: AlgebraicElement) -> AlgebraicElement:
+        """Receives an element of V and returns its image in W."""
+        ...
+
+    def execute_batch(self, elements: Sequence[AlgebraicElement]) -> List[AlgebraicElement]:
+        """Returns the image of every element, in order."""
+        return [self.execute(element) for element in elements]
+
+
+class IMatrixMapPort(IMapPort):
+    """
+    A map given by a matrix acting on coordinates: the image of an
+    element with coordinates x has coordinates `matrix @ x`.
+    """
+
+    @property
+    @abstractmethod
+    def matrix(self) -> Sequence[Sequence[Scalar]]:
+        """The rows of the matrix (dim W rows of dim V entries)."""
+        ...
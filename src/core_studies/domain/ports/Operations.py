@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Sequence
 
 Scalar = int | float
 
@@ -33,4 +34,41 @@ class IScalarMultPort(ABC):
         Receives a scalar and an element, and returns the
         result of the scalar multiplication.
         """
-        ...
\ No newline at end of file
+        ...
+
+class IInnerProductPort(ABC):
+    """
+    Port (Interface) for an Inner Product Strategy.
+
+    Adapters implement `execute` for one pair of elements and may
+    override `execute_batch` to evaluate many pairs at once.
+    """
+
+    @abstractmethod
+    def execute(self, e1: AlgebraicElement, e2: AlgebraicElement) -> Scalar:
+        """Receives two elements and returns their inner product <e1, e2>."""
+        ...
+
+    def execute_batch(
+        self, firsts: Sequence[AlgebraicElement], seconds: Sequence[AlgebraicElement]
+    ) -> List[Scalar]:
+        """Returns <firsts[i], seconds[i]> for every i, in order."""
+        return [self.execute(e1, e2) for e1, e2 in zip(firsts, seconds)]
+
+
+class INormPort(ABC):
+    """
+    Port (Interface) for a Norm Strategy.
+
+    Adapters implement `execute` for one element and may override
+    `execute_batch` to evaluate many elements at once.
+    """
+
+    @abstractmethod
+    def execute(self, element: AlgebraicElement) -> Scalar:
+        """Receives an element and returns its norm ||element||."""
+        ...
+
+    def execute_batch(self, elements: Sequence[AlgebraicElement]) -> List[Scalar]:
+        """Returns the norm of every element, in order."""
+        return [self.execute(element) for element in elements]
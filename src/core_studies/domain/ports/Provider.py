@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, Iterator, List, Optional, Tuple
 from ..entities.Element import AlgebraicElement
 from .Operations import Scalar
 
 ET = TypeVar('ET', bound=AlgebraicElement)
 
+# Samples per chunk when streaming: small enough that a chunk of R3
+# elements stays in the CPU caches, large enough to amortise the calls.
+DEFAULT_CHUNK_SIZE = 4096
+
 
 class IZeroElementProviderPort(Generic[ET], ABC):
     """
@@ -37,3 +41,28 @@ class IElementProviderPort(Generic[ET], ABC):
     def get_scalars(self, count: int) -> List[Scalar]:
         """Return a list of 'count' sample scalars."""
         ...
+
+    def stream(
+        self,
+        samples: Optional[int],
+        element_arity: int,
+        scalar_arity: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Tuple[List[ET], List[Scalar]]]:
+        """
+        Yields the draws for 'samples' samples (forever if None) one
+        chunk at a time: the elements and scalars of at most
+        'chunk_size' samples, so memory does not grow with 'samples'.
+
+        The default draws each chunk with `get_elements`/`get_scalars`;
+        providers that can generate chunks more cheaply may override it.
+        """
+        remaining = samples
+        while remaining is None or remaining > 0:
+            count = chunk_size if remaining is None else min(chunk_size, remaining)
+            if remaining is not None:
+                remaining -= count
+            yield (
+                self.get_elements(count * element_arity),
+                self.get_scalars(count * scalar_arity) if scalar_arity else [],
+            )
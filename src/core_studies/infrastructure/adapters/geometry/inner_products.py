@@ -0,0 +1,100 @@
+import operator
+from typing import List, Sequence
+
+from core_studies.application.checkers.coordinates import to_coordinates
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.ports.Operations import IInnerProductPort, Scalar
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _all_floats(rows: Sequence[Sequence[Scalar]]) -> bool:
+    return all(type(value) is float for row in rows for value in row)
+
+
+class FrobeniusInnerProduct(IInnerProductPort):
+    """
+    This adapter implements IInnerProductPort as the sum of the
+    coordinate-wise products of two dataclass elements: the Euclidean
+    dot product on R^n, the Frobenius product <A, B> = sum A_ij * B_ij
+    on matrices stored by their entries.
+
+    A batch is evaluated at once: one element-wise product and row sum
+    with NumPy when it is installed and every coordinate is a float, a
+    plain Python loop otherwise (exact for exact coordinates).
+    """
+
+    def execute(self, e1: AlgebraicElement, e2: AlgebraicElement) -> Scalar:
+        return self.execute_batch([e1], [e2])[0]
+
+    def execute_batch(
+        self, firsts: Sequence[AlgebraicElement], seconds: Sequence[AlgebraicElement]
+    ) -> List[Scalar]:
+        rows_u = [to_coordinates(element) for element in firsts]
+        rows_v = [to_coordinates(element) for element in seconds]
+
+        if np is not None and _all_floats(rows_u) and _all_floats(rows_v):
+            return np.einsum("ij,ij->i", np.asarray(rows_u), np.asarray(rows_v)).tolist()
+        return [sum(map(operator.mul, u, v)) for u, v in zip(rows_u, rows_v)]
+
+
+class GramInnerProduct(IInnerProductPort):
+    """
+    This adapter implements IInnerProductPort as the bilinear form
+    <u, v> = sum G_ij * u_i * v_j of a Gram matrix G over the
+    coordinates of dataclass elements. A diagonal G gives a weighted
+    inner product.
+
+    It is only an inner product when G is symmetric positive-definite;
+    other matrices give forms the inner product checkers reject. A batch
+    is evaluated as one `einsum` with NumPy when it is installed and
+    every coordinate is a float, with a plain Python loop over the
+    nonzero entries of G otherwise.
+    """
+
+    def __init__(self, gram: Sequence[Sequence[Scalar]]):
+        """
+        Args:
+            gram: The rows of G; one per coordinate, each with one entry
+                  per coordinate.
+        """
+        self._gram = [list(row) for row in gram]
+        self._entries = [
+            (i, j, g)
+            for i, row in enumerate(self._gram)
+            for j, g in enumerate(row)
+            if g != 0
+        ]
+
+    @property
+    def gram(self) -> Sequence[Sequence[Scalar]]:
+        return self._gram
+
+    def execute(self, e1: AlgebraicElement, e2: AlgebraicElement) -> Scalar:
+        return self.execute_batch([e1], [e2])[0]
+
+    def execute_batch(
+        self, firsts: Sequence[AlgebraicElement], seconds: Sequence[AlgebraicElement]
+    ) -> List[Scalar]:
+        rows_u = [to_coordinates(element) for element in firsts]
+        rows_v = [to_coordinates(element) for element in seconds]
+
+        if np is not None and _all_floats(rows_u) and _all_floats(rows_v):
+            return np.einsum(
+                "ij,jk,ik->i",
+                np.asarray(rows_u), np.asarray(self._gram, dtype=float), np.asarray(rows_v),
+            ).tolist()
+        return [
+            sum(g * u[i] * v[j] for i, j, g in self._entries)
+            for u, v in zip(rows_u, rows_v)
+        ]
+
+
+def weighted(weights: Sequence[Scalar]) -> GramInnerProduct:
+    """The weighted inner product sum w_i * u_i * v_i (a diagonal Gram matrix)."""
+    return GramInnerProduct(
+        [[w if i == j else 0 for j in range(len(weights))] for i, w in enumerate(weights)]
+    )
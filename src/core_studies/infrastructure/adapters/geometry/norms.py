@@ -0,0 +1,70 @@
+import math
+from typing import List, Sequence
+
+from core_studies.application.checkers.coordinates import to_coordinates
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.ports.Operations import IInnerProductPort, INormPort, Scalar
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class LpNorm(INormPort):
+    """
+    This adapter implements INormPort as the p-norm of the coordinates
+    of a dataclass element: (sum |x_i|^p)^(1/p), or max |x_i| for
+    p = inf. It is a norm for p >= 1 only; smaller p give functions
+    that break the triangle inequality.
+
+    A batch is evaluated as one `numpy.linalg.norm` call when NumPy is
+    installed and every coordinate is a float. The pure Python fallback
+    keeps p = 1 and p = inf exact for exact coordinates.
+    """
+
+    def __init__(self, p: float = 2.0):
+        """
+        Args:
+            p: The exponent; math.inf for the maximum norm.
+        """
+        if not p > 0:
+            raise ValueError(f"p must be positive, got {p}.")
+        self.p = p
+
+    def execute(self, element: AlgebraicElement) -> Scalar:
+        return self.execute_batch([element])[0]
+
+    def execute_batch(self, elements: Sequence[AlgebraicElement]) -> List[Scalar]:
+        rows = [to_coordinates(element) for element in elements]
+
+        if np is not None and rows and all(type(value) is float for row in rows for value in row):
+            return np.linalg.norm(np.asarray(rows), ord=self.p, axis=1).tolist()
+        if self.p == 1:
+            return [sum(map(abs, row)) for row in rows]
+        if self.p == math.inf:
+            return [max(map(abs, row), default=0) for row in rows]
+        if self.p == 2:
+            return [math.hypot(*row) for row in rows]
+        return [sum(abs(x) ** self.p for x in row) ** (1 / self.p) for row in rows]
+
+
+class InducedNorm(INormPort):
+    """
+    This adapter implements INormPort as the norm an inner product
+    induces: ||u|| = sqrt(<u, u>). A batch costs one batch of the inner
+    product.
+    """
+
+    def __init__(self, inner_product: IInnerProductPort):
+        self.inner_product = inner_product
+
+    def execute(self, element: AlgebraicElement) -> Scalar:
+        return self.execute_batch([element])[0]
+
+    def execute_batch(self, elements: Sequence[AlgebraicElement]) -> List[Scalar]:
+        squares = self.inner_product.execute_batch(elements, elements)
+        for element, square in zip(elements, squares):
+            if square < 0:
+                raise ValueError(f"<{element}, {element}> = {square} is negative; it induces no norm.")
+        return [math.sqrt(square) for square in squares]
@@ -0,0 +1,52 @@
+import math
+
+from .inner_products import FrobeniusInnerProduct, GramInnerProduct, weighted
+from .norms import InducedNorm, LpNorm
+
+
+def r3_weighted_inner_product() -> GramInnerProduct:
+    """<u, v> = u.x*v.x + 2*u.y*v.y + 3*u.z*v.z (an inner product)."""
+    return weighted([1.0, 2.0, 3.0])
+
+
+def r3_minkowski_form() -> GramInnerProduct:
+    """
+    <u, v> = u.x*v.x + u.y*v.y - u.z*v.z: symmetric and bilinear, but
+    indefinite (not an inner product).
+    """
+    return weighted([1.0, 1.0, -1.0])
+
+
+def r3_skew_form() -> GramInnerProduct:
+    """
+    <u, v> = u.x*v.x + u.x*v.y + u.y*v.y + u.z*v.z: bilinear with
+    <u, u> > 0 for u != 0, but not symmetric (not an inner product).
+    """
+    return GramInnerProduct(
+        [[1.0, 1.0, 0.0],
+         [0.0, 1.0, 0.0],
+         [0.0, 0.0, 1.0]]
+    )
+
+
+def r3_euclidean_norm() -> InducedNorm:
+    """sqrt(x² + y² + z²), induced by the dot product (a norm)."""
+    return InducedNorm(FrobeniusInnerProduct())
+
+
+def r3_taxicab_norm() -> LpNorm:
+    """|x| + |y| + |z| (a norm)."""
+    return LpNorm(1)
+
+
+def r3_max_norm() -> LpNorm:
+    """max(|x|, |y|, |z|) (a norm)."""
+    return LpNorm(math.inf)
+
+
+def r3_half_norm() -> LpNorm:
+    """
+    (sqrt|x| + sqrt|y| + sqrt|z|)²: homogeneous and positive, but
+    it breaks the triangle inequality (not a norm).
+    """
+    return LpNorm(0.5)
@@ -0,0 +1,84 @@
+import operator
+from typing import List, Sequence, Type
+
+from core_studies.application.checkers.coordinates import from_coordinates, to_coordinates
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.ports.Map import IMatrixMapPort
+from core_studies.domain.ports.Operations import Scalar
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class MatrixMapAdapter(IMatrixMapPort):
+    """
+    This adapter implements IMatrixMapPort for dataclass elements: the
+    image of an element is the matrix times its coordinates.
+
+    A batch is evaluated as one matrix product (coordinates stacked as
+    rows, times the transposed matrix): a single GEMM with NumPy when it
+    is installed and every coordinate is a float, a plain Python product
+    otherwise (which also keeps exact coordinates, e.g. Fractions, exact).
+    """
+
+    def __init__(
+        self,
+        matrix: Sequence[Sequence[Scalar]],
+        source_type: Type[AlgebraicElement],
+        target_type: Type[AlgebraicElement],
+    ):
+        """
+        Args:
+            matrix: Its rows; one per target coordinate, each with one
+                    entry per source coordinate.
+            source_type: The dataclass the map is applied to.
+            target_type: The dataclass images are built as.
+        """
+        self._matrix = [list(row) for row in matrix]
+        self._source_type = source_type
+        self._target_type = target_type
+
+    @property
+    def matrix(self) -> Sequence[Sequence[Scalar]]:
+        return self._matrix
+
+    def execute(self, element: AlgebraicElement) -> AlgebraicElement:
+        return self.execute_batch([element])[0]
+
+    def execute_batch(self, elements: Sequence[AlgebraicElement]) -> List[AlgebraicElement]:
+        for element in elements:
+            if not isinstance(element, self._source_type):
+                raise TypeError(
+                    f"{type(self).__name__} can only operate on "
+                    f"{self._source_type.__name__} instances."
+                )
+        rows = [to_coordinates(element) for element in elements]
+
+        if np is not None and all(type(value) is float for row in rows for value in row):
+            images = (np.asarray(rows, dtype=float) @ np.asarray(self._matrix, dtype=float).T).tolist()
+        else:
+            images = list(zip(*self._product(list(zip(*rows)), len(rows))))
+        return [from_coordinates(self._target_type, image) for image in images]
+
+    def _product(self, columns: List[Sequence[Scalar]], count: int) -> List[Sequence[Scalar]]:
+        """
+        The matrix product in pure Python, column by column: target
+        coordinate j of every element at once is the sum of the source
+        coordinate columns weighted by row j. Zero entries are skipped
+        and unit entries reuse the column, which makes projections and
+        permutations (e.g. rotations by 90 degrees) nearly free.
+        """
+        result: List[Sequence[Scalar]] = []
+        for matrix_row in self._matrix:
+            total: Sequence[Scalar] = [0 * x for x in columns[0]] if columns else [0] * count
+            started = False
+            for a, column in zip(matrix_row, columns):
+                if a == 0:
+                    continue
+                term = column if a == 1 else [a * x for x in column]
+                total = term if not started else list(map(operator.add, total, term))
+                started = True
+            result.append(total)
+        return result
@@ -0,0 +1,38 @@
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.ports.Map import IMapPort
+from ...elements.r3_vector import R3Vector
+from .matrix_map import MatrixMapAdapter
+
+
+class R3XTranslationMap(IMapPort):
+    """
+    This adapter implements IMapPort as the translation v -> v + (1, 0, 0).
+
+    It is affine, not linear: it does not even send zero to zero.
+    """
+
+    def execute(self, element: AlgebraicElement) -> AlgebraicElement:
+        if not isinstance(element, R3Vector):
+            raise TypeError("R3XTranslationMap can only operate on R3Vector instances.")
+
+        return R3Vector(x=element.x + 1, y=element.y, z=element.z)
+
+
+def xy_projection() -> MatrixMapAdapter:
+    """Orthogonal projection onto the plane z = 0 (linear)."""
+    return MatrixMapAdapter(
+        [[1.0, 0.0, 0.0],
+         [0.0, 1.0, 0.0],
+         [0.0, 0.0, 0.0]],
+        R3Vector, R3Vector,
+    )
+
+
+def z_rotation() -> MatrixMapAdapter:
+    """Rotation by 90 degrees about the z axis (linear)."""
+    return MatrixMapAdapter(
+        [[0.0, -1.0, 0.0],
+         [1.0, 0.0, 0.0],
+         [0.0, 0.0, 1.0]],
+        R3Vector, R3Vector,
+    )
@@ -0,0 +1,145 @@
+from typing import Any, Generic, List, Tuple, Type, TypeVar
+
+from core_studies.application.checkers.coordinates import coordinate_names, from_coordinates
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.ports.Operations import Scalar
+from core_studies.domain.ports.Provider import IElementProviderPort
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pc = pq = None
+
+ET = TypeVar('ET', bound=AlgebraicElement)
+
+# (values, rows): the flattened float64 column of one record batch, viewed
+# in place, and how many samples (rows) it holds.
+_Column = Tuple[memoryview, int]
+
+
+def _batches(path: str) -> List[Any]:
+    if path.endswith(".parquet"):
+        return pq.read_table(path, memory_map=True).to_batches()
+    reader = pa.ipc.open_file(pa.memory_map(path))
+    return [reader.get_batch(i) for i in range(reader.num_record_batches)]
+
+
+def _view(column: Any) -> memoryview:
+    """The values of a list<float64> column as doubles, without copying."""
+    values = column.flatten()
+    data = memoryview(values.buffers()[1]).cast("d")
+    return data[values.offset:values.offset + len(values)]
+
+
+def exported_axioms(path: str) -> List[str]:
+    """Names of the axioms that have samples in an exported file."""
+    if pa is None:
+        raise RuntimeError("Replaying samples requires pyarrow (pip install pyarrow).")
+    names: List[str] = []
+    for batch in _batches(path):
+        for name in pc.unique(batch.column("axiom")).to_pylist():
+            if name not in names:
+                names.append(name)
+    return names
+
+
+class ArrowReplayElementProvider(Generic[ET], IElementProviderPort[ET]):
+    """
+    An element provider that replays the samples of one axiom from a
+    file written by `ArrowSampleExporter`, instead of drawing new ones.
+
+    Arrow IPC files are memory-mapped and their coordinate columns are
+    read in place (no copy); only the elements handed out are built.
+    Each request takes the next samples in file order, laid out the way
+    the checkers split a draw (element j of sample i at j * n + i), so
+    a checker with the same sample budget sees exactly the exported
+    samples. The samples repeat from the start once exhausted.
+
+    Requires pyarrow.
+    """
+
+    def __init__(self, path: str, element_type: Type[ET], axiom: str):
+        """
+        Args:
+            path: A ".arrow" (IPC file) or ".parquet" export.
+            element_type: The dataclass the coordinates belong to.
+            axiom: Whose samples to replay (the checker's axiom_name).
+
+        Raises:
+            RuntimeError: If pyarrow is not installed.
+            ValueError: If the file has no samples of 'axiom'.
+        """
+        if pa is None:
+            raise RuntimeError("Replaying samples requires pyarrow (pip install pyarrow).")
+        self._element_type = element_type
+        self._dimension = len(coordinate_names(element_type))
+        self._elements: List[_Column] = []
+        self._scalars: List[_Column] = []
+
+        for batch in _batches(path):
+            matches = pc.equal(batch.column("axiom"), axiom)
+            if not pc.any(matches).as_py():
+                continue
+            if not pc.all(matches).as_py():
+                batch = batch.filter(matches)
+            self._elements.append((_view(batch.column("elements")), batch.num_rows))
+            self._scalars.append((_view(batch.column("scalars")), batch.num_rows))
+
+        if not self._elements:
+            raise ValueError(f"No exported samples of '{axiom}' in {path}")
+        self._element_cursor = [0, 0]
+        self._scalar_cursor = [0, 0]
+
+    def get_elements(self, count: int) -> List[ET]:
+        """Returns the elements of the next samples (see the class docstring)."""
+        rows = self._next_rows(self._elements, self._element_cursor, count, self._dimension)
+        return [
+            from_coordinates(self._element_type, coordinates)
+            for coordinates in self._interleave(rows, count, self._dimension)
+        ]
+
+    def get_scalars(self, count: int) -> List[Scalar]:
+        """Returns the scalars of the next samples (see the class docstring)."""
+        rows = self._next_rows(self._scalars, self._scalar_cursor, count, 1)
+        return [values[0] for values in self._interleave(rows, count, 1)]
+
+    def _next_rows(
+        self, columns: List[_Column], cursor: List[int], count: int, dimension: int
+    ) -> List[memoryview]:
+        """
+        Advances 'cursor' (batch, row) over as many samples as 'count'
+        values need and returns each sample's values.
+        """
+        values, rows = columns[cursor[0]]
+        per_sample = len(values) // (rows * dimension) if rows else 0
+        samples = count // per_sample if per_sample else 0
+
+        result: List[memoryview] = []
+        while len(result) < samples:
+            values, rows = columns[cursor[0]]
+            width = len(values) // rows
+            row = cursor[1]
+            result.append(values[row * width:(row + 1) * width])
+            cursor[1] += 1
+            if cursor[1] == rows:
+                cursor[0] = (cursor[0] + 1) % len(columns)
+                cursor[1] = 0
+        return result
+
+    @staticmethod
+    def _interleave(rows: List[memoryview], count: int, dimension: int) -> List[Tuple[float, ...]]:
+        """
+        Orders the per-sample values so that value j of sample i lands
+        at position j * len(rows) + i, matching `elements[i::n]`.
+        """
+        if not rows:
+            return []
+        per_sample = len(rows[0]) // dimension
+        ordered = [
+            tuple(row[j * dimension:(j + 1) * dimension])
+            for j in range(per_sample)
+            for row in rows
+        ]
+        return ordered[:count]
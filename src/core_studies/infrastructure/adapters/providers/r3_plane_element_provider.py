@@ -0,0 +1,62 @@
+from typing import List, Optional, Tuple
+from core_studies.domain.ports.Provider import IElementProviderPort
+from core_studies.domain.ports.Operations import Scalar
+from ...elements.r3_vector import R3Vector
+from .r3_standard_element_provider import R3StandardElementProvider
+
+
+class R3PlaneElementProvider(IElementProviderPort[R3Vector]):
+    """
+    This adapter implements IElementProviderPort for a plane in R^3
+    (a*x + b*y + c*z = d): it draws points from a base provider and
+    projects them orthogonally onto the plane.
+    """
+
+    def __init__(
+        self,
+        normal: Tuple[float, float, float] = (0.0, 0.0, 1.0),
+        offset: float = 0.0,
+        base: Optional[IElementProviderPort[R3Vector]] = None,
+    ):
+        """
+        Args:
+            normal: The coefficients (a, b, c); must not be all zero.
+            offset: The constant d.
+            base: Provider of the points to project (and of the scalars).
+        """
+        a, b, c = normal
+        norm_sq = a * a + b * b + c * c
+        if norm_sq == 0:
+            raise ValueError("The plane normal must not be the zero vector.")
+
+        self._normal = (a, b, c)
+        self._norm_sq = norm_sq
+        self._offset = offset
+        self._base = base if base is not None else R3StandardElementProvider()
+
+    def get_elements(self, count: int) -> List[R3Vector]:
+        """
+        Returns a list of 'count' random R3Vector instances on the plane.
+        """
+        a, b, c = self._normal
+        elements: List[R3Vector] = []
+        for p in self._base.get_elements(count):
+            t = (a * p.x + b * p.y + c * p.z - self._offset) / self._norm_sq
+            elements.append(R3Vector(x=p.x - t * a, y=p.y - t * b, z=p.z - t * c))
+        return elements
+
+    def get_scalars(self, count: int) -> List[Scalar]:
+        """
+        Returns a list of 'count' random scalars from the base provider.
+        """
+        return self._base.get_scalars(count)
+
+
+def xy_plane_elements() -> R3PlaneElementProvider:
+    """Samples of the plane z = 0."""
+    return R3PlaneElementProvider(normal=(0.0, 0.0, 1.0), offset=0.0)
+
+
+def z_equals_one_plane_elements() -> R3PlaneElementProvider:
+    """Samples of the plane z = 1."""
+    return R3PlaneElementProvider(normal=(0.0, 0.0, 1.0), offset=1.0)
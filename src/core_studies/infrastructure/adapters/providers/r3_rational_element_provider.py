@@ -0,0 +1,68 @@
+import random
+from fractions import Fraction
+from typing import List
+from core_studies.domain.ports.Provider import IElementProviderPort
+from core_studies.domain.ports.Operations import Scalar
+from ...elements.r3_vector import R3Vector
+
+
+class R3RationalElementProvider(IElementProviderPort[R3Vector]):
+    """
+    This adapter implements IElementProviderPort to provide
+    random R3Vector vectors and scalars with exact rational
+    (fractions.Fraction) components.
+
+    Exact samples make R3Vector compare with == instead of a float
+    tolerance, so there is neither round-off to forgive nor a
+    tolerance that can hide a real failure.
+    """
+
+    def __init__(
+        self,
+        max_numerator: int = 1000,
+        max_denominator: int = 100,
+        max_scalar_numerator: int = 50,
+        max_scalar_denominator: int = 10,
+    ):
+        """
+        Initializes the provider with the bounds for generation.
+        """
+        self._max_numerator = max_numerator
+        self._max_denominator = max_denominator
+        self._max_scalar_numerator = max_scalar_numerator
+        self._max_scalar_denominator = max_scalar_denominator
+
+    def get_elements(self, count: int) -> List[R3Vector]:
+        """
+        Returns a list of 'count' random R3Vector instances.
+        """
+        return [
+            R3Vector(
+                x=self._fraction(self._max_numerator, self._max_denominator),
+                y=self._fraction(self._max_numerator, self._max_denominator),
+                z=self._fraction(self._max_numerator, self._max_denominator)
+            )
+            for _ in range(count)
+        ]
+
+    def get_scalars(self, count: int) -> List[Scalar]:
+        """
+        Returns a list of 'count' random rational scalars.
+        """
+        scalars: List[Scalar] = [
+            self._fraction(self._max_scalar_numerator, self._max_scalar_denominator)
+            for _ in range(count)
+        ]
+
+        if count > 0 and 0 not in scalars:
+            scalars[0] = Fraction(0)
+        if count > 1 and 1 not in scalars:
+            scalars[1] = Fraction(1)
+
+        return scalars
+
+    def _fraction(self, max_numerator: int, max_denominator: int) -> Fraction:
+        return Fraction(
+            random.randint(-max_numerator, max_numerator),
+            random.randint(1, max_denominator)
+        )
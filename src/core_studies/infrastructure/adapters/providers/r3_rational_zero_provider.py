@@ -0,0 +1,18 @@
+from fractions import Fraction
+from core_studies.domain.ports.Provider import IZeroElementProviderPort
+from ...elements.r3_vector import R3Vector
+
+class R3RationalZeroProvider(IZeroElementProviderPort[R3Vector]):
+    """
+    A provider that implements a IZeroElementProviderPort for R3 vectors
+    with exact rational components: the zero element (0,0,0) as Fractions.
+    """
+    
+    def get(self) -> R3Vector:
+        """
+        Get the exact zero element for rational R3 vectors.
+        
+        Returns:
+            R3Vector: The zero element (0,0,0) with Fraction components.
+        """
+        return R3Vector(x=Fraction(0), y=Fraction(0), z=Fraction(0))
@@ -0,0 +1,121 @@
+import random
+from typing import Callable, List, Sequence
+from core_studies.domain.ports.Provider import IElementProviderPort
+from core_studies.domain.ports.Operations import Scalar
+from ...elements.r3_vector import R3Vector
+
+# Magnitudes are bounded so that, under R3Vector's float tolerance, no
+# correct operation on these samples can fail through round-off alone.
+LARGE = 1e4
+SMALL = 1e-6
+SUBNORMAL = 5e-324
+LARGE_SCALAR = 100.0
+
+# Scalars that commonly expose broken operations.
+SPECIAL_SCALARS: Sequence[float] = (0.0, 1.0, -1.0, 2.0, -2.0, 0.5, -0.5, SMALL, -SMALL, LARGE_SCALAR, -LARGE_SCALAR)
+
+
+class R3StratifiedElementProvider(IElementProviderPort[R3Vector]):
+    """
+    This adapter implements IElementProviderPort with stratified,
+    adversarial sampling instead of pure uniform sampling.
+
+    Each sample is drawn from one of several strata: uniform vectors,
+    the zero vector, (signed, scaled) basis vectors, repeated
+    coordinates, vectors with some zero coordinates, all sign
+    combinations, and very large, very small and subnormal magnitudes.
+    Operations that only break on such inputs fail after a handful of
+    samples instead of thousands.
+    """
+
+    def __init__(
+        self,
+        element_range: tuple[float, float] = (-10.0, 10.0),
+        scalar_range: tuple[float, float] = (-5.0, 5.0),
+        uniform_share: float = 0.3,
+    ):
+        """
+        Initializes the provider.
+
+        Args:
+            element_range: Range of the uniform element stratum.
+            scalar_range: Range of the uniform scalar stratum.
+            uniform_share: Fraction of samples drawn uniformly; the rest
+                           is spread evenly over the adversarial strata.
+        """
+        self._element_min, self._element_max = element_range
+        self._scalar_min, self._scalar_max = scalar_range
+
+        self._strata: List[Callable[[], R3Vector]] = [
+            self._uniform,
+            self._zero,
+            self._basis,
+            self._repeated,
+            self._some_zeros,
+            self._signs,
+            self._large,
+            self._small,
+        ]
+        adversarial = (1.0 - uniform_share) / (len(self._strata) - 1)
+        self._weights = [uniform_share] + [adversarial] * (len(self._strata) - 1)
+
+    def get_elements(self, count: int) -> List[R3Vector]:
+        """
+        Returns a list of 'count' R3Vector instances drawn from the strata.
+        """
+        strata = random.choices(self._strata, weights=self._weights, k=count)
+        return [stratum() for stratum in strata]
+
+    def get_scalars(self, count: int) -> List[Scalar]:
+        """
+        Returns a list of 'count' scalars: about half special values
+        (0, ±1, ±2, ±0.5, tiny, large), half uniform or integer.
+        """
+        scalars: List[Scalar] = []
+        for _ in range(count):
+            roll = random.random()
+            if roll < 0.5:
+                scalar = random.choice(SPECIAL_SCALARS)
+            elif roll < 0.75:
+                scalar = random.uniform(self._scalar_min, self._scalar_max)
+            else:
+                scalar = float(random.randint(int(self._scalar_min), int(self._scalar_max)))
+            scalars.append(scalar)
+
+        if count > 0 and 0.0 not in scalars:
+            scalars[0] = 0.0
+        if count > 1 and 1.0 not in scalars:
+            scalars[1] = 1.0
+
+        return scalars
+
+    def _coordinate(self) -> float:
+        return random.uniform(self._element_min, self._element_max)
+
+    def _uniform(self) -> R3Vector:
+        return R3Vector(x=self._coordinate(), y=self._coordinate(), z=self._coordinate())
+
+    def _zero(self) -> R3Vector:
+        return R3Vector(x=0.0, y=0.0, z=0.0)
+
+    def _basis(self) -> R3Vector:
+        coordinates = [0.0, 0.0, 0.0]
+        coordinates[random.randrange(3)] = random.choice((1.0, -1.0, self._coordinate()))
+        return R3Vector(*coordinates)
+
+    def _repeated(self) -> R3Vector:
+        value = self._coordinate()
+        return R3Vector(x=value, y=value, z=value)
+
+    def _some_zeros(self) -> R3Vector:
+        return R3Vector(*(0.0 if random.random() < 0.5 else self._coordinate() for _ in range(3)))
+
+    def _signs(self) -> R3Vector:
+        return R3Vector(*(random.choice((1.0, -1.0)) * abs(self._coordinate()) for _ in range(3)))
+
+    def _large(self) -> R3Vector:
+        return R3Vector(*(random.uniform(-LARGE, LARGE) for _ in range(3)))
+
+    def _small(self) -> R3Vector:
+        magnitude = random.choice((SMALL, SUBNORMAL))
+        return R3Vector(*(random.choice((1.0, -1.0)) * magnitude * random.random() for _ in range(3)))
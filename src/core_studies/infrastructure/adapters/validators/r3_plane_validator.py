@@ -0,0 +1,50 @@
+import math
+from typing import Tuple
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.ports.Validator import IElementValidatorPort
+from ...elements.r3_vector import R3Vector
+
+
+class R3PlaneValidator(IElementValidatorPort[R3Vector]):
+    """
+    This adapter implements IElementValidatorPort for a plane in R^3:
+    the set of (x, y, z) with a*x + b*y + c*z = d.
+
+    It is a subspace only when d = 0.
+    """
+
+    def __init__(
+        self,
+        normal: Tuple[float, float, float] = (0.0, 0.0, 1.0),
+        offset: float = 0.0,
+        tolerance: float = 1e-9,
+    ):
+        """
+        Args:
+            normal: The coefficients (a, b, c).
+            offset: The constant d.
+            tolerance: Absolute tolerance for the plane equation.
+        """
+        self._a, self._b, self._c = normal
+        self._offset = offset
+        self._tolerance = tolerance
+
+    def validate(self, element: AlgebraicElement) -> bool:
+        """
+        Returns True if the element is an R3Vector lying on the plane.
+        """
+        if not isinstance(element, R3Vector):
+            return False
+
+        value = self._a * element.x + self._b * element.y + self._c * element.z
+        return math.isclose(value, self._offset, rel_tol=1e-9, abs_tol=self._tolerance)
+
+
+def xy_plane() -> R3PlaneValidator:
+    """The plane z = 0 (a subspace)."""
+    return R3PlaneValidator(normal=(0.0, 0.0, 1.0), offset=0.0)
+
+
+def z_equals_one_plane() -> R3PlaneValidator:
+    """The plane z = 1 (not a subspace: it misses the origin)."""
+    return R3PlaneValidator(normal=(0.0, 0.0, 1.0), offset=1.0)
@@ -7,7 +7,8 @@ from core_studies.domain.entities.Element import AlgebraicElement
 class R3Vector(AlgebraicElement):
     """
     Represents a vector in 3-dimensional Euclidean space (R³).
-    ... uses math.isclose for floating point comparisons.
+    ... uses math.isclose for floating point comparisons; other
+    component types (exact or symbolic values) are compared with ==.
     """
     x: float
     y: float
@@ -22,11 +23,16 @@ class R3Vector(AlgebraicElement):
             return NotImplemented # Important for compatibility
         
         return (
-            math.isclose(self.x, other.x, abs_tol=self._tolerance) and
-            math.isclose(self.y, other.y, abs_tol=self._tolerance) and
-            math.isclose(self.z, other.z, abs_tol=self._tolerance)
+            self._close(self.x, other.x) and
+            self._close(self.y, other.y) and
+            self._close(self.z, other.z)
         )
 
+    def _close(self, a: float, b: float) -> bool:
+        if isinstance(a, float) or isinstance(b, float):
+            return math.isclose(a, b, abs_tol=self._tolerance)
+        return a == b
+
     def __repr__(self) -> str:
         """Return representation of the vector."""
         return f"R3Vector(x={self.x}, y={self.y}, z={self.z})"
\ No newline at end of file
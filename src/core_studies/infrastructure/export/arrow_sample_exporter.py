@@ -0,0 +1,87 @@
+from typing import Any, Sequence
+
+from core_studies.application.checkers.coordinates import to_coordinates
+from core_studies.application.ports.sample_sink import ISampleSinkPort, Sample
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# One row per sample. 'elements' holds the coordinates of the sample's
+# elements back to back (e.g. u.x, u.y, u.z, v.x, v.y, v.z for A1).
+SCHEMA = (
+    pa.schema([
+        ("axiom", pa.string()),
+        ("elements", pa.list_(pa.float64())),
+        ("scalars", pa.list_(pa.float64())),
+        ("residual", pa.float64()),
+        ("passed", pa.bool_()),
+    ])
+    if pa is not None else None
+)
+
+
+def _flatten(elements: Sequence[Any]) -> list:
+    return [float(value) for element in elements for value in to_coordinates(element)]
+
+
+class ArrowSampleExporter(ISampleSinkPort):
+    """
+    An adapter that implements ISampleSinkPort by streaming samples and
+    their outcomes to a columnar file: Parquet if 'path' ends in
+    ".parquet", an Arrow IPC file otherwise.
+
+    Every chunk a checker reports becomes one record batch (one row
+    group in Parquet), so a run of any size is written with the memory
+    of a single chunk. All chunks of a batch belong to one axiom, which
+    lets `ArrowReplayElementProvider` select an axiom's samples without
+    copying. Coordinates and scalars are stored as float64.
+
+    Requires pyarrow.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: The file to create (overwritten if it exists).
+
+        Raises:
+            RuntimeError: If pyarrow is not installed.
+        """
+        if pa is None:
+            raise RuntimeError("Exporting samples requires pyarrow (pip install pyarrow).")
+        self.path = path
+        if path.endswith(".parquet"):
+            self._writer = pq.ParquetWriter(path, SCHEMA)
+        else:
+            self._writer = pa.ipc.new_file(path, SCHEMA)
+
+    def write(
+        self,
+        axiom: str,
+        samples: Sequence[Sample],
+        residuals: Sequence[float],
+        passed: Sequence[bool],
+    ) -> None:
+        batch = pa.RecordBatch.from_pydict(
+            {
+                "axiom": [axiom] * len(samples),
+                "elements": [_flatten(elements) for elements, _ in samples],
+                "scalars": [[float(k) for k in scalars] for _, scalars in samples],
+                "residual": list(residuals),
+                "passed": list(passed),
+            },
+            schema=SCHEMA,
+        )
+        self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def __enter__(self) -> "ArrowSampleExporter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,38 @@
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+from core_studies.application.ports.rate_limit_store import IRateLimitStorePort
+
+# Buckets kept before the least recently used one is dropped; a dropped
+# bucket comes back full, so the limit should exceed the clients seen
+# within one refill period ('burst' / 'rate' seconds).
+MAX_BUCKETS = 100_000
+
+
+class InMemoryRateLimitStore(IRateLimitStorePort):
+    """
+    An adapter that implements IRateLimitStorePort in an LRU dict of
+    (tokens, last refill) per client: O(1) per decision, including
+    evictions, and no I/O. Each process has its own buckets.
+    """
+
+    def __init__(self, max_buckets: int = MAX_BUCKETS):
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, cost: float, rate: float, capacity: float, now: float) -> float:
+        cost = max(cost, 0.0)
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            if tokens >= cost:
+                self._buckets[key] = (tokens - cost, now)
+                wait = 0.0
+            else:
+                self._buckets[key] = (tokens, now)
+                wait = (cost - tokens) / rate if rate > 0 else float("inf")
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        return wait
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from fractions import Fraction
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+from core_studies.application.checkers.coordinates import from_coordinates, to_coordinates
+from core_studies.application.ports.counterexample_corpus import Counterexample, ICounterexampleCorpusPort
+from core_studies.domain.entities.Element import AlgebraicElement
+from core_studies.domain.ports.Operations import Scalar
+
+MAX_PER_AXIOM = 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS counterexamples (
+    recipe    TEXT    NOT NULL,
+    axiom     TEXT    NOT NULL,
+    key       TEXT    NOT NULL,
+    sample    TEXT    NOT NULL,
+    hits      INTEGER NOT NULL DEFAULT 1,
+    last_seen REAL    NOT NULL,
+    PRIMARY KEY (recipe, axiom, key)
+);
+"""
+
+
+def _encode(value: Any) -> Any:
+    """Numbers as JSON: Fractions become "p/q" strings to stay exact."""
+    if isinstance(value, Fraction):
+        return f"{value.numerator}/{value.denominator}"
+    return value
+
+
+def _decode(value: Any) -> Any:
+    return Fraction(value) if isinstance(value, str) else value
+
+
+class SQLiteCounterexampleCorpus(ICounterexampleCorpusPort):
+    """
+    An adapter that implements ICounterexampleCorpusPort on a local
+    SQLite file (it can share the result store's database).
+
+    Samples are stored as the coordinates of their elements plus their
+    scalars, keyed by a hash of that content, so the same counterexample
+    is stored once (its hit count and last-seen time are bumped). Each
+    (recipe, axiom) keeps at most 'max_per_axiom' samples, evicting the
+    least recently seen. A recipe's corpus is loaded with one query and
+    cached in memory until it changes.
+    """
+
+    def __init__(self, path: str, max_per_axiom: int = MAX_PER_AXIOM):
+        """
+        Args:
+            path: The SQLite database file, created if missing.
+            max_per_axiom: How many counterexamples to keep per axiom.
+        """
+        self.path = path
+        self.max_per_axiom = max_per_axiom
+        self._lock = threading.RLock()
+        self._cache: Dict[Tuple[str, type], Dict[str, List[Counterexample]]] = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def load(
+        self, recipe: str, element_type: Type[AlgebraicElement]
+    ) -> Dict[str, List[Counterexample]]:
+        with self._lock:
+            corpus = self._cache.get((recipe, element_type))
+            if corpus is None:
+                corpus = {}
+                rows = self._connection.execute(
+                    "SELECT axiom, sample FROM counterexamples WHERE recipe = ? ORDER BY last_seen DESC",
+                    (recipe,),
+                )
+                for axiom, sample in rows:
+                    decoded = json.loads(sample)
+                    try:
+                        elements = [
+                            from_coordinates(element_type, [_decode(v) for v in coordinates])
+                            for coordinates in decoded["elements"]
+                        ]
+                    except (TypeError, ValueError):
+                        # Stored for an element type the recipe no longer uses.
+                        continue
+                    scalars = [_decode(v) for v in decoded["scalars"]]
+                    corpus.setdefault(axiom, []).append((elements, scalars))
+                self._cache[(recipe, element_type)] = corpus
+            return corpus
+
+    def add(
+        self,
+        recipe: str,
+        axiom: str,
+        elements: Sequence[AlgebraicElement],
+        scalars: Sequence[Scalar],
+    ) -> None:
+        try:
+            sample = json.dumps({
+                "elements": [[_encode(v) for v in to_coordinates(e)] for e in elements],
+                "scalars": [_encode(v) for v in scalars],
+            })
+        except TypeError:
+            # No coordinate view (or non-numeric values): nothing to replay.
+            return
+        key = hashlib.sha256(sample.encode()).hexdigest()[:16]
+
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.execute(
+                    "INSERT INTO counterexamples (recipe, axiom, key, sample, last_seen) VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (recipe, axiom, key) DO UPDATE SET hits = hits + 1, last_seen = excluded.last_seen",
+                    (recipe, axiom, key, sample, time.time()),
+                )
+                self._connection.execute(
+                    "DELETE FROM counterexamples WHERE recipe = ? AND axiom = ? AND key NOT IN ("
+                    " SELECT key FROM counterexamples WHERE recipe = ? AND axiom = ?"
+                    " ORDER BY last_seen DESC LIMIT ?)",
+                    (recipe, axiom, recipe, axiom, self.max_per_axiom),
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+            for cached in [key for key in self._cache if key[0] == recipe]:
+                del self._cache[cached]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,63 @@
+import sqlite3
+import threading
+
+from core_studies.application.ports.rate_limit_store import IRateLimitStorePort
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    key     TEXT PRIMARY KEY,
+    tokens  REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+
+class SQLiteRateLimitStore(IRateLimitStorePort):
+    """
+    An adapter that implements IRateLimitStorePort on a local SQLite
+    file, so that every worker process of the server (e.g. uvicorn
+    --workers) draws from the same buckets. Each decision is one short
+    write transaction.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: The SQLite database file, created if missing.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def take(self, key: str, cost: float, rate: float, capacity: float, now: float) -> float:
+        cost = max(cost, 0.0)
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)
+                ).fetchone()
+                tokens, updated = row if row is not None else (capacity, now)
+                tokens = min(capacity, tokens + max(now - updated, 0.0) * rate)
+                if tokens >= cost:
+                    tokens -= cost
+                    wait = 0.0
+                else:
+                    wait = (cost - tokens) / rate if rate > 0 else float("inf")
+                connection.execute(
+                    "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                    (key, tokens, now),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return wait
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,141 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from core_studies.application.ports.result_store import IResultStorePort, RunRecord
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY,
+    recipe      TEXT    NOT NULL,
+    recipe_hash TEXT    NOT NULL,
+    seed        INTEGER,
+    samples     INTEGER,
+    passed      INTEGER NOT NULL,
+    seconds     REAL    NOT NULL,
+    created_at  REAL    NOT NULL
+);
+CREATE TABLE IF NOT EXISTS axiom_results (
+    run_id  INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    axiom   TEXT    NOT NULL,
+    passed  INTEGER NOT NULL,
+    seconds REAL,
+    reason  TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_recipe_time ON runs (recipe, created_at);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (created_at);
+CREATE INDEX IF NOT EXISTS axiom_results_by_run ON axiom_results (run_id);
+"""
+
+
+class SQLiteResultStore(IResultStorePort):
+    """
+    An adapter that implements IResultStorePort on a local SQLite file.
+
+    Runs go to `runs` and their per-axiom outcomes (with the failure
+    reason, which carries the counterexample) to `axiom_results`, both
+    indexed by recipe and time. The database runs in WAL mode with
+    NORMAL synchronisation, and `batch()` / `save_runs` write many runs
+    in one transaction, so recording costs well under a millisecond per
+    run. Pass ":memory:" or a temporary file path in tests.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: The SQLite database file, created if missing.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        with self._lock:
+            outermost = self._depth == 0
+            if outermost:
+                self._connection.execute("BEGIN")
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                self._depth -= 1
+                if outermost:
+                    self._connection.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if outermost:
+                self._connection.execute("COMMIT")
+
+    def save_runs(self, runs: Sequence[RunRecord]) -> List[int]:
+        with self.batch():
+            ids: List[int] = []
+            rows: List[tuple] = []
+            for run in runs:
+                cursor = self._connection.execute(
+                    "INSERT INTO runs (recipe, recipe_hash, seed, samples, passed, seconds, created_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        run["recipe"], run["recipe_hash"], run.get("seed"), run.get("samples"),
+                        int(run["passed"]), run["seconds"], run["created_at"],
+                    ),
+                )
+                run_id = cursor.lastrowid
+                ids.append(run_id)
+                rows.extend(
+                    (run_id, axiom["axiom"], int(axiom["passed"]), axiom.get("seconds"), axiom.get("reason"))
+                    for axiom in run["axioms"]
+                )
+            self._connection.executemany(
+                "INSERT INTO axiom_results (run_id, axiom, passed, seconds, reason) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        return ids
+
+    def get_run(self, run_id: int) -> Optional[RunRecord]:
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+            if row is None:
+                return None
+            return self._with_axioms([row])[0]
+
+    def history(self, recipe: str, limit: int = 50) -> List[RunRecord]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT * FROM runs WHERE recipe = ? ORDER BY created_at DESC, id DESC LIMIT ?",
+                (recipe, limit),
+            ).fetchall()
+            return self._with_axioms(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _with_axioms(self, rows: Sequence[sqlite3.Row]) -> List[RunRecord]:
+        runs: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            run = dict(row)
+            run["passed"] = bool(run["passed"])
+            run["axioms"] = []
+            runs[run["id"]] = run
+
+        if runs:
+            placeholders = ", ".join("?" * len(runs))
+            for row in self._connection.execute(
+                f"SELECT * FROM axiom_results WHERE run_id IN ({placeholders}) ORDER BY rowid",
+                tuple(runs),
+            ):
+                runs[row["run_id"]]["axioms"].append({
+                    "axiom": row["axiom"],
+                    "passed": bool(row["passed"]),
+                    "seconds": row["seconds"],
+                    "reason": row["reason"],
+                })
+        return list(runs.values())
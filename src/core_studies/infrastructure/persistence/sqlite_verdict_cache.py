@@ -0,0 +1,55 @@
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from core_studies.application.ports.verdict_cache import IVerdictCachePort, Verdict
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    key        TEXT    PRIMARY KEY,
+    passed     INTEGER NOT NULL,
+    reason     TEXT,
+    created_at REAL    NOT NULL
+);
+"""
+
+
+class SQLiteVerdictCache(IVerdictCachePort):
+    """
+    An adapter that implements IVerdictCachePort on a local SQLite file
+    (it can share the result store's database). Pass ":memory:" for a
+    cache that lives only as long as the process.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: The SQLite database file, created if missing.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[Verdict]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT passed, reason FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"passed": bool(row[0]), "reason": row[1]}
+
+    def put(self, key: str, verdict: Verdict) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO verdicts (key, passed, reason, created_at) VALUES (?, ?, ?, ?)",
+                (key, int(verdict["passed"]), verdict.get("reason"), time.time()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
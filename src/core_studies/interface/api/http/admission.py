@@ -0,0 +1,330 @@
+"""
+Admission control of the checks the API runs.
+
+Every request to a check endpoint is given a cost: the milliseconds of
+sampling it asks for ('budget_ms' where the endpoint takes one, a
+nominal cost per endpoint otherwise, plus a cost per KiB of body for
+endpoints whose work grows with it). Before the request reaches its
+endpoint it has to pass, in order:
+
+1. the per-request cap: a cost above `max_request_cost`, or a
+   'budget_ms' that is not a positive number, is refused with 422
+   instead of being queued (and a sized request without a
+   Content-Length with 411);
+2. the client's token bucket: each client (its X-API-Key header if that
+   is one of the policy's `api_keys`, or else its IP address) earns `rate` milliseconds of check work per second, up
+   to `burst`, and a request it cannot pay for is refused with 429 and
+   a Retry-After header;
+3. the queue: at most `slots` checks run at once. Further requests wait
+   in order of arrival time plus cost, so a small check skips ahead of
+   a large one that arrived shortly before, but no check is overtaken
+   forever. A full queue, or a wait over `max_queue_seconds`, is
+   refused with 503.
+
+The middleware runs before routing and never reads the body, so a
+refusal costs a dict lookup and a few arithmetic operations. Other
+paths (history, metrics, docs) are not admission-controlled.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from ....application.ports.rate_limit_store import IRateLimitStorePort
+from .metrics import metrics
+from .responses import dumps_json
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Nominal cost (ms of check work) of each check endpoint when called
+# without a budget: what a run with the default sample count takes on
+# the R3 recipes, rounded up (check-space includes recording the run;
+# inner products are checked on 100 samples, and rationally; basis and
+# span queries on a subset re-run its subspace test on 1000 samples).
+ENDPOINT_COSTS: Dict[str, float] = {
+    "check-space": 2.0,
+    "check-subspace": 1.0,
+    "check-linear-map": 1.0,
+    "check-inner-product-space": 50.0,
+    "check-normed-space": 5.0,
+    "report-space": 2.0,
+    "basis": 20.0,
+    "span": 20.0,
+}
+# Endpoints whose cost is their 'budget_ms' parameter, and its default.
+BUDGETED_ENDPOINTS: Dict[str, Optional[float]] = {
+    "check-space": None,
+    "search-counterexample": 1000.0,
+}
+# Endpoints that also cost this many ms per KiB of request body: /span
+# reduces every candidate it is sent (about 0.1 ms per KiB of JSON
+# coordinates, doubled for parsing).
+SIZED_ENDPOINTS: Dict[str, float] = {
+    "span": 0.2,
+}
+
+
+@dataclass(frozen=True)
+class AdmissionPolicy:
+    """
+    Limits enforced by the AdmissionMiddleware (see the module docstring).
+
+    Attributes:
+        rate: Milliseconds of check work a client earns per second;
+              0 disables the token buckets.
+        burst: Most milliseconds of work a client can save up.
+        max_request_cost: Largest cost of a single request, in ms.
+        slots: How many checks run at the same time.
+        max_queued: How many requests may wait for a slot.
+        max_queue_seconds: Longest wait for a slot.
+        api_keys: X-API-Key values that get a bucket of their own;
+                  any other request is billed to its IP address.
+    """
+    rate: float = 1000.0
+    burst: float = 10_000.0
+    max_request_cost: float = 10_000.0
+    slots: int = os.cpu_count() or 1
+    max_queued: int = 100
+    max_queue_seconds: float = 30.0
+    api_keys: FrozenSet[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        if self.rate > 0 and self.max_request_cost > self.burst:
+            raise ValueError(
+                f"max_request_cost ({self.max_request_cost:g}) exceeds burst "
+                f"({self.burst:g}): such requests could never be admitted."
+            )
+
+    @classmethod
+    def from_env(cls) -> "AdmissionPolicy":
+        """
+        The default policy, overridden by CORE_STUDIES_WORK_RATE,
+        CORE_STUDIES_WORK_BURST, CORE_STUDIES_MAX_REQUEST_COST,
+        CORE_STUDIES_CHECK_SLOTS, CORE_STUDIES_MAX_QUEUED,
+        CORE_STUDIES_MAX_QUEUE_SECONDS and CORE_STUDIES_API_KEYS (comma-
+        separated) where they are set.
+        """
+        default = cls()
+        env = os.environ.get
+        return cls(
+            rate=float(env("CORE_STUDIES_WORK_RATE", default.rate)),
+            burst=float(env("CORE_STUDIES_WORK_BURST", default.burst)),
+            max_request_cost=float(env("CORE_STUDIES_MAX_REQUEST_COST", default.max_request_cost)),
+            slots=int(env("CORE_STUDIES_CHECK_SLOTS", default.slots)),
+            max_queued=int(env("CORE_STUDIES_MAX_QUEUED", default.max_queued)),
+            max_queue_seconds=float(env("CORE_STUDIES_MAX_QUEUE_SECONDS", default.max_queue_seconds)),
+            api_keys=frozenset(
+                key.strip() for key in env("CORE_STUDIES_API_KEYS", "").split(",") if key.strip()
+            ),
+        )
+
+
+def request_cost(
+    path: str, query_string: bytes, body_size: Optional[int] = None
+) -> Optional[float]:
+    """
+    The cost in ms of a request to 'path' with a body of 'body_size'
+    bytes, or None if the path is not a check endpoint
+    ("/v1/<endpoint>/<name>").
+
+    Raises:
+        ValueError: If 'budget_ms' is not a positive, finite number.
+        LengthRequiredError: If the endpoint is priced by its body and
+                             'body_size' is None.
+    """
+    parts = path.split("/")
+    if len(parts) < 4:
+        return None
+    endpoint = parts[2]
+    if endpoint in BUDGETED_ENDPOINTS:
+        budget = parse_qs(query_string.decode("latin-1")).get("budget_ms")
+        if budget:
+            try:
+                cost = float(budget[-1])
+            except ValueError:
+                cost = math.nan
+            if not (math.isfinite(cost) and cost > 0):
+                raise ValueError(f"budget_ms must be a positive number, not {budget[-1]!r}.")
+            return cost
+        default = BUDGETED_ENDPOINTS[endpoint]
+        if default is not None:
+            return default
+    cost = ENDPOINT_COSTS.get(endpoint)
+    if cost is not None and endpoint in SIZED_ENDPOINTS:
+        if body_size is None:
+            raise LengthRequiredError(f"/{endpoint} needs a Content-Length header.")
+        cost += SIZED_ENDPOINTS[endpoint] * body_size / 1024
+    return cost
+
+
+def body_size(scope: Scope) -> Optional[int]:
+    """The Content-Length of a request, or None if it has none."""
+    for name, value in scope.get("headers", ()):
+        if name == b"content-length":
+            try:
+                return max(int(value), 0)
+            except ValueError:
+                return None
+    return None
+
+
+def client_key(scope: Scope, api_keys: FrozenSet[str] = frozenset()) -> str:
+    """
+    The API key a request was sent with if it is one of 'api_keys', or
+    else its client address. Unknown keys are ignored, so a client
+    cannot get a fresh bucket by sending a new key with every request.
+    """
+    for name, value in scope.get("headers", ()):
+        if name == b"x-api-key":
+            key = value.decode("latin-1")
+            if key in api_keys:
+                return "key:" + key
+            break
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+class LengthRequiredError(Exception):
+    """A request priced by its body size does not say how large it is."""
+
+
+class QueueFullError(Exception):
+    """No slot became free in time, or too many requests are waiting."""
+
+
+class CostQueue:
+    """
+    Hands out a fixed number of slots; requests that find none free wait
+    in a heap keyed by arrival time plus cost (in seconds), and a freed
+    slot goes straight to the first of them. Meant to be used from one
+    event loop.
+    """
+
+    def __init__(self, slots: int, max_queued: int, max_wait: float):
+        self.max_queued = max_queued
+        self.max_wait = max_wait
+        self._free = slots
+        self._waiting = 0
+        self._heap: List[Tuple[float, int, "asyncio.Future[None]"]] = []
+        self._order = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    async def acquire(self, cost: float) -> None:
+        """
+        Waits for a slot.
+
+        Raises:
+            QueueFullError: If 'max_queued' requests are waiting already,
+                            or no slot was handed over within 'max_wait'.
+        """
+        if self._free > 0 and not self._waiting:
+            self._free -= 1
+            return
+        if self._waiting >= self.max_queued:
+            raise QueueFullError(f"{self._waiting} requests are already waiting.")
+
+        granted: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (time.monotonic() + cost / 1000, next(self._order), granted))
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(granted), self.max_wait)
+        except BaseException as e:
+            if granted.done():
+                if isinstance(e, asyncio.TimeoutError):
+                    return  # The slot arrived as the wait timed out.
+                self.release()
+            else:
+                granted.cancel()
+                self._waiting -= 1
+            if isinstance(e, asyncio.TimeoutError):
+                raise QueueFullError(f"No check slot freed up within {self.max_wait:g} s.")
+            raise
+
+    def release(self) -> None:
+        """Frees a slot, handing it to the first live waiter if any."""
+        while self._heap:
+            _, _, granted = heapq.heappop(self._heap)
+            if not granted.done():
+                self._waiting -= 1
+                granted.set_result(None)
+                return
+        self._free += 1
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware applying an AdmissionPolicy to the check endpoints,
+    with token buckets kept in an IRateLimitStorePort.
+    """
+
+    def __init__(self, app: ASGIApp, policy: AdmissionPolicy, store: IRateLimitStorePort):
+        self.app = app
+        self.policy = policy
+        self.store = store
+        self.queue = CostQueue(policy.slots, policy.max_queued, policy.max_queue_seconds)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        try:
+            cost = request_cost(scope["path"], scope.get("query_string", b""), body_size(scope))
+        except ValueError as e:
+            metrics.admission_denied("invalid_cost")
+            return await _deny(send, 422, str(e))
+        except LengthRequiredError as e:
+            metrics.admission_denied("invalid_cost")
+            return await _deny(send, 411, str(e))
+        if cost is None:
+            return await self.app(scope, receive, send)
+
+        policy = self.policy
+        if cost > policy.max_request_cost:
+            metrics.admission_denied("over_cap")
+            return await _deny(send, 422, (
+                f"Request costs {cost:g} ms of check work; "
+                f"the cap is {policy.max_request_cost:g} ms."
+            ))
+        if policy.rate > 0:
+            wait = self.store.take(
+                client_key(scope, policy.api_keys), cost, policy.rate, policy.burst, time.time()
+            )
+            if wait > 0:
+                metrics.admission_denied("rate_limited")
+                return await _deny(send, 429, "Rate limit exceeded.", retry_after=wait)
+
+        queued_at = time.perf_counter()
+        try:
+            await self.queue.acquire(cost)
+        except QueueFullError as e:
+            metrics.admission_denied("queue_full")
+            return await _deny(send, 503, f"Too many checks in progress: {e}", retry_after=1.0)
+        metrics.admission_queued(time.perf_counter() - queued_at)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.queue.release()
+
+
+async def _deny(send: Send, status_code: int, detail: str, retry_after: Optional[float] = None) -> None:
+    body = dumps_json({"detail": detail})
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    if retry_after is not None:
+        headers.append((b"retry-after", str(math.ceil(retry_after)).encode()))
+    await send({"type": "http.response.start", "status": status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
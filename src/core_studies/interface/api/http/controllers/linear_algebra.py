@@ -0,0 +1,117 @@
+from fractions import Fraction
+from typing import Any, List, Sequence
+
+from fastapi import APIRouter, HTTPException, Request, status
+
+from .....application.checkers.coordinates import coordinate_names, from_coordinates
+from .....domain.errors.exceptions import NotAVectorSpaceError
+from ..responses import render
+from ..schemas import BasisResponse, SpanRequest, SpanResponse
+from .space_checker import _run_until_disconnect, container
+
+router = APIRouter()
+
+
+def _space(space_name: str) -> Any:
+    try:
+        return container.provide_space_or_subspace(space_name)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error assembling dependencies: {e}"
+        )
+
+
+def _elements(space: Any, coordinates: Sequence[Sequence[Any]]) -> List[Any]:
+    """Builds elements from coordinate lists; strings are exact rationals."""
+    try:
+        dimension = len(coordinate_names(space.element_type))
+    except TypeError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    elements = []
+    for index, values in enumerate(coordinates):
+        if len(values) != dimension:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Element {index} has {len(values)} coordinates, expected {dimension}"
+            )
+        try:
+            values = [Fraction(value) if isinstance(value, str) else value for value in values]
+        except (ValueError, ZeroDivisionError) as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+        elements.append(from_coordinates(space.element_type, values))
+    return elements
+
+
+@router.post("/basis/{space_name}", response_model=BasisResponse)
+async def basis_endpoint(request: Request, space_name: str):
+    """
+    Endpoint to compute the dimension of a space (or subset) recipe
+    and a basis of it, in reduced row echelon form over its
+    coordinates. Computed from sample elements once per space, then
+    served from cache.
+
+    Raises:
+        HTTPException(404): If 'space_name' is unknown.
+        HTTPException(409): If the recipe fails the vector space axioms
+                            or, for a subset, the subspace test.
+        HTTPException(499): If the client disconnected.
+        HTTPException(500): For unexpected errors during execution.
+    """
+    space = _space(space_name)
+    use_case = container.provide_linear_algebra_use_case()
+    try:
+        result = await _run_until_disconnect(
+            request, lambda cancel: use_case.basis(space, cancel=cancel)
+        )
+    except HTTPException:
+        raise
+    except NotAVectorSpaceError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error computing the basis: {e}"
+        )
+    return render(request, result)
+
+
+@router.post("/span/{space_name}", response_model=SpanResponse)
+async def span_endpoint(request: Request, space_name: str, body: SpanRequest):
+    """
+    Endpoint to tell whether the given elements (as coordinate lists)
+    are linearly independent and whether they span a space (or subset)
+    recipe. Thousands of candidates can be sent in one call.
+
+    Raises:
+        HTTPException(404): If 'space_name' is unknown.
+        HTTPException(409): If the recipe fails the vector space axioms
+                            or, for a subset, the subspace test.
+        HTTPException(422): If an element has the wrong number of
+                            coordinates or an unreadable value.
+        HTTPException(499): If the client disconnected.
+        HTTPException(500): For unexpected errors during execution.
+    """
+    space = _space(space_name)
+    elements = _elements(space, body.elements)
+    use_case = container.provide_linear_algebra_use_case()
+    try:
+        result = await _run_until_disconnect(
+            request, lambda cancel: use_case.analyze(space, elements, cancel=cancel)
+        )
+    except HTTPException:
+        raise
+    except NotAVectorSpaceError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error analysing the span: {e}"
+        )
+    return render(request, result)
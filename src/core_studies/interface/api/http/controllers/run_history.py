@@ -0,0 +1,85 @@
+from fastapi import APIRouter, HTTPException, Query, Request, status
+
+from ..responses import render
+from ..schemas import DiffResponse, Run, TrendResponse
+from .space_checker import container
+
+router = APIRouter()
+
+
+def _history_use_case():
+    try:
+        return container.provide_history_use_case()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Run history is unavailable: {e}"
+        )
+
+
+@router.get("/history/{space_name}", response_model=list[Run])
+async def history_endpoint(request: Request, space_name: str, limit: int = Query(50, ge=1)):
+    """
+    Endpoint to list the latest recorded runs of a space recipe,
+    newest first, with their per-axiom outcomes.
+
+    Raises:
+        HTTPException(422): If 'limit' is less than 1.
+        HTTPException(503): If no result store is configured.
+    """
+    return render(request, _history_use_case().history(space_name, limit))
+
+
+@router.get("/history/{space_name}/trend", response_model=TrendResponse)
+async def trend_endpoint(request: Request, space_name: str, limit: int = Query(50, ge=1)):
+    """
+    Endpoint to summarise how a space recipe has behaved over its
+    latest 'limit' runs: verdict and duration per run, and failure rate
+    and mean duration per axiom.
+
+    Raises:
+        HTTPException(422): If 'limit' is less than 1.
+        HTTPException(503): If no result store is configured.
+    """
+    return render(request, _history_use_case().trend(space_name, limit))
+
+
+@router.get("/runs/{run_id}", response_model=Run)
+async def run_endpoint(request: Request, run_id: int):
+    """
+    Endpoint to fetch one recorded run.
+
+    Raises:
+        HTTPException(404): If the run does not exist.
+        HTTPException(503): If no result store is configured.
+    """
+    use_case = _history_use_case()
+    try:
+        run = use_case.get_run(run_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return render(request, run)
+
+
+@router.get("/runs/{base_id}/diff/{head_id}", response_model=DiffResponse)
+async def diff_endpoint(request: Request, base_id: int, head_id: int):
+    """
+    Endpoint to compare two recorded runs: axioms that regressed, were
+    fixed or still fail, and per-axiom duration changes.
+
+    Raises:
+        HTTPException(404): If either run does not exist.
+        HTTPException(503): If no result store is configured.
+    """
+    use_case = _history_use_case()
+    try:
+        diff = use_case.diff(base_id, head_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return render(request, diff)
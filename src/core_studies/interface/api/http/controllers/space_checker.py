@@ -1,14 +1,92 @@
-from fastapi import APIRouter, HTTPException, status
-from typing import Any
+import asyncio
+import os
+import random
+import time
+from typing import Any, Callable, Optional, TypeVar
 
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from .....application.cancellation import CancellationToken, CheckCancelledError
 from .....containers import DependencyContainer
+from .....infrastructure.persistence.sqlite_counterexample_corpus import SQLiteCounterexampleCorpus
+from .....infrastructure.persistence.sqlite_result_store import SQLiteResultStore
+from .....infrastructure.persistence.sqlite_verdict_cache import SQLiteVerdictCache
+from ..metrics import metrics
+from ..responses import render
+from ..schemas import (
+    CheckInnerProductSpaceResponse,
+    CheckLinearMapResponse,
+    CheckNormedSpaceResponse,
+    CheckSpaceResponse,
+    CheckSubspaceResponse,
+    ReportResponse,
+    SearchResponse,
+)
 
 router = APIRouter()
 
-container = DependencyContainer()
+# Runs, their counterexamples and per-axiom verdicts are recorded in
+# this SQLite file if the variable is set; nothing is written otherwise.
+RESULTS_DB = os.environ.get("CORE_STUDIES_RESULTS_DB", "")
+
+container = DependencyContainer(
+    result_store=SQLiteResultStore(RESULTS_DB) if RESULTS_DB else None,
+    corpus=SQLiteCounterexampleCorpus(RESULTS_DB) if RESULTS_DB else None,
+    verdict_cache=SQLiteVerdictCache(RESULTS_DB) if RESULTS_DB else None,
+)
+
+# How often a running check looks for a disconnected client.
+DISCONNECT_POLL_SECONDS = 0.05
+# Status sent (to nobody) for checks abandoned by their client.
+STATUS_CLIENT_CLOSED_REQUEST = 499
+
+T = TypeVar('T')
+
+# Seeds of the runs, kept apart from the sampling state they reset.
+_seeds = random.Random()
+
+
+async def _run_until_disconnect(request: Request, work: Callable[[CancellationToken], T]) -> T:
+    """
+    Runs 'work' in the threadpool, keeping the event loop free, and
+    cancels its token as soon as the client disconnects. The check
+    then stops at its next sample chunk, freeing its thread, and is
+    counted as cancelled in /metrics.
+
+    Raises:
+        HTTPException(499): If the client disconnected.
+    """
+    token = CancellationToken()
+    started = time.perf_counter()
+    metrics.started()
+    task = asyncio.ensure_future(run_in_threadpool(work, token))
+    try:
+        while not task.done():
+            await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if not task.done() and await request.is_disconnected():
+                token.cancel()
+        result = task.result()
+    except CheckCancelledError as e:
+        metrics.cancelled(e.axioms_skipped or 0, time.perf_counter() - started)
+        raise HTTPException(
+            status_code=STATUS_CLIENT_CLOSED_REQUEST,
+            detail="Client closed request"
+        )
+    except Exception:
+        metrics.errored()
+        raise
+    metrics.completed()
+    return result
 
-@router.post("/check-space/{space_name}", response_model=dict[str, Any])
-async def check_vector_space_endpoint(space_name: str):
+@router.post("/check-space/{space_name}", response_model=CheckSpaceResponse)
+async def check_vector_space_endpoint(
+    request: Request,
+    space_name: str,
+    exact: bool = False,
+    incremental: bool = False,
+    budget_ms: Optional[int] = None,
+):
     """
     Endpoint to verify whether a predefined vector space
     satisfies the 10 axioms.
@@ -16,18 +94,44 @@ async def check_vector_space_endpoint(space_name: str):
     Args:
         space_name (str): The name of the space "recipe" to be tested
                           (e.g. "R3_STANDARD", "R3_RULE_X_ONLY_MULT").
+        exact (bool): Verify axioms symbolically where the adapters
+                      allow it, sampling only the rest. The response
+                      then also lists the "methods" used per axiom.
+        incremental (bool): Re-run only the axioms whose checker or
+                            adapters changed since their last verdict;
+                            the others are listed under "reused".
+        budget_ms (int): Sample for this many milliseconds instead of
+                         a fixed count; the response then lists per
+                         axiom the samples checked and the failure rate
+                         they rule out under "axioms", and the axioms
+                         that got no sample in time under "unverified".
 
     Returns:
-        A dictionary with the key "is_vector_space" (bool) and,
-        on failure, a "failures" list detailing the axioms
-        that were not satisfied.
+        A dictionary with the key "is_vector_space" (bool, or None for
+        an inconclusive budgeted run) and, on failure, a "failures"
+        list detailing the axioms that were not satisfied. Sampled runs
+        are seeded with a fresh random "seed", which is returned and,
+        for conclusive runs, recorded in the result store (see
+        /history); a run can be repeated with the CLI's --seed unless
+        other checks sampled at the same time.
 
     Raises:
         HTTPException(404): If 'space_name' is unknown.
+        HTTPException(422): If 'budget_ms' is not positive.
+        HTTPException(499): If the client disconnected; sampling stops
+                            at the next chunk and is counted in /metrics.
         HTTPException(500): For unexpected errors during execution.
     """
+    if budget_ms is not None and budget_ms <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="budget_ms must be positive."
+        )
     try:
-        use_case = container.provide_vector_space_use_case()
+        use_case = (
+            container.provide_exact_use_case() if exact
+            else container.provide_vector_space_use_case()
+        )
         space_to_test = container.provide_space(space_name)
     except ValueError as e:
         raise HTTPException(
@@ -40,11 +144,337 @@ async def check_vector_space_endpoint(space_name: str):
             detail=f"Error assembling dependencies: {e}"
         )
 
+    def work(cancel: CancellationToken) -> Any:
+        if exact:
+            return use_case.execute(space_to_test)
+        seed = _seeds.randrange(2**32)
+        random.seed(seed)
+        result = use_case.execute(
+            space_to_test, recipe=space_name, seed=seed, incremental=incremental,
+            time_budget=budget_ms / 1000 if budget_ms is not None else None,
+            cancel=cancel,
+        )
+        return {**result, "seed": seed}
+
+    try:
+        result = await _run_until_disconnect(request, work)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error during execution of the check: {e}"
+        )
+    return render(request, result)
+
+
+@router.post("/check-subspace/{subspace_name}", response_model=CheckSubspaceResponse)
+async def check_subspace_endpoint(request: Request, subspace_name: str):
+    """
+    Endpoint to verify whether a predefined subset of a known vector
+    space is a subspace (zero element, closure under addition and
+    closure under scalar multiplication).
+
+    Args:
+        subspace_name (str): The name of the subset "recipe" to be tested
+                             (e.g. "R3_PLANE_XY").
+
+    Returns:
+        A dictionary with the key "is_subspace" (bool) and a
+        "failures" list detailing the conditions that were not satisfied.
+
+    Raises:
+        HTTPException(404): If 'subspace_name' is unknown.
+        HTTPException(499): If the client disconnected.
+        HTTPException(500): For unexpected errors during execution.
+    """
+    try:
+        use_case = container.provide_subspace_use_case()
+        subspace_to_test = container.provide_subspace(subspace_name)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error assembling dependencies: {e}"
+        )
+
     try:
-        result = use_case.execute(space_to_test)
-        return result
+        result = await _run_until_disconnect(
+            request, lambda cancel: use_case.execute(subspace_to_test, cancel=cancel)
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error during execution of the check: {e}"
         )
+    return render(request, result)
+
+
+@router.post("/check-linear-map/{map_name}", response_model=CheckLinearMapResponse)
+async def check_linear_map_endpoint(request: Request, map_name: str):
+    """
+    Endpoint to verify whether a predefined map T: V -> W between two
+    known spaces is linear (T(u + v) = T(u) + T(v), T(k*u) = k*T(u)).
+
+    Args:
+        map_name (str): The name of the map "recipe" to be tested
+                        (e.g. "R3_ROTATE_Z").
+
+    Returns:
+        A dictionary with the key "is_linear" (bool), a "failures" list
+        detailing the conditions that were not satisfied, and the
+        "method" used ("matrix" for maps given by a matrix, evaluated
+        as one matrix product per batch; "sampling" otherwise).
+
+    Raises:
+        HTTPException(404): If 'map_name' is unknown.
+        HTTPException(499): If the client disconnected.
+        HTTPException(500): For unexpected errors during execution.
+    """
+    try:
+        use_case = container.provide_linear_map_use_case()
+        map_to_test = container.provide_linear_map(map_name)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error assembling dependencies: {e}"
+        )
+
+    try:
+        result = await _run_until_disconnect(
+            request, lambda cancel: use_case.execute(map_to_test, cancel=cancel)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error during execution of the check: {e}"
+        )
+    return render(request, result)
+
+
+@router.post(
+    "/check-inner-product-space/{space_name}", response_model=CheckInnerProductSpaceResponse
+)
+async def check_inner_product_space_endpoint(request: Request, space_name: str):
+    """
+    Endpoint to verify whether a predefined inner product <u, v> on a
+    known vector space satisfies the inner product axioms (symmetry,
+    additivity and homogeneity in the first argument,
+    positive-definiteness).
+
+    Args:
+        space_name (str): The name of the inner product space "recipe"
+                          to be tested (e.g. "R3_EUCLIDEAN").
+
+    Returns:
+        A dictionary with the key "is_inner_product_space" (bool) and a
+        "failures" list detailing the axioms that were not satisfied.
+
+    Raises:
+        HTTPException(404): If 'space_name' is unknown.
+        HTTPException(499): If the client disconnected.
+        HTTPException(500): For unexpected errors during execution.
+    """
+    try:
+        use_case = container.provide_inner_product_use_case()
+        space_to_test = container.provide_inner_product_space(space_name)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error assembling dependencies: {e}"
+        )
+
+    try:
+        result = await _run_until_disconnect(
+            request, lambda cancel: use_case.execute(space_to_test, cancel=cancel)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error during execution of the check: {e}"
+        )
+    return render(request, result)
+
+
+@router.post("/check-normed-space/{space_name}", response_model=CheckNormedSpaceResponse)
+async def check_normed_space_endpoint(request: Request, space_name: str):
+    """
+    Endpoint to verify whether a predefined norm ||u|| on a known vector
+    space satisfies the norm axioms (positive-definiteness, absolute
+    homogeneity, triangle inequality).
+
+    Args:
+        space_name (str): The name of the normed space "recipe" to be
+                          tested (e.g. "R3_TAXICAB").
+
+    Returns:
+        A dictionary with the key "is_normed_space" (bool) and a
+        "failures" list detailing the axioms that were not satisfied.
+
+    Raises:
+        HTTPException(404): If 'space_name' is unknown.
+        HTTPException(499): If the client disconnected.
+        HTTPException(500): For unexpected errors during execution.
+    """
+    try:
+        use_case = container.provide_normed_space_use_case()
+        space_to_test = container.provide_normed_space(space_name)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error assembling dependencies: {e}"
+        )
+
+    try:
+        result = await _run_until_disconnect(
+            request, lambda cancel: use_case.execute(space_to_test, cancel=cancel)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error during execution of the check: {e}"
+        )
+    return render(request, result)
+
+
+@router.post("/search-counterexample/{space_name}", response_model=SearchResponse)
+async def search_counterexample_endpoint(
+    request: Request, space_name: str, budget_ms: int = 1000, threshold: float = 1e-9
+):
+    """
+    Endpoint to search a predefined vector space adaptively for
+    counterexamples, concentrating samples where the axioms' residuals
+    |left - right| are largest.
+
+    Args:
+        space_name (str): The name of the space "recipe" to be searched.
+        budget_ms (int): Total time budget, split across the axioms.
+        threshold (float): Residual above which a sample is a failure.
+
+    Returns:
+        A dictionary with "is_vector_space", "failures" and per-axiom
+        search statistics under "axioms".
+
+    Raises:
+        HTTPException(404): If 'space_name' is unknown.
+        HTTPException(422): If 'budget_ms' is not positive.
+        HTTPException(499): If the client disconnected; the search
+                            stops at its next batch.
+        HTTPException(500): For unexpected errors during execution.
+    """
+    if budget_ms <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="budget_ms must be positive."
+        )
+    try:
+        use_case = container.provide_search_use_case()
+        space_to_test = container.provide_space(space_name)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error assembling dependencies: {e}"
+        )
+
+    try:
+        result = await _run_until_disconnect(
+            request,
+            lambda cancel: use_case.execute(
+                space_to_test,
+                time_budget=budget_ms / 1000,
+                residual_threshold=threshold,
+                cancel=cancel,
+            ),
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error during execution of the search: {e}"
+        )
+    return render(request, result)
+
+
+@router.post("/report-space/{space_name}", response_model=ReportResponse)
+async def report_vector_space_endpoint(
+    request: Request, space_name: str, tolerance: float = 1e-9
+):
+    """
+    Endpoint to measure how well a predefined vector space satisfies the
+    10 axioms, instead of stopping at the first failing sample.
+
+    Args:
+        space_name (str): The name of the space "recipe" to be measured.
+        tolerance (float): Residual above which a sample is a failure.
+
+    Returns:
+        A dictionary with "is_vector_space", "failures" and, under
+        "axioms", the max/mean/p99 residual and the number of samples
+        over tolerance for each axiom.
+
+    Raises:
+        HTTPException(404): If 'space_name' is unknown.
+        HTTPException(499): If the client disconnected; measuring stops
+                            at the next chunk.
+        HTTPException(500): For unexpected errors during execution.
+    """
+    try:
+        use_case = container.provide_report_use_case()
+        space_to_test = container.provide_space(space_name)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error assembling dependencies: {e}"
+        )
+
+    try:
+        result = await _run_until_disconnect(
+            request,
+            lambda cancel: use_case.execute(space_to_test, tolerance=tolerance, cancel=cancel),
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error during execution of the report: {e}"
+        )
+    return render(request, result)
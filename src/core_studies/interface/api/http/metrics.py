@@ -0,0 +1,75 @@
+"""
+In-process counters of the checks the API runs and of the admission
+decisions taken on them, served at /metrics.
+"""
+
+import threading
+import time
+from typing import Dict, Union
+
+
+class CheckMetrics:
+    """
+    Thread-safe counters of started, completed, failed and cancelled
+    checks. Cancelled work is counted by the axioms left unverified and
+    the seconds spent on it before the client went away. Admission
+    counters tell admitted requests (and their total wait for a slot)
+    from refused ones, by reason.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._counters: Dict[str, Union[int, float]] = {
+            "checks_started": 0,
+            "checks_completed": 0,
+            "checks_errored": 0,
+            "checks_cancelled": 0,
+            "axioms_cancelled": 0,
+            "cancelled_seconds": 0.0,
+            "admission_admitted": 0,
+            "admission_queued_seconds": 0.0,
+            "admission_over_cap": 0,
+            "admission_invalid_cost": 0,
+            "admission_rate_limited": 0,
+            "admission_queue_full": 0,
+        }
+
+    def started(self) -> None:
+        self._add("checks_started", 1)
+
+    def completed(self) -> None:
+        self._add("checks_completed", 1)
+
+    def errored(self) -> None:
+        self._add("checks_errored", 1)
+
+    def cancelled(self, axioms: int, seconds: float) -> None:
+        with self._lock:
+            self._counters["checks_cancelled"] += 1
+            self._counters["axioms_cancelled"] += axioms
+            self._counters["cancelled_seconds"] += seconds
+
+    def admission_queued(self, seconds: float) -> None:
+        """A request got a check slot after waiting 'seconds' for it."""
+        with self._lock:
+            self._counters["admission_admitted"] += 1
+            self._counters["admission_queued_seconds"] += seconds
+
+    def admission_denied(self, reason: str) -> None:
+        """
+        A request was refused: "over_cap", "invalid_cost",
+        "rate_limited" or "queue_full".
+        """
+        self._add(f"admission_{reason}", 1)
+
+    def snapshot(self) -> Dict[str, Union[int, float]]:
+        with self._lock:
+            return {**self._counters, "uptime_seconds": time.time() - self._started_at}
+
+    def _add(self, name: str, amount: int) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+
+metrics = CheckMetrics()
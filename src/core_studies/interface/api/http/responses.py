@@ -0,0 +1,70 @@
+"""
+Response classes of the HTTP API: fast JSON, MessagePack, and content
+negotiation between them.
+
+orjson and msgpack are optional. Without orjson JSON falls back to the
+standard library; without msgpack clients always get JSON.
+"""
+
+import json
+from fractions import Fraction
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+def _default(value: Any) -> Any:
+    """Serializes values the encoders do not know (exact rationals)."""
+    if isinstance(value, Fraction):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def dumps_json(content: Any) -> bytes:
+    """Compact JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(content, separators=(",", ":"), default=_default).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSONResponse rendered with orjson (or compact stdlib JSON)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+class MessagePackResponse(Response):
+    """A compact binary response for machine clients."""
+
+    media_type = MSGPACK_MEDIA_TYPES[0]
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_default)
+
+
+def render(request: Request, content: Any) -> Response:
+    """
+    Serializes a use case DTO in the format the client accepts:
+    MessagePack if the Accept header asks for it (and msgpack is
+    installed), JSON otherwise. The payload is encoded once, directly,
+    without FastAPI's generic encoder; compression is left to the GZip
+    middleware.
+    """
+    accept = request.headers.get("accept", "")
+    if msgpack is not None and any(media_type in accept for media_type in MSGPACK_MEDIA_TYPES):
+        return MessagePackResponse(content)
+    return FastJSONResponse(content)
@@ -0,0 +1,175 @@
+"""
+Response models of the HTTP API.
+
+They document the payloads in the OpenAPI schema. Endpoints serialize
+the use cases' DTOs directly (see `responses.render`), so these models
+describe the wire format rather than being instantiated per request.
+Optional fields are omitted from the payload when they do not apply.
+"""
+
+from typing import List, Optional, Union
+
+from pydantic import BaseModel
+
+
+class Failure(BaseModel):
+    axiom: str
+    reason: str
+
+
+class AxiomMethod(BaseModel):
+    axiom: str
+    method: str  # "symbolic" or "sampling"
+
+
+class AxiomCoverage(BaseModel):
+    axiom: str
+    samples: Optional[int]  # None if the axiom failed or is not sampled
+    seconds: float
+    failure_rate_bound: Optional[float]  # 95% upper bound, if it passed
+
+
+class CheckSpaceResponse(BaseModel):
+    is_vector_space: Optional[bool]  # None if a budgeted run is inconclusive
+    failures: List[Failure]
+    methods: Optional[List[AxiomMethod]] = None
+    reused: Optional[List[str]] = None
+    axioms: Optional[List[AxiomCoverage]] = None
+    unverified: Optional[List[str]] = None  # axioms that got no sample in time
+    seed: Optional[int] = None  # of sampled runs
+
+
+class CheckSubspaceResponse(BaseModel):
+    is_subspace: bool
+    failures: List[Failure]
+
+
+class CheckInnerProductSpaceResponse(BaseModel):
+    is_inner_product_space: bool
+    failures: List[Failure]
+
+
+class CheckNormedSpaceResponse(BaseModel):
+    is_normed_space: bool
+    failures: List[Failure]
+
+
+class CheckLinearMapResponse(BaseModel):
+    is_linear: bool
+    failures: List[Failure]
+    method: str  # "matrix" or "sampling"
+
+
+class BasisResponse(BaseModel):
+    dimension: int
+    ambient_dimension: int
+    basis: List[List[Union[float, str]]]
+
+
+class SpanRequest(BaseModel):
+    # Coordinates of each candidate element; exact values as strings ("1/3").
+    elements: List[List[Union[float, str]]]
+
+
+class SpanResponse(BaseModel):
+    rank: int
+    dimension: int
+    independent: bool
+    spans: bool
+    independent_indices: List[int]
+    outside: List[int]
+
+
+class Counterexample(BaseModel):
+    elements: List[str]
+    scalars: List[Union[float, str]]
+
+
+class SearchAxiomStats(BaseModel):
+    axiom: str
+    counterexample_found: bool
+    max_residual: Optional[float]
+    evaluations: int
+    adaptive: bool
+    seconds: float
+    counterexample: Optional[Counterexample] = None
+
+
+class SearchResponse(BaseModel):
+    is_vector_space: bool
+    failures: List[Failure]
+    axioms: List[SearchAxiomStats]
+
+
+class ResidualStats(BaseModel):
+    axiom: str
+    samples: Optional[int]
+    max: Optional[float]
+    mean: Optional[float]
+    p99: Optional[float]
+    non_finite: Optional[int]
+    over_tolerance: int
+
+
+class ReportResponse(BaseModel):
+    is_vector_space: bool
+    failures: List[Failure]
+    axioms: List[ResidualStats]
+
+
+class AxiomOutcome(BaseModel):
+    axiom: str
+    passed: bool
+    seconds: Optional[float]
+    reason: Optional[str]
+
+
+class Run(BaseModel):
+    id: int
+    recipe: str
+    recipe_hash: str
+    seed: Optional[int]
+    samples: Optional[int]
+    passed: bool
+    seconds: float
+    created_at: float
+    axioms: List[AxiomOutcome]
+
+
+class TrendRun(BaseModel):
+    id: int
+    created_at: float
+    recipe_hash: str
+    passed: bool
+    seconds: float
+
+
+class TrendAxiom(BaseModel):
+    axiom: str
+    runs: int
+    failures: int
+    failure_rate: float
+    mean_seconds: Optional[float]
+
+
+class TrendResponse(BaseModel):
+    recipe: str
+    runs: List[TrendRun]
+    axioms: List[TrendAxiom]
+
+
+class Regression(BaseModel):
+    axiom: str
+    reason: Optional[str]
+
+
+class DiffResponse(BaseModel):
+    base: int
+    head: int
+    same_recipe: bool
+    regressed: List[Regression]
+    fixed: List[str]
+    still_failing: List[str]
+    added: List[str]
+    removed: List[str]
+    seconds_delta: dict[str, float]
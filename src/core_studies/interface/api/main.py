@@ -1,11 +1,53 @@
-from fastapi import FastAPI
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+
+from .http.admission import AdmissionMiddleware, AdmissionPolicy
+from .http.controllers import linear_algebra, run_history, space_checker
+from .http.metrics import metrics
+from .http.responses import FastJSONResponse
+from ...infrastructure.persistence.memory_rate_limit_store import InMemoryRateLimitStore
+from ...infrastructure.persistence.sqlite_rate_limit_store import SQLiteRateLimitStore
+
+# Token buckets are per process unless this names a SQLite file for
+# every worker process to share.
+RATE_LIMIT_DB = os.environ.get("CORE_STUDIES_RATE_LIMIT_DB", "")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Builds and warms every space recipe in a worker thread, so the
+    server accepts connections at once and /ready answers 503 until the
+    warm-up has finished.
+    """
+    warm_up = asyncio.ensure_future(run_in_threadpool(space_checker.container.warm_up))
+    yield
+    if not warm_up.done():
+        warm_up.cancel()
 
-from .http.controllers import space_checker
 
 app = FastAPI(
     title="Linear Algebra Analyzer API",
     description="API to verify axioms of vector spaces.",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+# Compress large payloads (per-axiom stats, histories) for clients that
+# send Accept-Encoding: gzip; small responses are left as they are.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Added last, so it runs first: refused requests are never routed.
+app.add_middleware(
+    AdmissionMiddleware,
+    policy=AdmissionPolicy.from_env(),
+    store=SQLiteRateLimitStore(RATE_LIMIT_DB) if RATE_LIMIT_DB else InMemoryRateLimitStore(),
 )
 
 app.include_router(
@@ -14,7 +56,34 @@ app.include_router(
     tags=["Vector Space Checker"], 
 )
 
+app.include_router(
+    run_history.router,
+    prefix="/v1",
+    tags=["Run History"],
+)
+
+app.include_router(
+    linear_algebra.router,
+    prefix="/v1",
+    tags=["Linear Algebra"],
+)
+
 @app.get("/", tags=["Root"])
 async def read_root():
     """Root endpoint to check if the API is online."""
     return {"message": "Linear Algebra Analyzer API is online!"}
+
+@app.get("/ready", tags=["Root"])
+async def read_ready():
+    """Readiness probe: succeeds only after the container is warm."""
+    if not space_checker.container.is_ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Warming up."
+        )
+    return {"ready": True}
+
+@app.get("/metrics", tags=["Root"])
+async def read_metrics():
+    """Counters of the checks run, including those cancelled by their clients."""
+    return metrics.snapshot()
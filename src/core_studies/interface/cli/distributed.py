@@ -0,0 +1,310 @@
+"""
+Coordinator/worker mode of the command-line runner.
+
+A worker (`core-studies worker ADDRESS`) listens on a TCP address
+("host:port") or a local socket ("unix:/path") and runs one shard at a
+time: a slice of a recipe's samples with its own seed. The coordinator
+(`core-studies check ... --nodes ADDRESS,...`) splits the samples into
+shards, keeps every node busy, and merges what comes back.
+
+The protocol is one JSON object per line. The coordinator sends a shard
+and the worker streams back "progress" events, one per axiom checked,
+then a "result" (or an "error"), and closes the connection.
+
+A shard is retried on another node if its node cannot be reached,
+drops the connection, or sends nothing for READ_TIMEOUT seconds (a hung
+worker); a node that fails repeatedly is given up on. Once
+no shard is waiting, idle nodes also take a duplicate of any shard
+running much longer than the typical one (a straggler), and whichever
+copy finishes first wins. Shards are deterministic (seeded), so both
+copies would report the same result; a copy that fails while the other
+is still running is simply dropped.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import statistics
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# A shard: {"space", "samples", "seed", "subspace", "chunk_size"}.
+Shard = Dict[str, Any]
+# Runs a shard on a worker; called with (shard, on_progress).
+ShardRunner = Callable[[Shard, Callable[[str, int, int], None]], Dict[str, Any]]
+# Notified by the coordinator with (node, event) for every event received.
+EventCallback = Callable[[str, Dict[str, Any]], None]
+
+CONNECT_TIMEOUT = 5.0
+# Longest silence between two events of a running shard (workers send
+# one per axiom checked) before its worker is taken to be hung.
+READ_TIMEOUT = 300.0
+# Attempts per shard before the run fails, and consecutive failures
+# after which a node is no longer used.
+MAX_ATTEMPTS = 3
+MAX_NODE_FAILURES = 2
+# A running shard is a straggler once it has run this many times longer
+# than the median finished shard.
+STRAGGLER_FACTOR = 2.0
+_POLL_SECONDS = 0.05
+
+
+class WorkerError(Exception):
+    """A worker could not be reached, or failed to run a shard."""
+
+
+def _connect(
+    address: str, timeout: Optional[float] = CONNECT_TIMEOUT, read_timeout: Optional[float] = None
+) -> socket.socket:
+    if address.startswith("unix:"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        target: Any = address[len("unix:"):]
+    else:
+        host, _, port = address.rpartition(":")
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        target = (host or "127.0.0.1", int(port))
+    sock.settimeout(timeout)
+    try:
+        sock.connect(target)
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(read_timeout)
+    return sock
+
+
+def serve(address: str, run_shard: ShardRunner, ready: Optional[Callable[[], None]] = None) -> None:
+    """
+    Serves shards on 'address' ("host:port" or "unix:/path") until
+    interrupted, one at a time, running each with 'run_shard'.
+    """
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            def send(event: Dict[str, Any]) -> None:
+                self.wfile.write(json.dumps(event).encode() + b"\n")
+                self.wfile.flush()
+
+            line = self.rfile.readline()
+            if not line:
+                return
+            try:
+                shard = json.loads(line)
+                result = run_shard(
+                    shard,
+                    lambda axiom, done, total: send(
+                        {"event": "progress", "axiom": axiom, "done": done, "total": total}
+                    ),
+                )
+                send({"event": "result", **result})
+            except (BrokenPipeError, ConnectionResetError):
+                # The coordinator gave up on this shard (e.g. a straggler
+                # finished elsewhere first).
+                pass
+            except Exception as e:
+                send({"event": "error", "reason": str(e)})
+
+    if address.startswith("unix:"):
+        path = address[len("unix:"):]
+        if os.path.exists(path):
+            os.unlink(path)
+        server: socketserver.BaseServer = socketserver.UnixStreamServer(path, Handler)
+    else:
+        host, _, port = address.rpartition(":")
+        socketserver.TCPServer.allow_reuse_address = True
+        server = socketserver.TCPServer((host or "127.0.0.1", int(port)), Handler)
+
+    with server:
+        if ready is not None:
+            ready()
+        server.serve_forever()
+
+
+def run_on_node(
+    address: str,
+    shard: Shard,
+    on_event: Optional[EventCallback] = None,
+    read_timeout: float = READ_TIMEOUT,
+) -> Dict[str, Any]:
+    """
+    Runs one shard on the worker at 'address' and returns its result.
+
+    Raises:
+        WorkerError: If the worker cannot be reached, drops the
+                     connection, sends nothing for 'read_timeout'
+                     seconds, or reports an error.
+    """
+    try:
+        with _connect(address, read_timeout=read_timeout) as sock, sock.makefile("rwb") as stream:
+            stream.write(json.dumps(shard).encode() + b"\n")
+            stream.flush()
+            for line in stream:
+                event = json.loads(line)
+                if on_event is not None:
+                    on_event(address, event)
+                if event["event"] == "result":
+                    return {key: value for key, value in event.items() if key != "event"}
+                if event["event"] == "error":
+                    raise WorkerError(f"{address}: {event['reason']}")
+    except (OSError, ValueError) as e:
+        raise WorkerError(f"{address}: {e}") from e
+    raise WorkerError(f"{address}: connection closed before the result")
+
+
+class _Schedule:
+    """
+    Which shards are waiting, running (since when, and how many copies)
+    and finished.
+    """
+
+    def __init__(self, count: int):
+        self.lock = threading.Condition()
+        self.waiting: List[int] = list(range(count))
+        self.running: Dict[int, float] = {}
+        self.copies = [0] * count
+        self.attempts = [0] * count
+        self.duplicated: set = set()
+        self.results: List[Optional[Dict[str, Any]]] = [None] * count
+        self.durations: List[float] = []
+        self.error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.error is not None or all(r is not None for r in self.results)
+
+    def take(self) -> Optional[int]:
+        """The next shard for an idle node, or None once the run is over."""
+        with self.lock:
+            while not self.finished:
+                if self.waiting:
+                    index = self.waiting.pop(0)
+                    self.running[index] = time.perf_counter()
+                    self.attempts[index] += 1
+                    self.copies[index] += 1
+                    return index
+                straggler = self._straggler()
+                if straggler is not None:
+                    self.duplicated.add(straggler)
+                    self.copies[straggler] += 1
+                    return straggler
+                self.lock.wait(_POLL_SECONDS)
+            return None
+
+    def _straggler(self) -> Optional[int]:
+        if not self.durations:
+            return None
+        limit = STRAGGLER_FACTOR * statistics.median(self.durations)
+        now = time.perf_counter()
+        for index, started in self.running.items():
+            if index not in self.duplicated and now - started > limit:
+                return index
+        return None
+
+    def done(self, index: int, result: Dict[str, Any]) -> None:
+        with self.lock:
+            self.copies[index] -= 1
+            if self.results[index] is None:
+                self.results[index] = result
+                started = self.running.pop(index, None)
+                if started is not None:
+                    self.durations.append(time.perf_counter() - started)
+                if index in self.waiting:
+                    self.waiting.remove(index)
+            self.lock.notify_all()
+
+    def failed(self, index: int, reason: str) -> None:
+        """
+        Records that a copy of shard 'index' failed. The shard is queued
+        again only if no other copy of it is still running.
+        """
+        with self.lock:
+            self.copies[index] -= 1
+            if self.results[index] is None and self.copies[index] > 0:
+                # Another node may still duplicate the running copy.
+                self.duplicated.discard(index)
+            elif self.results[index] is None and index not in self.waiting:
+                if self.attempts[index] >= MAX_ATTEMPTS:
+                    self.error = f"shard {index} failed {MAX_ATTEMPTS} times, last: {reason}"
+                else:
+                    self.running.pop(index, None)
+                    self.duplicated.discard(index)
+                    self.waiting.append(index)
+            self.lock.notify_all()
+
+
+def coordinate(
+    nodes: Sequence[str],
+    shards: Sequence[Shard],
+    on_event: Optional[EventCallback] = None,
+    read_timeout: float = READ_TIMEOUT,
+) -> List[Dict[str, Any]]:
+    """
+    Runs 'shards' on the workers at 'nodes' and returns their results
+    in shard order, with retries and straggler reassignment (see the
+    module docstring); 'read_timeout' is passed to `run_on_node`.
+
+    Raises:
+        WorkerError: If a shard fails on every attempt or no node is
+                     left to run the remaining shards.
+    """
+    schedule = _Schedule(len(shards))
+    alive = [len(nodes)]
+
+    def drive(node: str) -> None:
+        failures = 0
+        while failures < MAX_NODE_FAILURES:
+            index = schedule.take()
+            if index is None:
+                return
+            try:
+                result = run_on_node(node, shards[index], on_event, read_timeout)
+            except WorkerError as e:
+                failures += 1
+                schedule.failed(index, str(e))
+                continue
+            failures = 0
+            schedule.done(index, result)
+        with schedule.lock:
+            alive[0] -= 1
+            if alive[0] == 0 and not schedule.finished:
+                schedule.error = "no worker node left"
+            schedule.lock.notify_all()
+
+    # Daemon threads: a node still busy with a straggler's losing copy
+    # must not hold up the run.
+    for node in nodes:
+        threading.Thread(target=drive, args=(node,), daemon=True).start()
+
+    with schedule.lock:
+        while not schedule.finished:
+            schedule.lock.wait()
+        if schedule.error is not None:
+            raise WorkerError(schedule.error)
+        return list(schedule.results)
+
+
+def parse_nodes(value: str) -> List[str]:
+    """Splits a comma-separated list of worker addresses."""
+    return [node.strip() for node in value.split(",") if node.strip()]
+
+
+def plan_shards(
+    space_name: str,
+    sizes: Sequence[int],
+    seed: int,
+    subspace: bool,
+    chunk_size: int,
+) -> List[Shard]:
+    """One shard per size, seeded seed, seed + 1, ... like local workers."""
+    return [
+        {
+            "space": space_name,
+            "samples": size,
+            "seed": seed + index,
+            "subspace": subspace,
+            "chunk_size": chunk_size,
+        }
+        for index, size in enumerate(sizes)
+    ]
@@ -0,0 +1,491 @@
+"""
+Load generator for the HTTP API.
+
+    core-studies loadtest --model closed --levels 1,2,4,8,16 --duration 5
+    core-studies loadtest --model open --levels 50,100,200,400 --target 127.0.0.1:8000
+
+Without --target, the API (`interface/api/main.py`) is started with
+uvicorn in a separate process on a free local port, with its result
+store in a temporary directory, and stopped afterwards. The load is
+sent over real TCP connections (HTTP/1.1 keep-alive) by a fleet of
+stand-in clients, each with its own X-API-Key. The local server is
+configured to know those keys, so per-client admission limits apply as
+they would to separate tenants; a --target server only does so if its
+CORE_STUDIES_API_KEYS lists them (see `client_keys`), and otherwise
+bills every request to the load generator's IP address.
+
+Requests are drawn from a weighted mix of endpoints, recipes and
+budgets (--mix). The load is swept over --levels, one step per level:
+
+- closed loop: the level is the number of concurrent users, each
+  sending its next request when the previous one is answered (plus
+  --think seconds);
+- open loop: the level is the arrival rate in requests per second, with
+  Poisson arrivals that do not wait for earlier responses. Latency is
+  measured from the scheduled arrival, so a slow server cannot hide
+  its backlog (no coordinated omission).
+
+Each step runs for --warmup seconds (not measured), then --duration
+seconds. The report (JSON) lists per step the successful throughput,
+latency percentiles of successful responses, and status counts. It
+also gives the saturation point: the first level where p99 latency
+rises past SATURATION_P99_FACTOR times the lightest level's, responses
+fail, or throughput stops following the offered load. The level before
+it is reported as the sustained one.
+"""
+
+import asyncio
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# (weight, "METHOD /path?query"), e.g. (4, "POST /v1/check-space/R3_STANDARD").
+Mix = List[Tuple[float, str]]
+# One response: (request, status or 0 for a connection error, latency in seconds).
+Sample = Tuple[str, int, float]
+# Notified with each step's results as soon as the step is over.
+StepCallback = Callable[[Dict[str, Any]], None]
+
+DEFAULT_MIX: Mix = [
+    (4.0, "POST /v1/check-space/R3_STANDARD"),
+    (2.0, "POST /v1/check-space/R3_RULE_X_ONLY_MULT"),
+    (1.0, "POST /v1/check-space/R3_RATIONAL"),
+    (1.0, "POST /v1/check-space/R3_STANDARD?budget_ms=20"),
+    (1.0, "POST /v1/check-subspace/R3_PLANE_XY"),
+    (1.0, "POST /v1/check-linear-map/R3_ROTATE_Z"),
+]
+# Stand-in clients (distinct X-API-Key values) an open-loop step sends as.
+DEFAULT_CLIENTS = 64
+API_KEY_FORMAT = "loadtest-{}"
+# A step is saturated once its p99 exceeds this many times the p99 of
+# the first step, once more than MAX_ERROR_SHARE of its requests fail,
+# or once its throughput stops following the load: below
+# MIN_OPEN_LOOP_SHARE of the arrival rate (open loop), or growing less
+# than MIN_CLOSED_LOOP_GAIN over the previous step (closed loop).
+SATURATION_P99_FACTOR = 3.0
+MAX_ERROR_SHARE = 0.01
+MIN_OPEN_LOOP_SHARE = 0.9
+MIN_CLOSED_LOOP_GAIN = 0.1
+# How long in-flight requests may take to finish after a step ends.
+DRAIN_SECONDS = 10.0
+READY_TIMEOUT = 60.0
+
+
+class LoadTestError(Exception):
+    """The local server could not be started or did not become ready."""
+
+
+def parse_mix(value: str) -> Mix:
+    """
+    Parses "WEIGHT:[METHOD ]PATH,..." (METHOD defaults to POST), e.g.
+    "3:/v1/check-space/R3_STANDARD,1:/v1/check-space/R3_STANDARD?budget_ms=50".
+    """
+    mix: Mix = []
+    for entry in value.split(","):
+        weight, _, request = entry.strip().partition(":")
+        method, _, path = request.strip().rpartition(" ")
+        if not path.startswith("/"):
+            raise ValueError(f"invalid mix entry: '{entry}'")
+        mix.append((float(weight), f"{(method or 'POST').upper()} {path}"))
+    return mix
+
+
+def parse_levels(value: str) -> List[float]:
+    """Parses a comma-separated list of positive load levels."""
+    levels = [float(level) for level in value.split(",") if level.strip()]
+    if not levels or any(level <= 0 for level in levels):
+        raise ValueError(f"invalid levels: '{value}'")
+    return levels
+
+
+def client_keys(model: str, levels: Sequence[float], clients: int) -> List[str]:
+    """The X-API-Key values a sweep sends: one per user or open-loop client."""
+    count = int(max(levels)) if model == "closed" else clients
+    return [API_KEY_FORMAT.format(index) for index in range(count)]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(
+    workers: int = 1, env: Optional[Dict[str, str]] = None, api_keys: Sequence[str] = ()
+) -> Iterator[str]:
+    """
+    Runs the API with uvicorn in a child process on a free local port,
+    admitting 'api_keys' as clients of their own, and yields its
+    "host:port" once /ready answers 200.
+
+    Raises:
+        LoadTestError: If uvicorn is missing or the server does not
+                       become ready within READY_TIMEOUT seconds.
+    """
+    with tempfile.TemporaryDirectory(prefix="core-studies-loadtest-") as directory:
+        address = f"127.0.0.1:{_free_port()}"
+        host, port = address.split(":")
+        server_env = {
+            **os.environ,
+            "CORE_STUDIES_RESULTS_DB": os.path.join(directory, "results.sqlite3"),
+            "CORE_STUDIES_API_KEYS": ",".join(api_keys),
+            **(env or {}),
+        }
+        process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "core_studies.interface.api.main:app",
+                "--host", host, "--port", port, "--workers", str(workers),
+                "--log-level", "warning", "--no-access-log",
+            ],
+            env=server_env,
+        )
+        try:
+            _wait_until_ready(address, process)
+            yield address
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+
+def _wait_until_ready(address: str, process: "subprocess.Popen[bytes]") -> None:
+    deadline = time.monotonic() + READY_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise LoadTestError(
+                f"the server exited with code {process.returncode} "
+                "(is uvicorn installed? pip install uvicorn)"
+            )
+        try:
+            with urllib.request.urlopen(f"http://{address}/ready", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise LoadTestError(f"the server at {address} was not ready after {READY_TIMEOUT:g} s")
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection; requests have no body."""
+
+    def __init__(self, address: str):
+        self.address = address
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, request: str, api_key: str) -> int:
+        """Sends "METHOD /path" and returns the response status."""
+        if self._writer is None:
+            host, _, port = self.address.rpartition(":")
+            self._reader, self._writer = await asyncio.open_connection(host, int(port))
+        method, path = request.split(" ", 1)
+        self._writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.address}\r\n"
+            f"X-API-Key: {api_key}\r\nContent-Length: 0\r\n\r\n".encode()
+        )
+        try:
+            return await self._read_response()
+        except BaseException:
+            self.close()
+            raise
+
+    async def _read_response(self) -> int:
+        reader = self._reader
+        assert reader is not None
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by the server")
+        status = int(status_line.split()[1])
+
+        length, chunked, keep_alive = 0, False, True
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name, value = name.strip().lower(), value.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding":
+                chunked = "chunked" in value
+            elif name == "connection":
+                keep_alive = value != "close"
+
+        if chunked:
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                await reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        else:
+            await reader.readexactly(length)
+        if not keep_alive:
+            self.close()
+        return status
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+def _picker(mix: Mix, rng: random.Random):
+    requests = [request for _, request in mix]
+    weights = [weight for weight, _ in mix]
+    return lambda: rng.choices(requests, weights)[0]
+
+
+async def _send(connection: _Connection, request: str, api_key: str) -> int:
+    try:
+        return await connection.request(request, api_key)
+    except (OSError, ValueError, IndexError, asyncio.IncompleteReadError):
+        return 0
+
+
+async def _closed_loop(
+    address: str, mix: Mix, users: int, warmup: float, duration: float,
+    think: float, rng: random.Random,
+) -> Tuple[List[Sample], int]:
+    """
+    'users' clients, each sending one request at a time. Every request
+    sent during the measured window counts, however late it finishes:
+    requests still in flight at its end are drained like in
+    `_open_loop`, and those unfinished after DRAIN_SECONDS count as
+    failed with an infinite latency.
+    """
+    pick = _picker(mix, rng)
+    started = time.perf_counter()
+    measure_from, measure_to = started + warmup, started + warmup + duration
+    samples: List[Sample] = []
+    # The measured request each user is waiting for, if any.
+    outstanding: Dict[int, str] = {}
+
+    async def user(index: int) -> None:
+        connection = _Connection(address)
+        api_key = API_KEY_FORMAT.format(index)
+        try:
+            while time.perf_counter() < measure_to:
+                request = pick()
+                sent = time.perf_counter()
+                measured = sent >= measure_from
+                if measured:
+                    outstanding[index] = request
+                status = await _send(connection, request, api_key)
+                outstanding.pop(index, None)
+                if measured:
+                    samples.append((request, status, time.perf_counter() - sent))
+                if think > 0 and time.perf_counter() < measure_to:
+                    await asyncio.sleep(think)
+        finally:
+            connection.close()
+
+    tasks = [asyncio.ensure_future(user(index)) for index in range(users)]
+    _, pending = await asyncio.wait(
+        tasks, timeout=max(measure_to + DRAIN_SECONDS - time.perf_counter(), 0.0)
+    )
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+    samples.extend(("(unfinished)", 0, math.inf) for _ in outstanding)
+    return samples, 0
+
+
+async def _open_loop(
+    address: str, mix: Mix, rate: float, warmup: float, duration: float,
+    clients: int, max_in_flight: int, rng: random.Random,
+) -> Tuple[List[Sample], int]:
+    """Poisson arrivals at 'rate' per second; returns (samples, dropped)."""
+    pick = _picker(mix, rng)
+    idle: List[_Connection] = []
+    in_flight: set = set()
+    samples: List[Sample] = []
+    dropped = 0
+
+    async def arrival(request: str, scheduled: float, measured: bool, api_key: str) -> None:
+        connection = idle.pop() if idle else _Connection(address)
+        status = await _send(connection, request, api_key)
+        if measured:
+            samples.append((request, status, time.perf_counter() - scheduled))
+        idle.append(connection)
+
+    started = time.perf_counter()
+    measure_from, end = started + warmup, started + warmup + duration
+    scheduled, count = started, 0
+    while True:
+        scheduled += rng.expovariate(rate)
+        if scheduled >= end:
+            break
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        measured = scheduled >= measure_from
+        if len(in_flight) >= max_in_flight:
+            dropped += measured
+            continue
+        count += 1
+        task = asyncio.ensure_future(
+            arrival(pick(), scheduled, measured, API_KEY_FORMAT.format(count % clients))
+        )
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    if in_flight:
+        _, pending = await asyncio.wait(set(in_flight), timeout=DRAIN_SECONDS)
+        for task in pending:
+            task.cancel()
+        samples.extend(("(unfinished)", 0, math.inf) for _ in pending)
+    for connection in idle:
+        connection.close()
+    return samples, dropped
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending sequence."""
+    if not ordered:
+        return None
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def summarize(level: float, samples: Sequence[Sample], dropped: int, duration: float) -> Dict[str, Any]:
+    """One point of the throughput/latency curve."""
+    latencies = sorted(latency for _, status, latency in samples if 200 <= status < 300)
+    statuses: Dict[str, int] = {}
+    for _, status, _ in samples:
+        key = str(status) if status else "error"
+        statuses[key] = statuses.get(key, 0) + 1
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        "level": level,
+        "requests": len(samples) + dropped,
+        "throughput": len(latencies) / duration,
+        "responses_per_second": sum(1 for _, status, _ in samples if status) / duration,
+        "latency_ms": {
+            "p50": ms(_percentile(latencies, 0.50)),
+            "p90": ms(_percentile(latencies, 0.90)),
+            "p99": ms(_percentile(latencies, 0.99)),
+            "max": ms(latencies[-1] if latencies else None),
+            "mean": ms(math.fsum(latencies) / len(latencies) if latencies else None),
+        },
+        "statuses": statuses,
+        "dropped": dropped,
+        "failed_share": 1 - len(latencies) / (len(samples) + dropped) if samples or dropped else 0.0,
+    }
+
+
+def saturation(steps: Sequence[Dict[str, Any]], model: str) -> Optional[Dict[str, Any]]:
+    """
+    The first saturated step (see the module docstring) as
+    {"level", "reason"}, or None if the sweep never saturated.
+    """
+    base_p99 = steps[0]["latency_ms"]["p99"] if steps else None
+    for index, step in enumerate(steps):
+        p99 = step["latency_ms"]["p99"]
+        reason = None
+        if p99 is None:
+            reason = "no successful responses"
+        elif step["failed_share"] > MAX_ERROR_SHARE:
+            reason = f"{step['failed_share']:.1%} of requests failed"
+        elif base_p99 and p99 > SATURATION_P99_FACTOR * base_p99:
+            reason = f"p99 {p99:g} ms is over {SATURATION_P99_FACTOR:g}x the lightest load's {base_p99:g} ms"
+        elif model == "open" and step["throughput"] < MIN_OPEN_LOOP_SHARE * step["level"]:
+            reason = f"throughput {step['throughput']:.1f}/s is below the arrival rate"
+        elif model == "closed" and index > 0 and (
+            step["throughput"] < (1 + MIN_CLOSED_LOOP_GAIN) * steps[index - 1]["throughput"]
+        ):
+            reason = "throughput stopped growing with the number of users"
+        if reason is not None:
+            return {"level": step["level"], "reason": reason}
+    return None
+
+
+async def _sweep(
+    address: str, model: str, levels: Sequence[float], mix: Mix, warmup: float,
+    duration: float, think: float, clients: int, max_in_flight: int, seed: int,
+    full_sweep: bool, on_step: StepCallback,
+) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    steps: List[Dict[str, Any]] = []
+    for level in levels:
+        if model == "closed":
+            samples, dropped = await _closed_loop(
+                address, mix, int(level), warmup, duration, think, rng
+            )
+        else:
+            samples, dropped = await _open_loop(
+                address, mix, level, warmup, duration, clients, max_in_flight, rng
+            )
+        steps.append(summarize(level, samples, dropped, duration))
+        on_step(steps[-1])
+        if not full_sweep and saturation(steps, model) is not None:
+            break
+    return steps
+
+
+def run(
+    address: str,
+    model: str = "closed",
+    levels: Sequence[float] = (1, 2, 4, 8, 16),
+    mix: Optional[Mix] = None,
+    warmup: float = 1.0,
+    duration: float = 5.0,
+    think: float = 0.0,
+    clients: int = DEFAULT_CLIENTS,
+    max_in_flight: int = 1000,
+    seed: int = 0,
+    full_sweep: bool = False,
+    on_step: Optional[StepCallback] = None,
+) -> Dict[str, Any]:
+    """
+    Sweeps the server at 'address' ("host:port") over 'levels' and
+    returns the report: per-step results under "steps", the first
+    saturated level under "saturation", and the level before it under
+    "sustained". The sweep stops at saturation unless 'full_sweep'.
+    """
+    if model not in ("closed", "open"):
+        raise ValueError(f"unknown arrival model: '{model}'")
+    mix = mix or DEFAULT_MIX
+    steps = asyncio.run(_sweep(
+        address, model, levels, mix, warmup, duration, think, clients,
+        max_in_flight, seed, full_sweep, on_step or (lambda step: None),
+    ))
+
+    saturated = saturation(steps, model)
+    last_good = len(steps) if saturated is None else next(
+        index for index, step in enumerate(steps) if step["level"] == saturated["level"]
+    )
+    sustained = steps[last_good - 1] if last_good > 0 else None
+    return {
+        "target": address,
+        "model": model,
+        "levels": list(levels),
+        "warmup": warmup,
+        "duration": duration,
+        "think": think,
+        "seed": seed,
+        "cpu_count": os.cpu_count(),
+        "mix": [{"weight": weight, "request": request} for weight, request in mix],
+        "steps": steps,
+        "saturation": saturated,
+        "sustained": {
+            "level": sustained["level"],
+            "throughput": sustained["throughput"],
+            "p99_ms": sustained["latency_ms"]["p99"],
+        } if sustained is not None else None,
+    }
@@ -0,0 +1,695 @@
+"""
+Command-line runner for offline verification.
+
+Calls CheckVectorSpaceUseCase directly (no HTTP), e.g.:
+
+    core-studies check R3_STANDARD --samples 1e6 --workers 8 --seed 42 --format json
+
+With --subspace the names are subset recipes and only the three
+subspace conditions are checked. With --exact axioms are verified
+symbolically where possible and sampled only otherwise. With --report
+every sample is measured and residual statistics are listed per axiom;
+--export FILE streams every sample and its outcome to an Arrow/Parquet
+file and --replay FILE measures those exact samples again.
+With --store PATH sampled runs are recorded in a SQLite result store,
+and counterexamples found before are replayed ahead of sampling; add
+--incremental to re-run only axioms whose checker or adapters changed.
+With --budget SECONDS a plain check draws as many samples as fit in
+that time instead of --samples, and lists how many each axiom got.
+
+    core-studies worker 127.0.0.1:7001
+    core-studies check R3_STANDARD --samples 1e7 --nodes 127.0.0.1:7001,unix:/tmp/w2.sock
+
+runs worker processes and spreads a check's samples over them (see
+`distributed`); --shards sets how many slices the samples are cut into.
+
+    core-studies search R3_RULE_X_ONLY_MULT --budget 2 --threshold 1e-9
+
+runs an adaptive counterexample search for a fixed time budget.
+
+    core-studies loadtest --model open --levels 50,100,200 --output load.json
+
+drives the HTTP API over local sockets at increasing load and reports
+its throughput/latency curve and saturation point (see `loadtest`).
+
+Exit code: 0 if every recipe passes, 1 if any does not,
+2 on usage errors (unknown recipe, bad arguments).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from ...application.checkers.base import CHUNK_SIZE, TOLERANCE
+from ...application.ports.counterexample_corpus import ICounterexampleCorpusPort
+from ...application.ports.result_store import IResultStorePort
+from ...application.ports.verdict_cache import IVerdictCachePort
+from ...containers import DependencyContainer
+
+if TYPE_CHECKING:
+    # Modules only some commands and options need are imported where
+    # they are used, so that `check` starts in tens of milliseconds.
+    from ...application.use_cases.check_vector_space import ProgressCallback
+    from . import distributed
+
+EXIT_OK = 0
+EXIT_NOT_A_VECTOR_SPACE = 1
+EXIT_USAGE = 2
+
+
+def _execute(
+    container: DependencyContainer,
+    space_name: str,
+    num_samples: int,
+    subspace: bool,
+    exact: bool = False,
+    on_progress: Optional[ProgressCallback] = None,
+    report: bool = False,
+    tolerance: float = TOLERANCE,
+    seed: Optional[int] = None,
+    incremental: bool = False,
+    export: Optional[str] = None,
+    replay: Optional[str] = None,
+    budget: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the right use case and returns its result as {"passed", "failures"}.
+    Plain checks given a 'seed' are recorded if the container has a
+    result store, and given a 'budget' run for that many seconds.
+    Reports can 'export' their samples to a file and 'replay' the
+    samples of a previous export.
+    """
+    if report:
+        from ...infrastructure.adapters.providers.arrow_replay_element_provider import (
+            ArrowReplayElementProvider,
+            exported_axioms,
+        )
+        from ...infrastructure.export.arrow_sample_exporter import ArrowSampleExporter
+
+        space = container.provide_space(space_name)
+        providers = (
+            {
+                axiom: ArrowReplayElementProvider(replay, space.element_type, axiom)
+                for axiom in exported_axioms(replay)
+            }
+            if replay else None
+        )
+        sink = ArrowSampleExporter(export.format(space=space_name)) if export else None
+        try:
+            result = container.provide_report_use_case(num_samples).execute(
+                space, tolerance=tolerance, on_progress=on_progress,
+                sink=sink, element_providers=providers,
+            )
+        finally:
+            if sink is not None:
+                sink.close()
+        return {
+            "passed": result["is_vector_space"],
+            "failures": result["failures"],
+            "axioms": result["axioms"],
+        }
+
+    if exact:
+        result = container.provide_exact_use_case(num_samples).execute(
+            container.provide_space(space_name), on_progress=on_progress
+        )
+        return {
+            "passed": result["is_vector_space"],
+            "failures": result["failures"],
+            "methods": result["methods"],
+        }
+
+    if subspace:
+        result = container.provide_subspace_use_case(num_samples).execute(
+            container.provide_subspace(space_name), on_progress=on_progress
+        )
+        return {"passed": result["is_subspace"], "failures": result["failures"]}
+
+    result = container.provide_vector_space_use_case(num_samples).execute(
+        container.provide_space(space_name), on_progress=on_progress,
+        recipe=space_name if seed is not None else None, seed=seed,
+        incremental=incremental, time_budget=budget,
+    )
+    return {
+        "passed": result["is_vector_space"],
+        "failures": result["failures"],
+        **({"axioms": result["axioms"]} if "axioms" in result else {}),
+        **({"reused": result["reused"]} if "reused" in result else {}),
+        **({"unverified": result["unverified"]} if "unverified" in result else {}),
+    }
+
+
+def _run_shard(
+    space_name: str, num_samples: int, seed: int, subspace: bool, chunk_size: int = CHUNK_SIZE
+) -> Dict[str, Any]:
+    """Runs one slice of the sample budget. Executed inside a worker process."""
+    random.seed(seed)
+    return _execute(DependencyContainer(chunk_size=chunk_size), space_name, num_samples, subspace)
+
+
+def _run_report_shard(
+    space_name: str,
+    num_samples: int,
+    seed: int,
+    chunk_size: int,
+    buffer: str,
+    offset: int,
+    total: int,
+) -> None:
+    """
+    Measures one slice of a report's samples inside a worker process and
+    writes the residuals into the shared buffer 'buffer' instead of
+    sending them back: axiom k's residuals of this slice go to doubles
+    [k * total + offset, k * total + offset + num_samples).
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    random.seed(seed)
+    container = DependencyContainer(chunk_size=chunk_size)
+    use_case = container.provide_report_use_case(num_samples)
+    space = container.provide_space(space_name)
+
+    shared = SharedMemory(name=buffer)
+    view = shared.buf.cast("d")
+    try:
+        for index, axiom in enumerate(use_case.sampled_axioms):
+            start = index * total + offset
+            view[start:start + num_samples] = use_case.residuals(space, axiom)
+    finally:
+        view.release()
+        shared.close()
+
+
+def _sharded_report(
+    space_name: str,
+    num_samples: int,
+    workers: int,
+    seed: int,
+    tolerance: float,
+    chunk_size: int,
+    on_progress: ProgressCallback,
+) -> Dict[str, Any]:
+    """
+    Runs a report over 'workers' processes. The residuals of every
+    sampled axiom are written by the workers into one shared-memory
+    buffer of doubles (axiom-major, 8 bytes per sample); only each
+    slice's (buffer, offset, length, seed) crosses the process pipe.
+    The statistics are then computed over the whole buffer in place.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+    container = DependencyContainer(chunk_size=chunk_size)
+    use_case = container.provide_report_use_case(num_samples)
+    axioms = use_case.sampled_axioms
+    sizes = _split(num_samples, workers)
+    offsets = [sum(sizes[:index]) for index in range(len(sizes))]
+
+    shared = SharedMemory(create=True, size=max(len(axioms) * num_samples, 1) * 8)
+    view = shared.buf.cast("d")
+    residuals = {
+        axiom: view[index * num_samples:(index + 1) * num_samples]
+        for index, axiom in enumerate(axioms)
+    }
+    try:
+        with ProcessPoolExecutor(max_workers=len(sizes)) as pool:
+            futures = [
+                pool.submit(
+                    _run_report_shard, space_name, size, seed + index, chunk_size,
+                    shared.name, offset, num_samples,
+                )
+                for index, (size, offset) in enumerate(zip(sizes, offsets))
+            ]
+            for future in futures:
+                future.result()
+        result = use_case.execute(
+            container.provide_space(space_name), tolerance=tolerance,
+            on_progress=on_progress, residuals=residuals,
+        )
+    finally:
+        for values in residuals.values():
+            values.release()
+        view.release()
+        shared.close()
+        shared.unlink()
+
+    return {
+        "passed": result["is_vector_space"],
+        "failures": result["failures"],
+        "axioms": result["axioms"],
+    }
+
+
+def _run_remote_shard(shard: distributed.Shard, on_progress: ProgressCallback) -> Dict[str, Any]:
+    """Runs one shard sent by a coordinator. Executed inside a worker node."""
+    random.seed(shard["seed"])
+    return _execute(
+        DependencyContainer(chunk_size=shard["chunk_size"]),
+        shard["space"], shard["samples"], shard["subspace"], on_progress=on_progress,
+    )
+
+
+def _split(total: int, parts: int) -> List[int]:
+    """Splits 'total' samples into at most 'parts' non-empty shards."""
+    parts = max(1, min(parts, total))
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+def _merge(shards: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combines shard results, keeping the first failure reported per axiom."""
+    failures: Dict[str, Dict[str, str]] = {}
+    for shard in shards:
+        for failure in shard["failures"]:
+            failures.setdefault(failure["axiom"], failure)
+    return {"passed": not failures, "failures": list(failures.values())}
+
+
+def _progress(quiet: bool, message: str) -> None:
+    if not quiet:
+        print(message, file=sys.stderr, flush=True)
+
+
+def check_space(
+    space_name: str,
+    num_samples: int,
+    workers: int,
+    seed: int,
+    subspace: bool = False,
+    quiet: bool = False,
+    exact: bool = False,
+    report: bool = False,
+    tolerance: float = TOLERANCE,
+    store: Optional[IResultStorePort] = None,
+    corpus: Optional[ICounterexampleCorpusPort] = None,
+    verdict_cache: Optional[IVerdictCachePort] = None,
+    incremental: bool = False,
+    export: Optional[str] = None,
+    replay: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+    budget: Optional[float] = None,
+    nodes: Sequence[str] = (),
+    shards: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Checks one recipe with 'num_samples' samples per axiom, or as many
+    as fit in 'budget' seconds, spread over 'workers' processes
+    (in-process when workers == 1 or exact, since symbolic checks take
+    milliseconds, for reports that export or replay samples, and for
+    incremental and budgeted checks; sharded reports gather their
+    residuals in shared memory, see `_sharded_report`), or over the
+    worker 'nodes' in 'shards' slices (default: four per node). Plain
+    checks are recorded in 'store' when one is given; in-process ones
+    also replay and extend the counterexample 'corpus', and with
+    'incremental' reuse unchanged axioms' verdicts from 'verdict_cache'.
+    """
+    from . import distributed
+
+    started = time.perf_counter()
+    sharded_report = report and workers > 1 and not (export or replay)
+    in_process = (
+        workers <= 1 or exact or (report and not sharded_report)
+        or incremental or budget is not None
+    )
+
+    if nodes:
+        sizes = _split(num_samples, shards or 4 * len(nodes))
+        finished = [0]
+
+        def on_event(node: str, event: Dict[str, Any]) -> None:
+            if event["event"] == "result":
+                finished[0] += 1
+                _progress(quiet, f"[{space_name}] shard {finished[0]}/{len(sizes)} done on {node}")
+
+        result = _merge(distributed.coordinate(
+            nodes, distributed.plan_shards(space_name, sizes, seed, subspace, chunk_size), on_event
+        ))
+    elif sharded_report:
+        result = _sharded_report(
+            space_name, num_samples, workers, seed, tolerance, chunk_size,
+            on_progress=lambda axiom, done, total: _progress(
+                quiet, f"[{space_name}] {done}/{total} {axiom}"
+            ),
+        )
+    elif in_process:
+        container = DependencyContainer(
+            result_store=store, corpus=corpus, verdict_cache=verdict_cache,
+            chunk_size=chunk_size,
+        )
+        random.seed(seed)
+        result = _execute(
+            container, space_name, num_samples, subspace, exact,
+            on_progress=lambda axiom, done, total: _progress(
+                quiet, f"[{space_name}] {done}/{total} {axiom}"
+            ),
+            report=report,
+            tolerance=tolerance,
+            seed=seed,
+            incremental=incremental,
+            export=export,
+            replay=replay,
+            budget=budget,
+        )
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        sizes = _split(num_samples, workers)
+        shards: List[Optional[Dict[str, Any]]] = [None] * len(sizes)
+        with ProcessPoolExecutor(max_workers=len(sizes)) as pool:
+            futures = {
+                pool.submit(_run_shard, space_name, size, seed + index, subspace, chunk_size): index
+                for index, size in enumerate(sizes)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                shards[futures[future]] = future.result()
+                _progress(quiet, f"[{space_name}] shard {done}/{len(sizes)} done")
+        result = _merge([shard for shard in shards if shard is not None])
+
+    if (nodes or not in_process) and not sharded_report and store is not None and not subspace:
+        from ...application.use_cases.run_history import build_run_record
+
+        container = DependencyContainer()
+        store.save_run(build_run_record(
+            space_name,
+            container.provide_space(space_name),
+            {"failures": result["failures"]},
+            container.provide_vector_space_use_case().axiom_names,
+            seconds=time.perf_counter() - started,
+            seed=seed,
+            samples=num_samples,
+        ))
+
+    verdict = "is_subspace" if subspace else "is_vector_space"
+    return {
+        "space": space_name,
+        verdict: result["passed"],
+        "failures": result["failures"],
+        **({"methods": result["methods"]} if "methods" in result else {}),
+        **({"axioms": result["axioms"]} if "axioms" in result else {}),
+        **({"reused": result["reused"]} if "reused" in result else {}),
+        **({"unverified": result["unverified"]} if "unverified" in result else {}),
+        "samples": num_samples if budget is None else None,
+        **({"budget": budget} if budget is not None else {}),
+        "seed": seed,
+        "seconds": round(time.perf_counter() - started, 6),
+    }
+
+
+def search_space(
+    space_name: str,
+    budget: float,
+    threshold: float,
+    seed: int,
+    quiet: bool = False,
+) -> Dict[str, Any]:
+    """
+    Searches one recipe adaptively for counterexamples for 'budget' seconds.
+    """
+    started = time.perf_counter()
+    container = DependencyContainer()
+    random.seed(seed)
+    result = container.provide_search_use_case().execute(
+        container.provide_space(space_name),
+        time_budget=budget,
+        residual_threshold=threshold,
+        on_progress=lambda axiom, done, total: _progress(
+            quiet, f"[{space_name}] {done}/{total} {axiom}"
+        ),
+    )
+    return {
+        "space": space_name,
+        **result,
+        "budget": budget,
+        "seed": seed,
+        "seconds": round(time.perf_counter() - started, 6),
+    }
+
+
+def _format_text(results: Sequence[Dict[str, Any]]) -> str:
+    lines: List[str] = []
+    for result in results:
+        kind = "subspace" if "is_subspace" in result else "vector space"
+        if result.get("unverified") and not result["failures"]:
+            verdict = f"inconclusive ({len(result['unverified'])} axiom(s) got no sample in time)"
+        else:
+            verdict = kind if _passed(result) else f"NOT a {kind}"
+        if result.get("samples") is not None:
+            effort = f"{result['samples']} samples/axiom"
+        else:
+            effort = f"{result['budget']}s " + ("budget" if "samples" in result else "search")
+        lines.append(
+            f"{result['space']}: {verdict} "
+            f"({effort}, seed {result['seed']}, {result['seconds']}s)"
+        )
+        for failure in result["failures"]:
+            lines.append(f"  - {failure['axiom']}: {failure['reason']}")
+        if result.get("reused"):
+            lines.append(f"  ({len(result['reused'])} unchanged axiom(s) reused from cache)")
+        for stats in result.get("axioms", []):
+            if "p99" in stats:
+                lines.append(
+                    f"  {stats['axiom']}: max={stats['max']} mean={stats['mean']} "
+                    f"p99={stats['p99']} over_tolerance={stats['over_tolerance']}/{stats['samples']}"
+                )
+            elif "failure_rate_bound" in stats and stats["samples"] is not None:
+                bound = stats["failure_rate_bound"]
+                lines.append(
+                    f"  {stats['axiom']}: {stats['samples']} samples in {stats['seconds']:.3f}s"
+                    + (f", failure rate < {bound:.2g} (95%)" if bound is not None else "")
+                )
+    return "\n".join(lines)
+
+
+def _passed(result: Dict[str, Any]) -> bool:
+    return result.get("is_vector_space", result.get("is_subspace", False))
+
+
+def _sample_count(value: str) -> int:
+    """Accepts plain or scientific notation ("1000", "1e6")."""
+    try:
+        count = int(float(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sample count: '{value}'")
+    if count < 1:
+        raise argparse.ArgumentTypeError("sample count must be at least 1")
+    return count
+
+
+def _nodes(value: str) -> List[str]:
+    from . import distributed
+
+    return distributed.parse_nodes(value)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="core-studies",
+        description="Verify vector space axioms without the HTTP API.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    check = commands.add_parser("check", help="Check one or more space recipes.")
+    check.add_argument("spaces", nargs="+", metavar="SPACE", help="Recipe name(s), e.g. R3_STANDARD.")
+    check.add_argument("--samples", type=_sample_count, default=1000, help="Samples per axiom (default: 1000).")
+    check.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1).")
+    check.add_argument("--chunk-size", type=_sample_count, default=CHUNK_SIZE, help=f"Samples drawn at a time; bounds memory (default: {CHUNK_SIZE}).")
+    check.add_argument("--seed", type=int, default=None, help="Random seed (default: random, reported in output).")
+    check.add_argument("--subspace", action="store_true", help="Names are subset recipes; run the subspace test.")
+    check.add_argument("--exact", action="store_true", help="Verify symbolically where possible; sample the rest.")
+    check.add_argument("--report", action="store_true", help="Measure every sample and list residual statistics per axiom.")
+    check.add_argument("--tolerance", type=float, default=TOLERANCE, help="Residual that counts as a failure in --report (default: 1e-9).")
+    check.add_argument("--export", metavar="FILE", default=None, help="With --report, stream samples and outcomes to FILE (.arrow or .parquet; '{space}' is replaced by the recipe).")
+    check.add_argument("--replay", metavar="FILE", default=None, help="With --report, measure the samples exported to FILE instead of drawing new ones.")
+    check.add_argument("--store", metavar="PATH", default=None, help="Record runs in this SQLite result store.")
+    check.add_argument("--incremental", action="store_true", help="With --store, re-run only axioms whose code changed.")
+    check.add_argument("--budget", type=float, default=None, metavar="SECONDS", help="Sample for this long instead of --samples (plain checks only).")
+    check.add_argument("--nodes", type=_nodes, default=[], metavar="ADDRESS[,ADDRESS...]", help="Spread the samples over these worker nodes (host:port or unix:/path).")
+    check.add_argument("--shards", type=int, default=None, help="With --nodes, slices to cut the samples into (default: 4 per node).")
+    check.add_argument("--format", choices=("text", "json"), default="text")
+    check.add_argument("--quiet", action="store_true", help="Suppress progress output on stderr.")
+
+    search = commands.add_parser("search", help="Adaptively search space recipes for counterexamples.")
+    search.add_argument("spaces", nargs="+", metavar="SPACE", help="Recipe name(s), e.g. R3_STANDARD.")
+    search.add_argument("--budget", type=float, default=1.0, help="Seconds per recipe (default: 1).")
+    search.add_argument("--threshold", type=float, default=1e-9, help="Residual that counts as a failure (default: 1e-9).")
+    search.add_argument("--seed", type=int, default=None, help="Random seed (default: random, reported in output).")
+    search.add_argument("--format", choices=("text", "json"), default="text")
+    search.add_argument("--quiet", action="store_true", help="Suppress progress output on stderr.")
+
+    worker = commands.add_parser("worker", help="Serve check shards to a coordinator (check --nodes).")
+    worker.add_argument("address", metavar="ADDRESS", help="Where to listen: host:port or unix:/path.")
+    worker.add_argument("--quiet", action="store_true", help="Suppress the startup message on stderr.")
+
+    load = commands.add_parser("loadtest", help="Measure the HTTP API's throughput and latency under load.")
+    load.add_argument("--target", metavar="HOST:PORT", default=None, help="A running server (default: start one locally with uvicorn).")
+    load.add_argument("--model", choices=("closed", "open"), default="closed", help="Closed loop (levels are users) or open loop (levels are requests per second).")
+    load.add_argument("--levels", default=None, help="Comma-separated load levels (default: 1,2,4,8,16 users or 25,50,100,200,400 per second).")
+    load.add_argument("--mix", default=None, help="Weighted requests, 'WEIGHT:[METHOD ]PATH,...' (default: a mix of check recipes and budgets).")
+    load.add_argument("--duration", type=float, default=5.0, help="Measured seconds per level (default: 5).")
+    load.add_argument("--warmup", type=float, default=1.0, help="Unmeasured seconds before each level (default: 1).")
+    load.add_argument("--think", type=float, default=0.0, help="Closed loop: seconds each user waits between requests.")
+    load.add_argument("--clients", type=int, default=None, help="Open loop: distinct API keys requests are sent with (default: 64).")
+    load.add_argument("--max-in-flight", type=int, default=1000, help="Open loop: requests in flight beyond which arrivals are dropped.")
+    load.add_argument("--full-sweep", action="store_true", help="Keep going past the saturation point.")
+    load.add_argument("--server-workers", type=int, default=1, help="uvicorn worker processes of the local server.")
+    load.add_argument("--server-env", action="append", default=[], metavar="KEY=VALUE", help="Environment of the local server, e.g. CORE_STUDIES_WORK_RATE=0 (repeatable).")
+    load.add_argument("--seed", type=int, default=None, help="Random seed (default: random, reported in output).")
+    load.add_argument("--output", metavar="FILE", default=None, help="Write the JSON report here instead of stdout.")
+    load.add_argument("--quiet", action="store_true", help="Suppress per-level progress on stderr.")
+
+    return parser
+
+
+def run_loadtest(args: argparse.Namespace) -> int:
+    """Runs the `loadtest` command; returns its exit code."""
+    from . import loadtest
+
+    clients = args.clients if args.clients is not None else loadtest.DEFAULT_CLIENTS
+    try:
+        default_levels = "1,2,4,8,16" if args.model == "closed" else "25,50,100,200,400"
+        levels = loadtest.parse_levels(args.levels or default_levels)
+        mix = loadtest.parse_mix(args.mix) if args.mix else None
+        server_env = dict(item.split("=", 1) for item in args.server_env)
+    except ValueError as e:
+        print(f"Invalid load test arguments: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    unit = "users" if args.model == "closed" else "/s"
+
+    def on_step(step: Dict[str, Any]) -> None:
+        _progress(args.quiet, (
+            f"[{step['level']:g} {unit}] {step['throughput']:.1f} ok/s, "
+            f"p99 {step['latency_ms']['p99']} ms, statuses {step['statuses']}"
+        ))
+
+    def sweep(address: str) -> Dict[str, Any]:
+        return loadtest.run(
+            address, args.model, levels, mix, args.warmup, args.duration, args.think,
+            clients, args.max_in_flight, seed, args.full_sweep, on_step,
+        )
+
+    try:
+        if args.target:
+            report = sweep(args.target)
+        else:
+            api_keys = loadtest.client_keys(args.model, levels, clients)
+            with loadtest.local_server(args.server_workers, server_env, api_keys) as address:
+                _progress(args.quiet, f"server ready on {address}")
+                report = sweep(address)
+    except loadtest.LoadTestError as e:
+        print(f"Load test failed: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as stream:
+            stream.write(output + "\n")
+    else:
+        print(output)
+    return EXIT_OK
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "worker":
+        from . import distributed
+
+        try:
+            distributed.serve(
+                args.address, _run_remote_shard,
+                ready=lambda: _progress(args.quiet, f"worker listening on {args.address}"),
+            )
+        except KeyboardInterrupt:
+            pass
+        return EXIT_OK
+    if args.command == "loadtest":
+        return run_loadtest(args)
+
+    subspace = getattr(args, "subspace", False)
+    exact = getattr(args, "exact", False)
+    report = getattr(args, "report", False)
+
+    container = DependencyContainer()
+    if exact and subspace:
+        print("--exact cannot be combined with --subspace", file=sys.stderr)
+        return EXIT_USAGE
+    if report and (exact or subspace):
+        print("--report cannot be combined with --exact or --subspace", file=sys.stderr)
+        return EXIT_USAGE
+    if (getattr(args, "export", None) or getattr(args, "replay", None)) and not report:
+        print("--export and --replay need --report", file=sys.stderr)
+        return EXIT_USAGE
+    if getattr(args, "incremental", False) and (not args.store or exact or subspace or report):
+        print("--incremental needs --store and a plain check", file=sys.stderr)
+        return EXIT_USAGE
+    if args.command == "check" and args.budget is not None and (exact or subspace or report):
+        print("--budget cannot be combined with --exact, --subspace or --report", file=sys.stderr)
+        return EXIT_USAGE
+    if args.command in ("check", "search") and args.budget is not None and args.budget <= 0:
+        print("--budget must be positive", file=sys.stderr)
+        return EXIT_USAGE
+    if getattr(args, "nodes", None) and (exact or report or args.incremental or args.budget is not None):
+        print("--nodes cannot be combined with --exact, --report, --incremental or --budget", file=sys.stderr)
+        return EXIT_USAGE
+
+    known = container.subspace_names if subspace else container.space_names
+    unknown = [name for name in args.spaces if name not in known]
+    if unknown:
+        print(
+            f"Unknown space recipe(s): {', '.join(unknown)}. Known: {', '.join(known)}",
+            file=sys.stderr,
+        )
+        return EXIT_USAGE
+
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    if args.command == "search":
+        results = [
+            search_space(name, args.budget, args.threshold, seed, args.quiet)
+            for name in args.spaces
+        ]
+    else:
+        from . import distributed
+        from ...infrastructure.persistence.sqlite_counterexample_corpus import SQLiteCounterexampleCorpus
+        from ...infrastructure.persistence.sqlite_result_store import SQLiteResultStore
+        from ...infrastructure.persistence.sqlite_verdict_cache import SQLiteVerdictCache
+
+        store = SQLiteResultStore(args.store) if args.store else None
+        corpus = SQLiteCounterexampleCorpus(args.store) if args.store else None
+        verdict_cache = SQLiteVerdictCache(args.store) if args.store else None
+        try:
+            results = [
+                check_space(
+                    name, args.samples, args.workers, seed, subspace, args.quiet, exact,
+                    report, args.tolerance, store, corpus, verdict_cache, args.incremental,
+                    args.export, args.replay, args.chunk_size, args.budget,
+                    args.nodes, args.shards,
+                )
+                for name in args.spaces
+            ]
+        except RuntimeError as e:
+            # e.g. --export or --replay without pyarrow installed.
+            print(str(e), file=sys.stderr)
+            return EXIT_USAGE
+        except distributed.WorkerError as e:
+            print(f"Distributed check failed: {e}", file=sys.stderr)
+            return EXIT_USAGE
+
+    if args.format == "json":
+        print(json.dumps(results, indent=2))
+    else:
+        print(_format_text(results))
+
+    if all(_passed(result) for result in results):
+        return EXIT_OK
+    return EXIT_NOT_A_VECTOR_SPACE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
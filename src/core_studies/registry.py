@@ -0,0 +1,271 @@
+import warnings
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Dict, Any, Iterator, List, Tuple
+
+# Entry-point group third-party packages use to register their plugins.
+# Each entry point must reference a callable taking the PluginRegistry:
+#
+#     [tool.poetry.plugins."core_studies.plugins"]
+#     fast_r3 = "fast_r3.plugin:register"
+PLUGIN_GROUP = "core_studies.plugins"
+
+
+@dataclass(frozen=True)
+class Registration:
+    """
+    One implementation registered in the PluginRegistry.
+
+    Attributes:
+        name: Unique name of this implementation.
+        target: Import path in the form "package.module:Attribute".
+        provides: The name recipes use to ask for it. Several
+                  implementations may provide the same name.
+        supports_batch: Whether the implementation works on batches.
+        priority: Higher wins among implementations of the same name.
+    """
+    name: str
+    target: str
+    provides: str
+    supports_batch: bool = False
+    priority: int = 0
+
+    @property
+    def rank(self) -> Tuple[int, bool]:
+        return (self.priority, self.supports_batch)
+
+
+class PluginRegistry:
+    """
+    Catalogue of adapters, element types, checkers and space recipes.
+
+    Nothing is imported when something is registered; the module is
+    imported the first time the name is resolved, and the result is
+    cached. When several implementations provide the same name, the
+    highest-ranked one that imports successfully is used, so a plugin
+    can ship a faster (e.g. batch/compiled) drop-in for a built-in
+    adapter just by registering it with a higher priority.
+    """
+
+    def __init__(self):
+        self._registrations: Dict[str, List[Registration]] = {}
+        self._checkers: Dict[str, Tuple[str, int, str]] = {}
+        self._recipes: Dict[str, Dict[str, str]] = {}
+        self._subspaces: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        self._linear_maps: Dict[str, Tuple[str, str, str]] = {}
+        self._inner_product_spaces: Dict[str, Tuple[str, str]] = {}
+        self._normed_spaces: Dict[str, Tuple[str, str]] = {}
+        self._resolved: Dict[str, Any] = {}
+
+    def register(
+        self,
+        name: str,
+        target: str,
+        provides: str | None = None,
+        supports_batch: bool = False,
+        priority: int = 0,
+    ) -> None:
+        """
+        Registers an adapter or element type implementation.
+
+        Args:
+            name: Unique name of the implementation.
+            target: Import path in the form "package.module:Attribute".
+            provides: Name recipes refer to (defaults to 'name').
+            supports_batch: Metadata flag, preferred on equal priority.
+            priority: Higher priorities are preferred.
+        """
+        registration = Registration(
+            name=name,
+            target=target,
+            provides=provides or name,
+            supports_batch=supports_batch,
+            priority=priority,
+        )
+        candidates = [
+            r for r in self._registrations.get(registration.provides, [])
+            if r.name != name
+        ]
+        candidates.append(registration)
+        candidates.sort(key=lambda r: r.rank, reverse=True)
+        self._registrations[registration.provides] = candidates
+        self._resolved.pop(registration.provides, None)
+
+    def register_checker(
+        self, name: str, target: str, order: int, family: str = "vector_space"
+    ) -> None:
+        """
+        Registers an axiom checker. Checkers of a 'family' (e.g.
+        "vector_space", "subspace") run in ascending 'order'.
+        """
+        self._checkers[name] = (family, order, target)
+        self._resolved.pop(name, None)
+
+    def register_recipe(self, name: str, parts: Dict[str, str]) -> None:
+        """
+        Registers a space recipe: VectorSpace constructor argument -> name.
+        """
+        self._recipes[name] = dict(parts)
+
+    def register_subspace(self, name: str, parent: str, parts: Dict[str, str]) -> None:
+        """
+        Registers a subset recipe of the 'parent' space recipe. 'parts'
+        names its "validator" and its "element_provider".
+        """
+        self._subspaces[name] = (parent, dict(parts))
+
+    def register_linear_map(self, name: str, source: str, target: str, mapping: str) -> None:
+        """
+        Registers a map recipe: a 'mapping' adapter name from the
+        'source' space recipe to the 'target' space recipe.
+        """
+        self._linear_maps[name] = (source, target, mapping)
+
+    def register_inner_product_space(self, name: str, parent: str, inner_product: str) -> None:
+        """
+        Registers an inner product space recipe: the 'parent' space
+        recipe plus an 'inner_product' adapter name.
+        """
+        self._inner_product_spaces[name] = (parent, inner_product)
+
+    def register_normed_space(self, name: str, parent: str, norm: str) -> None:
+        """
+        Registers a normed space recipe: the 'parent' space recipe plus
+        a 'norm' adapter name.
+        """
+        self._normed_spaces[name] = (parent, norm)
+
+    def resolve(self, name: str) -> Any:
+        """
+        Returns the best available object provided under 'name',
+        importing its module on first use.
+
+        Raises:
+            KeyError: If nothing provides 'name'.
+            ImportError: If no candidate could be imported.
+        """
+        if name in self._resolved:
+            return self._resolved[name]
+
+        if name in self._checkers:
+            obj = _load(self._checkers[name][2])
+        elif name in self._registrations:
+            obj = self._load_best(name)
+        else:
+            raise KeyError(f"Nothing registered under '{name}'")
+
+        self._resolved[name] = obj
+        return obj
+
+    def implementations(self, name: str) -> List[Registration]:
+        """Returns every implementation of 'name', best first."""
+        return list(self._registrations.get(name, []))
+
+    def checker_names(self, family: str = "vector_space") -> List[str]:
+        """Returns the checker names of a family in run order."""
+        names = [name for name in self._checkers if self._checkers[name][0] == family]
+        return sorted(names, key=lambda name: self._checkers[name][1])
+
+    def recipe(self, name: str) -> Dict[str, str]:
+        """
+        Raises:
+            KeyError: If the recipe is unknown.
+        """
+        return self._recipes[name]
+
+    def recipe_names(self) -> List[str]:
+        return list(self._recipes)
+
+    def subspace(self, name: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Returns (parent recipe name, parts) of a subset recipe.
+
+        Raises:
+            KeyError: If the subset recipe is unknown.
+        """
+        return self._subspaces[name]
+
+    def subspace_names(self) -> List[str]:
+        return list(self._subspaces)
+
+    def linear_map(self, name: str) -> Tuple[str, str, str]:
+        """
+        Returns (source recipe, target recipe, mapping) of a map recipe.
+
+        Raises:
+            KeyError: If the map recipe is unknown.
+        """
+        return self._linear_maps[name]
+
+    def linear_map_names(self) -> List[str]:
+        return list(self._linear_maps)
+
+    def inner_product_space(self, name: str) -> Tuple[str, str]:
+        """
+        Returns (parent recipe name, inner product) of a recipe.
+
+        Raises:
+            KeyError: If the inner product space recipe is unknown.
+        """
+        return self._inner_product_spaces[name]
+
+    def inner_product_space_names(self) -> List[str]:
+        return list(self._inner_product_spaces)
+
+    def normed_space(self, name: str) -> Tuple[str, str]:
+        """
+        Returns (parent recipe name, norm) of a recipe.
+
+        Raises:
+            KeyError: If the normed space recipe is unknown.
+        """
+        return self._normed_spaces[name]
+
+    def normed_space_names(self) -> List[str]:
+        return list(self._normed_spaces)
+
+    def discover(self, group: str = PLUGIN_GROUP) -> None:
+        """
+        Loads every installed plugin in the entry-point 'group' and lets
+        it register itself. A broken plugin is skipped with a warning.
+        """
+        # Imported here: importlib.metadata alone costs tens of ms, which
+        # `import core_studies.containers` should not pay.
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=group):
+            try:
+                entry_point.load()(self)
+            except Exception as e:
+                warnings.warn(f"Skipping plugin '{entry_point.name}': {e}")
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._registrations or name in self._checkers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._registrations)
+
+    def _load_best(self, name: str) -> Any:
+        errors: List[str] = []
+        for registration in self._registrations[name]:
+            try:
+                return _load(registration.target)
+            except ImportError as e:
+                errors.append(f"{registration.name}: {e}")
+        raise ImportError(f"No importable implementation of '{name}' ({'; '.join(errors)})")
+
+
+def _load(target: str) -> Any:
+    """
+    Imports a "module:Attribute" target.
+
+    Raises:
+        ImportError: If the module cannot be imported or lacks the
+                     attribute, so callers can fall back either way.
+    """
+    module_path, _, attribute = target.partition(":")
+    module = import_module(module_path)
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        raise ImportError(f"module '{module_path}' has no attribute '{attribute}'") from None
@@ -0,0 +1,125 @@
+"""
+Coordinator/worker mode against workers served on localhost: results,
+retries, hung workers and stragglers.
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+
+from core_studies.interface.cli import distributed
+
+SHARD_SECONDS = 0.05
+
+
+def _free_address() -> str:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{sock.getsockname()[1]}"
+
+
+def _worker(run_shard) -> str:
+    """Serves 'run_shard' on a free localhost port until the tests end."""
+    address = _free_address()
+    ready = threading.Event()
+    threading.Thread(
+        target=distributed.serve, args=(address, run_shard, ready.set), daemon=True
+    ).start()
+    assert ready.wait(5)
+    return address
+
+
+def _run_shard(delay: float = SHARD_SECONDS):
+    def run(shard, on_progress):
+        time.sleep(delay)
+        on_progress("A1", 1, 1)
+        return {"failures": [], "seed": shard["seed"]}
+    return run
+
+
+def _shards(count: int):
+    return distributed.plan_shards("R3_STANDARD", [10] * count, 100, False, 10)
+
+
+def test_runs_every_shard_and_keeps_their_order():
+    nodes = [_worker(_run_shard()), _worker(_run_shard())]
+    events = []
+
+    results = distributed.coordinate(nodes, _shards(6), lambda node, event: events.append(event))
+
+    assert [result["seed"] for result in results] == list(range(100, 106))
+    assert sum(event["event"] == "progress" for event in events) == 6
+
+
+def test_retries_shards_whose_node_failed_or_is_unreachable():
+    failed = []
+
+    def crashing(shard, on_progress):
+        failed.append(shard["seed"])
+        raise RuntimeError("worker crashed")
+
+    nodes = [_free_address(), _worker(crashing), _worker(_run_shard())]
+    results = distributed.coordinate(nodes, _shards(6))
+
+    assert [result["seed"] for result in results] == list(range(100, 106))
+    # The crashing node is dropped after two failures in a row.
+    assert 1 <= len(failed) <= distributed.MAX_NODE_FAILURES
+
+
+def test_gives_up_on_a_shard_that_always_fails():
+    def broken(shard, on_progress):
+        raise RuntimeError("bad shard")
+
+    with pytest.raises(distributed.WorkerError):
+        distributed.coordinate([_worker(broken)], _shards(1))
+
+
+def test_a_silent_worker_times_out():
+    hung = _worker(_run_shard(delay=5.0))
+
+    started = time.perf_counter()
+    with pytest.raises(distributed.WorkerError):
+        distributed.run_on_node(hung, _shards(1)[0], read_timeout=0.2)
+    assert time.perf_counter() - started < 2.0
+
+
+def test_a_straggler_is_duplicated_on_an_idle_node():
+    slow = _worker(_run_shard(delay=5.0))
+    fast = _worker(_run_shard())
+
+    started = time.perf_counter()
+    results = distributed.coordinate([slow, fast], _shards(4))
+
+    assert [result["seed"] for result in results] == [100, 101, 102, 103]
+    assert time.perf_counter() - started < 2.0
+
+
+def _straggling_schedule() -> distributed._Schedule:
+    """One shard, running long past the median, taken by a second node."""
+    schedule = distributed._Schedule(1)
+    assert schedule.take() == 0
+    schedule.durations.append(0.001)
+    schedule.running[0] -= 1.0
+    assert schedule.take() == 0
+    return schedule
+
+
+def test_a_failed_copy_is_not_requeued_while_another_runs():
+    schedule = _straggling_schedule()
+
+    schedule.failed(0, "duplicate's node dropped")
+    assert schedule.waiting == [] and schedule.error is None
+
+    schedule.done(0, {"failures": []})
+    assert schedule.finished and schedule.results == [{"failures": []}]
+
+
+def test_a_shard_is_requeued_once_every_copy_failed():
+    schedule = _straggling_schedule()
+
+    schedule.failed(0, "first copy")
+    schedule.failed(0, "second copy")
+
+    assert schedule.waiting == [0]
@@ -0,0 +1,72 @@
+"""
+Import-time budget of the composition root and the CLI.
+
+Workers and short-lived CLI runs import `core_studies.containers` and
+`core_studies.interface.cli.main` before doing anything else, so both
+must stay cheap: no use case, adapter, web framework or subcommand-only
+module may be imported with them, and each import must fit
+IMPORT_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+# CLI startup should take tens of milliseconds; both imports measure
+# about 35-45 ms.
+IMPORT_BUDGET_MS = 50
+FORBIDDEN_PREFIXES = (
+    "core_studies.application.use_cases",
+    "core_studies.infrastructure",
+    "fastapi",
+    "numpy",
+    "importlib.metadata",
+)
+# Modules under test, with what else each must not import.
+MODULES = {
+    "core_studies.containers": FORBIDDEN_PREFIXES + ("core_studies.interface",),
+    "core_studies.interface.cli.main": FORBIDDEN_PREFIXES + (
+        "core_studies.interface.api",
+        "core_studies.interface.cli.distributed",
+        "core_studies.interface.cli.loadtest",
+        "asyncio",
+        "concurrent.futures",
+        "multiprocessing",
+        "urllib.request",
+    ),
+}
+
+
+def _import_times(module: str) -> dict:
+    """Cumulative import time in microseconds of every module imported."""
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_imports_no_heavy_modules(module):
+    imported = _import_times(module)
+    eager = sorted(name for name in imported if name.startswith(MODULES[module]))
+    assert not eager, f"imported eagerly: {', '.join(eager)}"
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_fits_budget(module):
+    # Best of three runs, to ignore a cold disk cache or a busy machine.
+    best = min(_import_times(module)[module] for _ in range(3))
+    assert best / 1000 <= IMPORT_BUDGET_MS, f"import took {best / 1000:.1f} ms"
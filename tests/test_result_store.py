@@ -0,0 +1,164 @@
+"""
+The SQLite result store and the run history built on it, on a
+temporary database file.
+"""
+
+import time
+
+import pytest
+
+from core_studies.application.use_cases.run_history import RunHistoryUseCase
+from core_studies.containers import DependencyContainer
+from core_studies.infrastructure.persistence.sqlite_result_store import SQLiteResultStore
+
+AXIOMS = [f"A{index}" for index in range(1, 11)]
+# Per run, with ten axioms each, including the commit.
+BUDGET_MS_PER_RUN = 1.0
+
+
+def _run(recipe="R3_STANDARD", failing=(), created_at=1000.0, seconds=0.5, recipe_hash="h1"):
+    return {
+        "recipe": recipe,
+        "recipe_hash": recipe_hash,
+        "seed": 7,
+        "samples": 1000,
+        "passed": not failing,
+        "seconds": seconds,
+        "created_at": created_at,
+        "axioms": [
+            {
+                "axiom": name,
+                "passed": name not in failing,
+                "seconds": seconds / len(AXIOMS),
+                "reason": f"{name} failed" if name in failing else None,
+            }
+            for name in AXIOMS
+        ],
+    }
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "results.sqlite3")
+
+
+@pytest.fixture
+def store(path):
+    store = SQLiteResultStore(path)
+    yield store
+    store.close()
+
+
+def test_records_and_reads_back_a_run(store):
+    run_id = store.save_run(_run(failing=("A8",)))
+
+    run = store.get_run(run_id)
+    assert run["id"] == run_id
+    assert (run["recipe"], run["seed"], run["samples"], run["passed"]) == ("R3_STANDARD", 7, 1000, False)
+    assert [axiom["axiom"] for axiom in run["axioms"]] == AXIOMS
+    assert [axiom["axiom"] for axiom in run["axioms"] if not axiom["passed"]] == ["A8"]
+    assert run["axioms"][7]["reason"] == "A8 failed"
+    assert store.get_run(run_id + 1) is None
+
+
+def test_history_is_newest_first_per_recipe(store):
+    old = store.save_run(_run(created_at=1.0))
+    new = store.save_run(_run(created_at=2.0))
+    store.save_run(_run(recipe="R3_RATIONAL", created_at=3.0))
+
+    assert [run["id"] for run in store.history("R3_STANDARD")] == [new, old]
+    assert [run["id"] for run in store.history("R3_STANDARD", limit=1)] == [new]
+    assert store.history("R3_UNKNOWN") == []
+
+
+def test_runs_survive_reopening_the_file(path):
+    store = SQLiteResultStore(path)
+    run_id = store.save_run(_run())
+    store.close()
+
+    reopened = SQLiteResultStore(path)
+    try:
+        assert reopened.get_run(run_id)["recipe"] == "R3_STANDARD"
+    finally:
+        reopened.close()
+
+
+def test_save_runs_inserts_a_batch_in_order(store):
+    ids = store.save_runs([_run(created_at=float(index)) for index in range(5)])
+
+    assert len(set(ids)) == 5
+    assert [store.get_run(run_id)["created_at"] for run_id in ids] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert all(len(store.get_run(run_id)["axioms"]) == len(AXIOMS) for run_id in ids)
+
+
+def test_batch_rolls_back_on_error(store):
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.save_run(_run())
+            store.save_run(_run())
+            raise RuntimeError("interrupted")
+
+    assert store.history("R3_STANDARD") == []
+
+
+def test_trend_summarises_runs_oldest_first(store):
+    ids = [
+        store.save_run(_run(failing=failing, created_at=float(index), seconds=seconds))
+        for index, (failing, seconds) in enumerate([((), 1.0), (("A8",), 2.0), (("A8", "A9"), 3.0)])
+    ]
+
+    trend = RunHistoryUseCase(store).trend("R3_STANDARD")
+
+    assert [run["id"] for run in trend["runs"]] == ids
+    assert [run["passed"] for run in trend["runs"]] == [True, False, False]
+    axioms = {stats["axiom"]: stats for stats in trend["axioms"]}
+    assert axioms["A8"]["failure_rate"] == pytest.approx(2 / 3)
+    assert axioms["A9"]["failure_rate"] == pytest.approx(1 / 3)
+    assert axioms["A1"]["failures"] == 0
+    assert axioms["A1"]["mean_seconds"] == pytest.approx(0.2)
+
+
+def test_diff_lists_regressions_fixes_and_timing(store):
+    base = store.save_run(_run(failing=("A1", "A2"), seconds=1.0))
+    head = store.save_run(_run(failing=("A2", "A3"), seconds=2.0, recipe_hash="h2"))
+
+    diff = RunHistoryUseCase(store).diff(base, head)
+
+    assert diff["regressed"] == [{"axiom": "A3", "reason": "A3 failed"}]
+    assert diff["fixed"] == ["A1"]
+    assert diff["still_failing"] == ["A2"]
+    assert diff["same_recipe"] is False
+    assert diff["seconds_delta"]["A1"] == pytest.approx(0.1)
+    with pytest.raises(ValueError):
+        RunHistoryUseCase(store).diff(base, head + 1)
+
+
+def test_checks_are_recorded_with_their_seed(store):
+    container = DependencyContainer(result_store=store)
+    use_case = container.provide_vector_space_use_case()
+
+    use_case.execute(container.provide_space("R3_RULE_X_ONLY_MULT"), recipe="R3_RULE_X_ONLY_MULT", seed=42)
+
+    [run] = store.history("R3_RULE_X_ONLY_MULT")
+    assert run["seed"] == 42
+    assert run["passed"] is False
+    assert [axiom["axiom"] for axiom in run["axioms"]] == use_case.axiom_names
+
+
+@pytest.mark.parametrize("batched", [True, False], ids=["save_runs", "save_run"])
+def test_recording_costs_under_a_millisecond_per_run(path, batched):
+    count = 2000 if batched else 200
+    best = float("inf")
+    # Best of three fresh files, to ignore a busy machine.
+    for attempt in range(3):
+        store = SQLiteResultStore(f"{path}.{attempt}")
+        runs = [_run(failing=("A8",) if index % 3 else (), created_at=float(index)) for index in range(count)]
+        started = time.perf_counter()
+        if batched:
+            store.save_runs(runs)
+        else:
+            for run in runs:
+                store.save_run(run)
+        best = min(best, (time.perf_counter() - started) / count * 1000)
+        store.close()
+    assert best < BUDGET_MS_PER_RUN, f"{best:.3f} ms per run"